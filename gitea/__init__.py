@@ -1,6 +1,11 @@
 __version__ = "0.11.2"
 
 from .gitea import Gitea
+from .asyncgitea import AsyncGitea
+from .cache import ResponseCache, ObjectCache, InternTable
+from .access import AccessMatrix
+from .codec import JsonCodec, get_codec
+from .batch import BatchItem, BatchReport
 
 from .exceptions import (
     GiteaException,
@@ -25,6 +30,15 @@ from .apiobject import (
     Tree,
     TreeContent,
 )
+from .asyncapiobject import (
+    AsyncUser,
+    AsyncOrganization,
+    AsyncTeam,
+    AsyncRepository,
+    AsyncIssue,
+    AsyncComment,
+    AsyncCommit,
+)
 
 __all__ = [
     "Gitea",
@@ -47,4 +61,20 @@ __all__ = [
     "MigrationServices",
     "Tree",
     "TreeContent",
+    "AsyncGitea",
+    "ResponseCache",
+    "ObjectCache",
+    "InternTable",
+    "AccessMatrix",
+    "JsonCodec",
+    "get_codec",
+    "BatchItem",
+    "BatchReport",
+    "AsyncUser",
+    "AsyncOrganization",
+    "AsyncTeam",
+    "AsyncRepository",
+    "AsyncIssue",
+    "AsyncComment",
+    "AsyncCommit",
 ]
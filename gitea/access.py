@@ -0,0 +1,52 @@
+from typing import Dict, List, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .apiobject import Organization, Repository, Team, User
+
+
+class AccessMatrix:
+    """Index of which users can access which repositories of an organization,
+    through a team or as collaborator.
+
+    Built by `Organization.get_access_matrix`, which requests the teams, their
+    repositories and members and the collaborators of every repository once.
+    Both directions are then answered from memory, see `get_users` and
+    `get_repositories`. Repositories and users can be given as objects or by
+    name.
+    """
+
+    def __init__(self, organization: "Organization"):
+        self.organization = organization
+        # repository name -> {username -> user}, users in order of appearance
+        self._users_by_repo: Dict[str, Dict[str, "User"]] = {}
+        # username -> {repository name -> repository}
+        self._repos_by_user: Dict[str, Dict[str, "Repository"]] = {}
+
+    def add_repository(self, repo: "Repository", collaborators: List["User"]):
+        self._users_by_repo.setdefault(repo.name, {})
+        for user in collaborators:
+            self._add(repo, user)
+
+    def add_team(self, team: "Team", repos: List["Repository"], members: List["User"]):
+        for repo in repos:
+            for user in members:
+                self._add(repo, user)
+
+    def _add(self, repo: "Repository", user: "User"):
+        self._users_by_repo.setdefault(repo.name, {}).setdefault(user.username, user)
+        self._repos_by_user.setdefault(user.username, {}).setdefault(repo.name, repo)
+
+    def get_users(self, repo: Union["Repository", str]) -> List["User"]:
+        """The users with access to a repository of the organization."""
+        name = repo if isinstance(repo, str) else repo.name
+        return list(self._users_by_repo.get(name, {}).values())
+
+    def get_repositories(self, user: Union["User", str]) -> List["Repository"]:
+        """The repositories of the organization a user can access."""
+        username = user if isinstance(user, str) else user.username
+        return list(self._repos_by_user.get(username, {}).values())
+
+    def has_access(self, user: Union["User", str], repo: Union["Repository", str]):
+        username = user if isinstance(user, str) else user.username
+        name = repo if isinstance(repo, str) else repo.name
+        return username in self._users_by_repo.get(name, {})
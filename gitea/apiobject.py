@@ -2,13 +2,41 @@ from __future__ import annotations
 
 import base64
 import logging
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Tuple, Dict, Sequence, Optional, Union, Set, TYPE_CHECKING
+from functools import lru_cache
+from math import nan
+from typing import (
+    List,
+    Tuple,
+    Dict,
+    Sequence,
+    Optional,
+    Union,
+    Set,
+    Iterator,
+    Iterable,
+    TYPE_CHECKING,
+)
 
+from .access import AccessMatrix
 from .baseapiobject import ReadonlyApiObject, ApiObject
+from .models import (
+    UserModel,
+    OrganizationModel,
+    RepositoryModel,
+    IssueModel,
+    CommitModel,
+    TeamModel,
+    BranchModel,
+    MilestoneModel,
+    CommentModel,
+)
 from .exceptions import (
     ConflictRequestException,
     NotFoundException,
+    NotFoundRequestException,
     AlreadyExistsRequestException,
     ApiValidationRequestException,
 )
@@ -17,13 +45,14 @@ if TYPE_CHECKING:
     from gitea import Gitea
 
 
-class Organization(ApiObject):
+class Organization(OrganizationModel):
     """see https://try.gitea.io/api/swagger#/organization/orgGetAll"""
 
     API_OBJECT = """/orgs/{name}"""  # <org>
     ORG_REPOS_REQUEST = """/orgs/%s/repos"""  # <org>
     ORG_TEAMS_REQUEST = """/orgs/%s/teams"""  # <org>
     ORG_TEAMS_CREATE = """/orgs/%s/teams"""  # <org>
+    ORG_TEAMS_SEARCH = """/orgs/%s/teams/search"""  # <org>
     ORG_GET_MEMBERS = """/orgs/%s/members"""  # <org>
     ORG_IS_MEMBER = """/orgs/%s/members/%s"""  # <org>, <username>
     ORG_HEATMAP = """/users/%s/heatmap"""  # <username>
@@ -39,18 +68,32 @@ class Organization(ApiObject):
     def __hash__(self):
         return hash(self.gitea) ^ hash(self.name)
 
+    _cacheable = True
+
+    def _get_identity(self) -> tuple:
+        return (self.name,)
+
+    @classmethod
+    def _get_request_identity(cls, args) -> tuple:
+        return (args["name"],)
+
     @classmethod
     def request(cls, gitea: "Gitea", name: str) -> "Organization":
         return cls._request(gitea, {"name": name})
 
     @classmethod
-    def parse_response(cls, gitea, result) -> "Organization":
-        api_object = super().parse_response(gitea, result)
+    def handle(cls, gitea: "Gitea", name: str) -> "Organization":
+        """The Organization without requesting it until a field other than its
+        name is read, see `ReadonlyApiObject._handle`."""
+        return cls._handle(gitea, {"name": name}, {"username": name, "name": name})
+
+    @classmethod
+    def _initialize(cls, gitea, api_object, result):
+        super()._initialize(gitea, api_object, result)
         # add "name" field to make this behave similar to users for gitea < 1.18
         # also necessary for repository-owner when org is repo owner
         if not hasattr(api_object, "name"):
             Organization._add_read_property("name", result["username"], api_object)
-        return api_object
 
     _patchable_fields = {
         "description",
@@ -61,10 +104,12 @@ class Organization(ApiObject):
     }
 
     def commit(self):
-        values = self.get_dirty_fields()
-        args = {"name": self.name}
-        self.gitea.requests_patch(Organization.API_OBJECT.format(**args), data=values)
-        self.dirty_fields = {}
+        with self._commit_dirty_fields() as values:
+            args = {"name": self.name}
+            self.gitea.requests_patch(
+                Organization.API_OBJECT.format(**args), data=values
+            )
+        self._recache()
 
     def create_repo(
             self,
@@ -120,34 +165,87 @@ class Organization(ApiObject):
         )
         return [Repository.parse_response(self.gitea, result) for result in results]
 
+    def iter_repositories(self) -> Iterator["Repository"]:
+        """Yields the Repositories of this Organization, requesting them page by
+        page."""
+        for result in self.gitea.requests_iter_paginated(
+            Organization.ORG_REPOS_REQUEST % self.username
+        ):
+            yield Repository.parse_response(self.gitea, result)
+
     def get_repository(self, name) -> "Repository":
-        repos = self.get_repositories()
-        for repo in repos:
-            if repo.name == name:
-                return repo
-        raise NotFoundException("Repository %s not existent in organization." % name)
+        try:
+            return Repository.request(self.gitea, self.username, name)
+        except NotFoundRequestException:
+            raise NotFoundException(
+                "Repository %s not existent in organization." % name
+            )
 
     def get_teams(self) -> List["Team"]:
-        results = self.gitea.requests_get(
+        results = self.gitea.requests_get_paginated(
             Organization.ORG_TEAMS_REQUEST % self.username
         )
         teams = [Team.parse_response(self.gitea, result) for result in results]
         # organisation seems to be missing using this request, so we add org manually
         for t in teams:
-            setattr(t, "_organization", self)
+            t._override_field("organization", self)
         return teams
 
+    def iter_teams(self) -> Iterator["Team"]:
+        """Yields the Teams of this Organization, requesting them page by page."""
+        for result in self.gitea.requests_iter_paginated(
+            Organization.ORG_TEAMS_REQUEST % self.username
+        ):
+            team = Team.parse_response(self.gitea, result)
+            team._override_field("organization", self)
+            yield team
+
     def get_team(self, name) -> "Team":
-        teams = self.get_teams()
-        for team in teams:
-            if team.name == name:
+        # the exact match may rank after the first page of the search
+        for result in self.gitea.requests_iter_paginated(
+            Organization.ORG_TEAMS_SEARCH % self.username,
+            {"q": name, "include_desc": False},
+            data_key="data",
+        ):
+            if result["name"] == name:
+                team = Team.parse_response(self.gitea, result)
+                team._override_field("organization", self)
                 return team
         raise NotFoundException("Team not existent in organization.")
 
+    def get_access_matrix(self) -> AccessMatrix:
+        """Index of the users with access to the Repositories of this Organization.
+
+        The repositories, teams, their repositories and members and the
+        collaborators of each repository are requested once each, with up to
+        `gitea.max_workers` concurrent requests.
+        """
+        repos = self.get_repositories()
+        teams = self.get_teams()
+        matrix = AccessMatrix(self)
+        with ThreadPoolExecutor(max_workers=self.gitea.max_workers) as executor:
+            team_repos = executor.map(lambda team: team.get_repos(), teams)
+            team_members = executor.map(lambda team: team.get_members(), teams)
+            collaborators = executor.map(lambda repo: repo.get_collaborators(), repos)
+            for repo, users in zip(repos, collaborators):
+                matrix.add_repository(repo, users)
+            for team, repos_of_team, members in zip(teams, team_repos, team_members):
+                matrix.add_team(team, repos_of_team, members)
+        return matrix
+
     def get_members(self) -> List["User"]:
-        results = self.gitea.requests_get(Organization.ORG_GET_MEMBERS % self.username)
+        results = self.gitea.requests_get_paginated(
+            Organization.ORG_GET_MEMBERS % self.username
+        )
         return [User.parse_response(self.gitea, result) for result in results]
 
+    def iter_members(self) -> Iterator["User"]:
+        """Yields the members of this Organization, requesting them page by page."""
+        for result in self.gitea.requests_iter_paginated(
+            Organization.ORG_GET_MEMBERS % self.username
+        ):
+            yield User.parse_response(self.gitea, result)
+
     def is_member(self, username) -> bool:
         if isinstance(username, User):
             username = username.username
@@ -170,6 +268,7 @@ class Organization(ApiObject):
         for repo in self.get_repositories():
             repo.delete()
         self.gitea.requests_delete(Organization.API_OBJECT.format(name=self.username))
+        self._uncache()
         self.deleted = True
 
     def get_heatmap(self) -> List[Tuple[datetime, int]]:
@@ -181,7 +280,7 @@ class Organization(ApiObject):
         return results
 
 
-class User(ApiObject):
+class User(UserModel):
     API_OBJECT = """/users/{name}"""  # <org>
     USER_MAIL = """/user/emails?sudo=%s"""  # <name>
     USER_KEYS = """/user/keys?sudo=%s"""  # <username>
@@ -196,12 +295,24 @@ class User(ApiObject):
         self._emails = []
 
     def __eq__(self, other):
+        # by name, which a handle knows without requesting the user, like the
+        # object cache; a user renamed meanwhile compares unequal to the old one
         if not isinstance(other, User):
             return False
-        return self.gitea == other.gitea and self.id == other.id
+        return self.gitea == other.gitea and self.username == other.username
 
     def __hash__(self):
-        return hash(self.gitea) ^ hash(self.id)
+        return hash(self.gitea) ^ hash(self.username)
+
+    _cacheable = True
+    _unrefreshed_fields = frozenset({"emails"})
+
+    def _get_identity(self) -> tuple:
+        return (self.username,)
+
+    @classmethod
+    def _get_request_identity(cls, args) -> tuple:
+        return (args["name"],)
 
     @property
     def emails(self):
@@ -217,6 +328,12 @@ class User(ApiObject):
         api_object = cls._request(gitea, {"name": name})
         return api_object
 
+    @classmethod
+    def handle(cls, gitea: "Gitea", name: str) -> "User":
+        """The User without requesting it until a field other than its name is
+        read, see `ReadonlyApiObject._handle`."""
+        return cls._handle(gitea, {"name": name}, {"username": name, "login": name})
+
     _patchable_fields = {
         "active",
         "admin",
@@ -241,14 +358,14 @@ class User(ApiObject):
         changing a user.
         Usually source_id is 0 and the login_name is equal to the username.
         """
-        values = self.get_dirty_fields()
-        values.update(
-            # api-doc says that the "source_id" is necessary; works without though
-            {"login_name": login_name, "source_id": source_id}
-        )
-        args = {"username": self.username}
-        self.gitea.requests_patch(User.ADMIN_EDIT_USER.format(**args), data=values)
-        self.dirty_fields = {}
+        with self._commit_dirty_fields() as values:
+            values.update(
+                # api-doc says that the "source_id" is necessary; works without though
+                {"login_name": login_name, "source_id": source_id}
+            )
+            args = {"username": self.username}
+            self.gitea.requests_patch(User.ADMIN_EDIT_USER.format(**args), data=values)
+        self._recache()
 
     def create_repo(
             self,
@@ -326,6 +443,12 @@ class User(ApiObject):
         results = self.gitea.requests_get_paginated(url)
         return [Repository.parse_response(self.gitea, result) for result in results]
 
+    def iter_repositories(self) -> Iterator["Repository"]:
+        """Yields the Repositories owned by this User, page by page."""
+        url = f"/users/{self.username}/repos"
+        for result in self.gitea.requests_iter_paginated(url):
+            yield Repository.parse_response(self.gitea, result)
+
     def get_repository_by_name(self, repository_name: str) -> Repository:
         return Repository.parse_response(
             self.gitea,
@@ -340,15 +463,32 @@ class User(ApiObject):
         results = self.gitea.requests_get_paginated(url)
         return [Organization.parse_response(self.gitea, result) for result in results]
 
+    def iter_orgs(self) -> Iterator[Organization]:
+        """Yields the Organizations this user is a member of, page by page."""
+        url = f"/users/{self.username}/orgs"
+        for result in self.gitea.requests_iter_paginated(url):
+            yield Organization.parse_response(self.gitea, result)
+
     def get_teams(self) -> List["Team"]:
         url = "/user/teams"
         results = self.gitea.requests_get_paginated(url, sudo=self)
         return [Team.parse_response(self.gitea, result) for result in results]
 
+    def iter_teams(self) -> Iterator["Team"]:
+        """Yields the Teams this user is a member of, page by page."""
+        for result in self.gitea.requests_iter_paginated("/user/teams", sudo=self):
+            yield Team.parse_response(self.gitea, result)
+
     def get_accessible_repos(self) -> List["Repository"]:
         """Get all Repositories accessible by the logged in User."""
-        results = self.gitea.requests_get("/user/repos", sudo=self)
-        return [Repository.parse_response(self, result) for result in results]
+        results = self.gitea.requests_get_paginated("/user/repos", sudo=self)
+        return [Repository.parse_response(self.gitea, result) for result in results]
+
+    def iter_accessible_repos(self) -> Iterator["Repository"]:
+        """Yields the Repositories accessible by the logged in User, page by
+        page."""
+        for result in self.gitea.requests_iter_paginated("/user/repos", sudo=self):
+            yield Repository.parse_response(self.gitea, result)
 
     def get_key_by_id(self, key_id: str) -> "Key":
         for _key in self.keys:
@@ -362,7 +502,7 @@ class User(ApiObject):
 
     def __request_keys(self) -> List["Key"]:
         """Get all the Keys of this user."""
-        results = self.gitea.requests_get(User.USER_KEYS % self.username)
+        results = self.gitea.requests_get_paginated(User.USER_KEYS % self.username)
         return [Key.parse_response(self.gitea, result) for result in results]
 
     def __request_emails(self):
@@ -376,6 +516,7 @@ class User(ApiObject):
     def delete(self):
         """Deletes this User. Also deletes all Repositories he owns."""
         self.gitea.requests_delete(User.ADMIN_DELETE_USER % self.username)
+        self._uncache()
         self.deleted = True
 
     def get_heatmap(self) -> List[Tuple[datetime, int]]:
@@ -413,12 +554,12 @@ class Key(ApiObject):
         self.deleted = True
 
     _fields_to_parsers = {
-        "user": lambda gitea, r: User.parse_response(gitea, r),
+        "user": lambda gitea, r: User.parse_nested(gitea, r),
         "created_at": lambda gitea, t: Util.convert_time(t),
     }
 
 
-class Branch(ReadonlyApiObject):
+class Branch(BranchModel):
     def __init__(self, gitea):
         super().__init__(gitea)
 
@@ -477,13 +618,13 @@ class TreeContent(ReadonlyApiObject):
     }
 
 
-class Repository(ApiObject):
+class Repository(RepositoryModel):
     API_OBJECT = """/repos/{owner}/{name}"""  # <owner>, <reponame>
     REPO_MIGRATE = """/repos/migrate"""
     REPO_IS_COLLABORATOR = (
         """/repos/%s/%s/collaborators/%s"""  # <owner>, <reponame>, <username>
     )
-    REPO_SEARCH = """/repos/search/%s"""  # <reponame>
+    REPO_SEARCH = """/repos/search"""
     REPO_BRANCHES = """/repos/%s/%s/branches"""  # <owner>, <reponame>
     REPO_BRANCH = """/repos/{owner}/{repo}/branches/{branch}"""  # <owner>, <reponame>,
     # <branchname>
@@ -504,19 +645,33 @@ class Repository(ApiObject):
         super().__init__(gitea)
 
     def __eq__(self, other):
+        # by the names only, the owner of a handle may be a placeholder
         if not isinstance(other, Repository):
             return False
-        return self.owner == other.owner and self.name == other.name
+        return (
+            self.gitea == other.gitea
+            and self.owner.username == other.owner.username
+            and self.name == other.name
+        )
 
     def __hash__(self):
-        return hash(self.owner) ^ hash(self.name)
+        return hash(self.gitea) ^ hash(self.owner.username) ^ hash(self.name)
+
+    _cacheable = True
+
+    def _get_identity(self) -> tuple:
+        return self.owner.username, self.name
+
+    @classmethod
+    def _get_request_identity(cls, args) -> tuple:
+        return args["owner"], args["name"]
 
     _fields_to_parsers = {
         # dont know how to tell apart user and org as owner
         # except form email being empty.
-        "owner": lambda gitea, r: Organization.parse_response(gitea, r)
+        "owner": lambda gitea, r: Organization.parse_nested(gitea, r)
         if r["email"] == ""
-        else User.parse_response(gitea, r),
+        else User.parse_nested(gitea, r),
         "updated_at": lambda gitea, t: Util.convert_time(t),
     }
 
@@ -524,6 +679,26 @@ class Repository(ApiObject):
     def request(cls, gitea: "Gitea", owner: str, name: str):
         return cls._request(gitea, {"owner": owner, "name": name})
 
+    @classmethod
+    def handle(
+            cls, gitea: "Gitea", owner: Union[str, User, Organization], name: str
+    ) -> "Repository":
+        """The Repository without requesting it until a field other than its
+        owner and name is read, see `ReadonlyApiObject._handle`.
+
+        An owner given by name is a User handle standing in for the owner until
+        the repository is requested, whether it is a user or an organization is
+        only known then. Methods depending on the kind of the owner request the
+        repository first, see `_get_owner`.
+        """
+        if isinstance(owner, str):
+            owner = User.handle(gitea, owner)
+        return cls._handle(
+            gitea,
+            {"owner": owner.username, "name": name},
+            {"owner": owner, "name": name},
+        )
+
     _patchable_fields = {
         "allow_manual_merge",
         "allow_merge_commits",
@@ -554,18 +729,25 @@ class Repository(ApiObject):
     }
 
     def commit(self):
-        values = self.get_dirty_fields()
-        args = {"owner": self.owner.username, "name": self.name}
-        self.gitea.requests_patch(self.API_OBJECT.format(**args), data=values)
-        self.dirty_fields = {}
+        with self._commit_dirty_fields() as values:
+            args = {"owner": self.owner.username, "name": self.name}
+            self.gitea.requests_patch(self.API_OBJECT.format(**args), data=values)
+        self._recache()
 
     def get_branches(self) -> List["Branch"]:
         """Get all the Branches of this Repository."""
-        results = self.gitea.requests_get(
+        results = self.gitea.requests_get_paginated(
             Repository.REPO_BRANCHES % (self.owner.username, self.name)
         )
         return [Branch.parse_response(self.gitea, result) for result in results]
 
+    def iter_branches(self) -> Iterator["Branch"]:
+        """Yields the Branches of this Repository, requesting them page by page."""
+        for result in self.gitea.requests_iter_paginated(
+            Repository.REPO_BRANCHES % (self.owner.username, self.name)
+        ):
+            yield Branch.parse_response(self.gitea, result)
+
     def get_branch_by_name(self, branch_name: str) -> Branch:
         return Branch.parse_response(
             self.gitea,
@@ -595,16 +777,94 @@ class Repository(ApiObject):
             )
         )
 
-    def get_issues(self) -> List["Issue"]:
-        """Get all Issues of this Repository (open and closed)"""
-        return self.get_issues_state(Issue.OPENED) + self.get_issues_state(Issue.CLOSED)
+    def get_issues(
+            self,
+            state: str = "all",
+            type: str = None,
+            labels: Sequence[str] = None,
+            milestones: Sequence[Union[str, int, "Milestone"]] = None,
+            since: datetime = None,
+            before: datetime = None,
+            created_by: Union[User, str] = None,
+            assigned_by: Union[User, str] = None,
+    ) -> List["Issue"]:
+        """Get the Issues of this Repository, by default all open and closed ones,
+        including pull requests.
+
+        The listing is requested once and filtered by the server: `state` is
+        "open", "closed" or "all" and `type` "issues" or "pulls". Issues can be
+        restricted to those having all `labels`, one of the `milestones` (names
+        or ids), an update between `since` and `before`, or being created by or
+        assigned to a user.
+        """
+        results = self.gitea.requests_get_paginated(
+            Repository.REPO_ISSUES.format(owner=self.owner.username, repo=self.name),
+            params=self._get_issues_params(
+                state, type, labels, milestones, since, before, created_by, assigned_by
+            ),
+        )
+        return [self._parse_issue(result) for result in results]
+
+    def iter_issues(
+            self,
+            state: str = "all",
+            type: str = None,
+            labels: Sequence[str] = None,
+            milestones: Sequence[Union[str, int, "Milestone"]] = None,
+            since: datetime = None,
+            before: datetime = None,
+            created_by: Union[User, str] = None,
+            assigned_by: Union[User, str] = None,
+    ) -> Iterator["Issue"]:
+        """Yields the Issues of this Repository as selected by the filters of
+        `get_issues`, requesting them page by page."""
+        results = self.gitea.requests_iter_paginated(
+            Repository.REPO_ISSUES.format(owner=self.owner.username, repo=self.name),
+            params=self._get_issues_params(
+                state, type, labels, milestones, since, before, created_by, assigned_by
+            ),
+        )
+        for result in results:
+            yield self._parse_issue(result)
 
-    def get_commits(self, page_limit: int = 0) -> List["Commit"]:
+    @staticmethod
+    def _get_issues_params(
+            state: str,
+            type: Optional[str],
+            labels: Optional[Sequence[str]],
+            milestones: Optional[Sequence[Union[str, int, "Milestone"]]],
+            since: Optional[datetime],
+            before: Optional[datetime],
+            created_by: Union[User, str, None],
+            assigned_by: Union[User, str, None],
+    ) -> Dict[str, str]:
+        assert state in [Issue.OPENED, Issue.CLOSED, Issue.ALL]
+        params = {"state": state}
+        if type is not None:
+            assert type in [Issue.ISSUES, Issue.PULLS]
+            params["type"] = type
+        if labels:
+            params["labels"] = ",".join(labels)
+        if milestones:
+            params["milestones"] = ",".join(
+                str(m.id if isinstance(m, Milestone) else m) for m in milestones
+            )
+        params.update(Util.get_time_range_params(since, before))
+        if created_by is not None:
+            params["created_by"] = getattr(created_by, "username", created_by)
+        if assigned_by is not None:
+            params["assigned_by"] = getattr(assigned_by, "username", assigned_by)
+        return params
+
+    def get_commits(
+            self, page_limit: int = 0, page_size: int = None
+    ) -> List["Commit"]:
         """Get all the Commits of this Repository."""
         try:
             results = self.gitea.requests_get_paginated(
                 Repository.REPO_COMMITS % (self.owner.username, self.name),
                 page_limit=page_limit,
+                page_size=page_size,
             )
         except ConflictRequestException as err:
             logging.warning(err)
@@ -614,6 +874,24 @@ class Repository(ApiObject):
             results = []
         return [Commit.parse_response(self.gitea, result) for result in results]
 
+    def iter_commits(
+            self, page_limit: int = 0, page_size: int = None
+    ) -> Iterator["Commit"]:
+        """Yields the Commits of this Repository, requesting them page by page."""
+        results = self.gitea.requests_iter_paginated(
+            Repository.REPO_COMMITS % (self.owner.username, self.name),
+            page_limit=page_limit,
+            page_size=page_size,
+        )
+        try:
+            for result in results:
+                yield Commit.parse_response(self.gitea, result)
+        except ConflictRequestException as err:
+            logging.warning(err)
+            logging.warning(
+                "Repository %s/%s is Empty" % (self.owner.username, self.name)
+            )
+
     def get_commit_by_sha(self, sha: str):
         result = self.gitea.requests_get(
             self.REPO_COMMIT.format(owner=self.owner.username, repo=self.name, sha=sha)
@@ -632,22 +910,71 @@ class Repository(ApiObject):
         )
         return Tree.parse_response(self.gitea, result)
 
-    def get_issues_state(self, state) -> List["Issue"]:
-        """Get issues of state Issue.open or Issue.closed of a repository."""
-        assert state in [Issue.OPENED, Issue.CLOSED]
-        issues = []
-        data = {"state": state}
-        results = self.gitea.requests_get_paginated(
-            Repository.REPO_ISSUES.format(owner=self.owner.username, repo=self.name),
+    def iter_tree_of_a_repository(
+            self, sha: str, recursive: bool = False, page: int = 0, per_page: int = 0
+    ) -> Iterator["TreeContent"]:
+        """Yields the entries of the tree while the response is received, so that
+        large recursive trees are not held in memory as a whole."""
+        data = {
+            "recursive": recursive,
+            "page": page,
+            "per_page": per_page
+        }
+        results = self.gitea.requests_iter_stream(
+            self.REPO_TREE_OF_A_REPOSITORY.format(
+                owner=self.owner.username, repo=self.name, sha=sha
+            ),
             params=data,
+            key="tree",
         )
         for result in results:
-            issue = Issue.parse_response(self.gitea, result)
-            # adding data not contained in the issue answer
-            Issue._add_read_property("repo", self, issue)
-            Issue._add_read_property("owner", self.owner, issue)
-            issues.append(issue)
-        return issues
+            yield TreeContent.parse_response(self.gitea, result)
+
+    def get_issues_state(self, state) -> List["Issue"]:
+        """Get issues of state Issue.open or Issue.closed of a repository."""
+        assert state in [Issue.OPENED, Issue.CLOSED]
+        return self.get_issues(state=state)
+
+    def iter_issues_state(self, state) -> Iterator["Issue"]:
+        """Yields issues of state Issue.open or Issue.closed of a repository,
+        requesting them page by page."""
+        assert state in [Issue.OPENED, Issue.CLOSED]
+        yield from self.iter_issues(state=state)
+
+    def _parse_issue(self, result) -> "Issue":
+        issue = Issue.parse_response(self.gitea, result)
+        # adding data not contained in the issue answer
+        Issue._add_read_property("repo", self, issue)
+        Issue._add_read_property("owner", self.owner, issue)
+        issue._override_field("repository", self)
+        return issue
+
+    def get_issue_comments(
+            self,
+            numbers: Iterable[int] = None,
+            since: datetime = None,
+            before: datetime = None,
+            page_size: int = None,
+    ) -> Dict[int, List["Comment"]]:
+        """Get the Comments of the Issues of this Repository by issue number.
+
+        All comments are requested in a single paginated pass over the comments of
+        the repository instead of one request per issue. They can be restricted to
+        the issues `numbers` and to those updated after `since` and / or before
+        `before`.
+        """
+        numbers = None if numbers is None else set(numbers)
+        comments = {}
+        for result in self.gitea.requests_iter_paginated(
+            Issue.GET_COMMENTS % (self.owner.username, self.name),
+            Util.get_time_range_params(since, before),
+            page_size=page_size,
+        ):
+            number = Comment.get_issue_number(result["issue_url"])
+            if numbers is None or number in numbers:
+                comment = Comment.parse_response(self.gitea, result)
+                comments.setdefault(number, []).append(comment)
+        return comments
 
     def get_times(self):
         results = self.gitea.requests_get(
@@ -681,7 +1008,9 @@ class Repository(ApiObject):
                 ),
                 data=data,
             )
-            return Issue.parse_response(self.gitea, result)
+            issue = Issue.parse_response(self.gitea, result)
+            issue._override_field("repository", self)
+            return issue
         except ConflictRequestException as e:
             raise e
 
@@ -715,7 +1044,12 @@ class Repository(ApiObject):
 
     def list_hooks(self):
         url = f"/repos/{self.owner.username}/{self.name}/hooks"
-        return self.gitea.requests_get(url)
+        return self.gitea.requests_get_paginated(url)
+
+    def iter_hooks(self) -> Iterator[Dict]:
+        """Yields the hooks of this Repository, requesting them page by page."""
+        url = f"/repos/{self.owner.username}/{self.name}/hooks"
+        yield from self.gitea.requests_iter_paginated(url)
 
     def delete_hook(self, id: str):
         url = f"/repos/{self.owner.username}/{self.name}/hooks/{id}"
@@ -734,21 +1068,41 @@ class Repository(ApiObject):
         except Exception:
             return False
 
-    def get_users_with_access(self) -> Sequence[User]:
+    def get_collaborators(self) -> List[User]:
         url = f"/repos/{self.owner.username}/{self.name}/collaborators"
-        response = self.gitea.requests_get(url)
-        collabs = [User.parse_response(self.gitea, user) for user in response]
-        if isinstance(self.owner, User):
-            return collabs + [self.owner]
+        response = self.gitea.requests_get_paginated(url)
+        return [User.parse_response(self.gitea, user) for user in response]
+
+    def get_users_with_access(
+            self, access_matrix: AccessMatrix = None
+    ) -> Sequence[User]:
+        """The collaborators and, for user owned repositories, the owner or, for
+        organization owned ones, the members of the teams with access.
+
+        Given the `Organization.get_access_matrix` of the owning organization, the
+        users are taken from it instead of being requested.
+        """
+        owner = self._get_owner()
+        if access_matrix is not None and isinstance(owner, Organization):
+            return access_matrix.get_users(self)
+        collabs = self.get_collaborators()
+        if isinstance(owner, User):
+            return collabs + [owner]
         else:
             # owner must be org
-            teams = self.owner.get_teams()
+            teams = owner.get_teams()
             for team in teams:
                 team_repos = team.get_repos()
                 if self.name in [n.name for n in team_repos]:
                     collabs += team.get_members()
             return collabs
 
+    def _get_owner(self) -> Union[User, Organization]:
+        """The owner as User or Organization, for a handle after requesting the
+        repository, as its owner may only stand in for it, see `handle`."""
+        self._load_handle()
+        return self.owner
+
     def remove_collaborator(self, user_name: str):
         url = f"/repos/{self.owner.username}/{self.name}/collaborators/{user_name}"
         self.gitea.requests_delete(url)
@@ -769,6 +1123,7 @@ class Repository(ApiObject):
             self.gitea.requests_post(url, data=data)
         except ConflictRequestException as e:
             raise e
+        self._uncache()
         # TODO: make sure this instance is either updated or discarded
 
     def get_git_content(self, ref: "Commit" or "Branch" = None) -> List["Content"]:
@@ -848,11 +1203,13 @@ class Repository(ApiObject):
     def edit_properties(self, data: dict = None):
         args = {"owner": self.owner.username, "name": self.name}
         self.gitea.requests_patch(self.API_OBJECT.format(**args), data=data)
+        self._uncache()
 
     def delete(self):
         self.gitea.requests_delete(
             Repository.REPO_DELETE % (self.owner.username, self.name)
         )
+        self._uncache()
         self.deleted = True
 
     @classmethod
@@ -925,7 +1282,7 @@ class Repository(ApiObject):
             raise e
 
 
-class Milestone(ApiObject):
+class Milestone(MilestoneModel):
     API_OBJECT = """/repos/{owner}/{repo}/milestones/{number}"""  # <owner, repo>
 
     def __init__(self, gitea):
@@ -966,7 +1323,7 @@ class Milestone(ApiObject):
         return cls._request(gitea, {"owner": owner, "repo": repo, "number": number})
 
 
-class Comment(ApiObject):
+class Comment(CommentModel):
     def __init__(self, gitea):
         super().__init__(gitea)
 
@@ -979,19 +1336,24 @@ class Comment(ApiObject):
         return hash(self.repo) ^ hash(self.id)
 
     _fields_to_parsers = {
-        "user": lambda gitea, r: User.parse_response(gitea, r),
+        "user": lambda gitea, r: User.parse_nested(gitea, r),
         "created_at": lambda gitea, t: Util.convert_time(t),
         "updated_at": lambda gitea, t: Util.convert_time(t),
     }
 
+    @staticmethod
+    def get_issue_number(issue_url: str) -> int:
+        """The number of the issue (or pull request) of the url of a comment."""
+        return int(issue_url.rsplit("/", 1)[1])
+
 
-class Commit(ReadonlyApiObject):
+class Commit(CommitModel):
     def __init__(self, gitea):
         super().__init__(gitea)
 
     _fields_to_parsers = {
         # NOTE: api may return None for commiters that are no gitea users
-        "author": lambda gitea, u: User.parse_response(gitea, u)
+        "author": lambda gitea, u: User.parse_nested(gitea, u)
         if u
         else None
     }
@@ -1014,14 +1376,20 @@ class Commit(ReadonlyApiObject):
         return api_object
 
 
-class Issue(ApiObject):
+class Issue(IssueModel):
     API_OBJECT = """/repos/{owner}/{repo}/issues/{index}"""  # <owner, repo, index>
     GET_TIME = """/repos/%s/%s/issues/%s/times"""  # <owner, repo, index>
-    GET_COMMENTS = """/repos/%s/%s/issues/comments"""
+    GET_COMMENTS = """/repos/%s/%s/issues/comments"""  # <owner, repo>
+    GET_ISSUE_COMMENTS = """/repos/%s/%s/issues/%s/comments"""  # <owner, repo, index>
     CREATE_ISSUE = """/repos/{owner}/{repo}/issues"""
 
     OPENED = "open"
     CLOSED = "closed"
+    ALL = "all"
+
+    # types of the issue listings, issues in the narrower sense or pull requests
+    ISSUES = "issues"
+    PULLS = "pulls"
 
     def __init__(self, gitea):
         super().__init__(gitea)
@@ -1036,13 +1404,12 @@ class Issue(ApiObject):
 
     _fields_to_parsers = {
         "milestone": lambda gitea, m: Milestone.parse_response(gitea, m),
-        "user": lambda gitea, u: User.parse_response(gitea, u),
-        "assignee": lambda gitea, u: User.parse_response(gitea, u),
-        "assignees": lambda gitea, us: [User.parse_response(gitea, u) for u in us],
+        "user": lambda gitea, u: User.parse_nested(gitea, u),
+        "assignee": lambda gitea, u: User.parse_nested(gitea, u),
+        "assignees": lambda gitea, us: [User.parse_nested(gitea, u) for u in us],
         "state": lambda gitea, s: Issue.CLOSED if s == "closed" else Issue.OPENED,
-        # Repository in this request is just a "RepositoryMeta" record,
-        # thus request whole object
-        "repository": lambda gitea, r: Repository.request(gitea, r["owner"], r["name"]),
+        # Repository in this request is just a "RepositoryMeta" record, the whole
+        # object is requested on first access, see `_get_var`
     }
 
     _parsers_to_fields = {
@@ -1060,14 +1427,10 @@ class Issue(ApiObject):
     }
 
     def commit(self):
-        values = self.get_dirty_fields()
-        args = {
-            "owner": self.repository.owner.username,
-            "repo": self.repository.name,
-            "index": self.number,
-        }
-        self.gitea.requests_patch(Issue.API_OBJECT.format(**args), data=values)
-        self.dirty_fields = {}
+        with self._commit_dirty_fields() as values:
+            owner, repo = self._get_repository_names()
+            args = {"owner": owner, "repo": repo, "index": self.number}
+            self.gitea.requests_patch(Issue.API_OBJECT.format(**args), data=values)
 
     @classmethod
     def request(cls, gitea: "Gitea", owner: str, repo: str, number: str):
@@ -1076,16 +1439,57 @@ class Issue(ApiObject):
         )
         return api_object
 
+    @classmethod
+    def parse_responses(cls, gitea, results: Iterable[Dict]) -> Iterator["Issue"]:
+        """Parses the issues of a listing, which share their repositories: each
+        repository is only requested once, when first accessed."""
+        # repositories requested for issues of the listing, by owner and name
+        repositories = {}
+        for result in results:
+            issue = cls.parse_response(gitea, result)
+            issue._repositories = repositories
+            yield issue
+
+    def _get_var(self, name):
+        value = super()._get_var(name)
+        if name == "repository" and isinstance(value, dict):
+            return self._resolve_repository(value)
+        return value
+
+    def _resolve_repository(self, meta: Dict) -> "Repository":
+        key = (meta["owner"], meta["name"])
+        # only set for issues of parse_responses
+        repositories = getattr(self, "_repositories", None)
+        repository = repositories.get(key) if repositories is not None else None
+        if repository is None:
+            repository = Repository.request(self.gitea, *key)
+            if repositories is not None:
+                repositories[key] = repository
+        self._repository = repository
+        return repository
+
+    def _get_repository_names(self) -> Tuple[str, str]:
+        """Owner and name of the repository of this issue, taken from the
+        RepositoryMeta record if the repository was not requested (yet)."""
+        repository = getattr(self, "_repository", None)
+        if isinstance(repository, dict):
+            return repository["owner"], repository["name"]
+        if repository is None:
+            return self.owner.username, self.repo.name
+        return repository.owner.username, repository.name
+
     @classmethod
     def create_issue(cls, gitea, repo: Repository, title: str, body: str = ""):
         args = {"owner": repo.owner.username, "repo": repo.name}
         data = {"title": title, "body": body}
         result = gitea.requests_post(Issue.CREATE_ISSUE.format(**args), data=data)
-        return Issue.parse_response(gitea, result)
+        issue = Issue.parse_response(gitea, result)
+        issue._override_field("repository", repo)
+        return issue
 
     def get_time_sum(self, user: User) -> int:
         results = self.gitea.requests_get(
-            Issue.GET_TIME % (self.owner.username, self.repo.name, self.number)
+            Issue.GET_TIME % (*self._get_repository_names(), self.number)
         )
         return sum(
             result["time"]
@@ -1095,42 +1499,34 @@ class Issue(ApiObject):
 
     def get_times(self) -> Optional[Dict]:
         return self.gitea.requests_get(
-            Issue.GET_TIME % (self.owner.username, self.repository.name, self.number)
+            Issue.GET_TIME % (*self._get_repository_names(), self.number)
         )
 
     def delete_time(self, time_id: str):
-        path = (
-            f"/repos/{self.owner.username}/{self.repository.name}/issues/"
-            f"{self.number}/times/{time_id}"
-        )
+        owner, repo = self._get_repository_names()
+        path = f"/repos/{owner}/{repo}/issues/{self.number}/times/{time_id}"
         self.gitea.requests_delete(path)
 
     def add_time(self, time: int, created: str = None, user_name: User = None):
-        path = (
-            f"/repos/{self.owner.username}/{self.repository.name}/issues/"
-            f"{self.number}/times"
-        )
+        owner, repo = self._get_repository_names()
+        path = f"/repos/{owner}/{repo}/issues/{self.number}/times"
         self.gitea.requests_post(
             path, data={"created": created, "time": int(time), "user_name": user_name}
         )
 
-    def get_comments(self) -> List[ApiObject]:
+    def get_comments(
+            self, since: datetime = None, before: datetime = None
+    ) -> List["Comment"]:
+        """Get the Comments of this Issue, optionally only those updated after
+        `since` and / or before `before`."""
         results = self.gitea.requests_get(
-            Issue.GET_COMMENTS % (self.owner.username, self.repo.name)
+            Issue.GET_ISSUE_COMMENTS % (*self._get_repository_names(), self.number),
+            Util.get_time_range_params(since, before),
         )
-        allProjectComments = [
-            Comment.parse_response(self.gitea, result) for result in results
-        ]
-        # Comparing the issue id with the URL
-        # seems to be the only (!) way to get to the comments of one issue
-        return [
-            comment
-            for comment in allProjectComments
-            if comment.issue_url.endswith("/" + str(self.number))
-        ]
+        return [Comment.parse_response(self.gitea, result) for result in results]
 
 
-class Team(ApiObject):
+class Team(TeamModel):
     API_OBJECT = """/teams/{id}"""  # <id>
     ADD_REPO = """/teams/%s/repos/%s/%s"""  # <id, org, repo>
     TEAM_DELETE = """/teams/%s"""  # <id>
@@ -1141,15 +1537,25 @@ class Team(ApiObject):
         super().__init__(gitea)
 
     def __eq__(self, other):
+        # team ids are unique on the instance and known to a handle
         if not isinstance(other, Team):
             return False
-        return self.organization == other.organization and self.id == other.id
+        return self.gitea == other.gitea and self.id == other.id
 
     def __hash__(self):
-        return hash(self.organization) ^ hash(self.id)
+        return hash(self.gitea) ^ hash(self.id)
+
+    _cacheable = True
+
+    def _get_identity(self) -> tuple:
+        return (self.id,)
+
+    @classmethod
+    def _get_request_identity(cls, args) -> tuple:
+        return (args["id"],)
 
     _fields_to_parsers = {
-        "organization": lambda gitea, o: Organization.parse_response(gitea, o)
+        "organization": lambda gitea, o: Organization.parse_nested(gitea, o)
     }
 
     _patchable_fields = {
@@ -1166,11 +1572,17 @@ class Team(ApiObject):
     def request(cls, gitea: "Gitea", id: int):
         return cls._request(gitea, {"id": id})
 
+    @classmethod
+    def handle(cls, gitea: "Gitea", id: int) -> "Team":
+        """The Team without requesting it until a field other than its id is
+        read, see `ReadonlyApiObject._handle`."""
+        return cls._handle(gitea, {"id": id}, {"id": id})
+
     def commit(self):
-        values = self.get_dirty_fields()
-        args = {"id": self.id}
-        self.gitea.requests_patch(self.API_OBJECT.format(**args), data=values)
-        self.dirty_fields = {}
+        with self._commit_dirty_fields() as values:
+            args = {"id": self.id}
+            self.gitea.requests_patch(self.API_OBJECT.format(**args), data=values)
+        self._recache()
 
     def add_user(self, user: User):
         """https://try.gitea.io/api/swagger#/organization/orgAddTeamMember"""
@@ -1182,16 +1594,27 @@ class Team(ApiObject):
 
     def get_members(self):
         """Get all users assigned to the team."""
-        results = self.gitea.requests_get(Team.GET_MEMBERS % self.id)
+        results = self.gitea.requests_get_paginated(Team.GET_MEMBERS % self.id)
         return [User.parse_response(self.gitea, result) for result in results]
 
+    def iter_members(self) -> Iterator[User]:
+        """Yields the users assigned to the team, requesting them page by page."""
+        for result in self.gitea.requests_iter_paginated(Team.GET_MEMBERS % self.id):
+            yield User.parse_response(self.gitea, result)
+
     def get_repos(self):
         """Get all repos of this Team."""
-        results = self.gitea.requests_get(Team.GET_REPOS % self.id)
+        results = self.gitea.requests_get_paginated(Team.GET_REPOS % self.id)
         return [Repository.parse_response(self.gitea, result) for result in results]
 
+    def iter_repos(self) -> Iterator[Repository]:
+        """Yields the repos of this Team, requesting them page by page."""
+        for result in self.gitea.requests_iter_paginated(Team.GET_REPOS % self.id):
+            yield Repository.parse_response(self.gitea, result)
+
     def delete(self):
         self.gitea.requests_delete(Team.TEAM_DELETE % self.id)
+        self._uncache()
         self.deleted = True
 
     def remove_team_member(self, user_name: str):
@@ -1221,10 +1644,51 @@ class Util:
     def convert_time(time: str) -> datetime:
         """Parsing of strange Gitea time format
         ("%Y-%m-%dT%H:%M:%S:%z" but with ":" in time zone notation)"""
-        try:
-            return datetime.strptime(time[:-3] + "00", "%Y-%m-%dT%H:%M:%S%z")
-        except ValueError:
-            return datetime.strptime(time[:-3] + "00", "%Y-%m-%dT%H:%M:%S")
+        return _convert_time(time)
+
+    @staticmethod
+    def convert_times_to_epoch(times: Iterable[Optional[str]]) -> array:
+        """Converts a column of Gitea timestamps, e.g. the `updated_at` of the
+        records of a listing, into an array of seconds since the epoch. Missing
+        timestamps become NaN, naive ones are taken as local time."""
+        epochs = array("d")
+        for time in times:
+            epochs.append(_convert_time(time).timestamp() if time else nan)
+        return epochs
+
+    @staticmethod
+    def format_time(time: datetime) -> str:
+        """Formats a datetime as RFC 3339, naive ones are taken as local time."""
+        if time.tzinfo is None:
+            time = time.astimezone()
+        return time.isoformat(timespec="seconds")
+
+    @staticmethod
+    def get_time_range_params(
+            since: datetime = None, before: datetime = None
+    ) -> Dict[str, str]:
+        params = {}
+        if since is not None:
+            params["since"] = Util.format_time(since)
+        if before is not None:
+            params["before"] = Util.format_time(before)
+        return params
+
+
+@lru_cache(maxsize=4096)
+def _convert_time(time: str) -> datetime:
+    # listings repeat timestamps a lot, and datetimes are immutable
+    try:
+        # RFC 3339 as written by Gitea, "Z" is only understood from Python 3.11 on
+        return datetime.fromisoformat(
+            time[:-1] + "+00:00" if time.endswith("Z") else time
+        )
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(time[:-3] + "00", "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        return datetime.strptime(time[:-3] + "00", "%Y-%m-%dT%H:%M:%S")
 
 
 class MigrationServices:
@@ -0,0 +1,1158 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import logging
+from datetime import datetime
+from typing import (
+    List,
+    Tuple,
+    Dict,
+    Sequence,
+    Optional,
+    Union,
+    Set,
+    AsyncIterator,
+    Iterable,
+    TYPE_CHECKING,
+)
+
+from .access import AccessMatrix
+from .apiobject import (
+    Organization,
+    User,
+    Key,
+    Branch,
+    Tree,
+    TreeContent,
+    Repository,
+    Milestone,
+    Comment,
+    Commit,
+    Issue,
+    Team,
+    Content,
+    Util,
+)
+from .exceptions import (
+    ConflictRequestException,
+    NotFoundException,
+    NotFoundRequestException,
+    AlreadyExistsRequestException,
+    ApiValidationRequestException,
+)
+
+if TYPE_CHECKING:
+    from .asyncgitea import AsyncGitea
+
+
+class _AsyncRequestMixin:
+    """Makes `.request` of an api object awaitable; to be used with `AsyncGitea`."""
+
+    @classmethod
+    async def _request(cls, gitea, args):
+        object_cache = cls._get_object_cache(gitea)
+        if object_cache is not None:
+            api_object = object_cache.get(cls, args)
+            if api_object is not None:
+                return api_object
+        result = await cls._get_gitea_api_object(gitea, args)
+        api_object = cls.parse_response(gitea, result)
+        if object_cache is not None:
+            api_object = object_cache.add(api_object, args)
+        return api_object
+
+    def _load_handle(self):
+        # the record can not be requested by a property
+        raise AttributeError(
+            f"{type(self).__name__} is a handle, await load() to read its fields"
+        )
+
+    async def load(self):
+        """Requests the full record if this is a handle (see
+        `ReadonlyApiObject._handle`), afterwards all fields can be read."""
+        args = self._handle_args
+        if args is not None:
+            self._refresh(await type(self)._request(self.gitea, args))
+            self._handle_args = None
+        return self
+
+
+class AsyncOrganization(_AsyncRequestMixin, Organization):
+    """Organization with awaitable requests, see `Organization`."""
+
+    @classmethod
+    async def request(cls, gitea: "AsyncGitea", name: str) -> "AsyncOrganization":
+        return await cls._request(gitea, {"name": name})
+
+    async def commit(self):
+        with self._commit_dirty_fields() as values:
+            args = {"name": self.name}
+            await self.gitea.requests_patch(
+                Organization.API_OBJECT.format(**args), data=values
+            )
+        self._recache()
+
+    async def create_repo(
+            self,
+            repoName: str,
+            description: str = "",
+            private: bool = False,
+            autoInit=True,
+            gitignores: str = None,
+            license: str = None,
+            readme: str = "Default",
+            issue_labels: str = None,
+            default_branch="master",
+    ) -> "AsyncRepository":
+        """Create an organization Repository
+
+        Throws:
+            AlreadyExistsException: If the Repository exists already.
+            Exception: If something else went wrong.
+        """
+        try:
+            result = await self.gitea.requests_post(
+                f"/orgs/{self.name}/repos",
+                data={
+                    "name": repoName,
+                    "description": description,
+                    "private": private,
+                    "auto_init": autoInit,
+                    "gitignores": gitignores,
+                    "license": license,
+                    "issue_labels": issue_labels,
+                    "readme": readme,
+                    "default_branch": default_branch,
+                },
+            )
+            if "id" in result:
+                self.gitea.logger.info(
+                    "Successfully created Repository %s " % result["name"]
+                )
+            else:
+                self.gitea.logger.error(result["message"])
+                raise Exception(
+                    "Repository not created... (gitea: %s)" % result["message"]
+                )
+            return AsyncRepository.parse_response(self.gitea, result)
+        except ConflictRequestException as e:
+            if "The repository with the same name already exists" in e.response.text:
+                raise AlreadyExistsRequestException(e.response)
+            raise e
+
+    async def get_repositories(self) -> List["AsyncRepository"]:
+        results = await self.gitea.requests_get_paginated(
+            Organization.ORG_REPOS_REQUEST % self.username
+        )
+        return [
+            AsyncRepository.parse_response(self.gitea, result) for result in results
+        ]
+
+    async def iter_repositories(self) -> AsyncIterator["AsyncRepository"]:
+        async for result in self.gitea.requests_iter_paginated(
+            Organization.ORG_REPOS_REQUEST % self.username
+        ):
+            yield AsyncRepository.parse_response(self.gitea, result)
+
+    async def get_repository(self, name) -> "AsyncRepository":
+        try:
+            return await AsyncRepository.request(self.gitea, self.username, name)
+        except NotFoundRequestException:
+            raise NotFoundException(
+                "Repository %s not existent in organization." % name
+            )
+
+    async def get_teams(self) -> List["AsyncTeam"]:
+        results = await self.gitea.requests_get_paginated(
+            Organization.ORG_TEAMS_REQUEST % self.username
+        )
+        teams = [AsyncTeam.parse_response(self.gitea, result) for result in results]
+        # organisation seems to be missing using this request, so we add org manually
+        for t in teams:
+            t._override_field("organization", self)
+        return teams
+
+    async def iter_teams(self) -> AsyncIterator["AsyncTeam"]:
+        async for result in self.gitea.requests_iter_paginated(
+            Organization.ORG_TEAMS_REQUEST % self.username
+        ):
+            team = AsyncTeam.parse_response(self.gitea, result)
+            team._override_field("organization", self)
+            yield team
+
+    async def get_team(self, name) -> "AsyncTeam":
+        async for result in self.gitea.requests_iter_paginated(
+            Organization.ORG_TEAMS_SEARCH % self.username,
+            {"q": name, "include_desc": False},
+            data_key="data",
+        ):
+            if result["name"] == name:
+                team = AsyncTeam.parse_response(self.gitea, result)
+                team._override_field("organization", self)
+                return team
+        raise NotFoundException("Team not existent in organization.")
+
+    async def get_access_matrix(self) -> AccessMatrix:
+        """See `Organization.get_access_matrix`, the requests run concurrently."""
+        repos, teams = await asyncio.gather(self.get_repositories(), self.get_teams())
+        team_repos, team_members, collaborators = await asyncio.gather(
+            asyncio.gather(*(team.get_repos() for team in teams)),
+            asyncio.gather(*(team.get_members() for team in teams)),
+            asyncio.gather(*(repo.get_collaborators() for repo in repos)),
+        )
+        matrix = AccessMatrix(self)
+        for repo, users in zip(repos, collaborators):
+            matrix.add_repository(repo, users)
+        for team, repos_of_team, members in zip(teams, team_repos, team_members):
+            matrix.add_team(team, repos_of_team, members)
+        return matrix
+
+    async def get_members(self) -> List["AsyncUser"]:
+        results = await self.gitea.requests_get_paginated(
+            Organization.ORG_GET_MEMBERS % self.username
+        )
+        return [AsyncUser.parse_response(self.gitea, result) for result in results]
+
+    async def iter_members(self) -> AsyncIterator["AsyncUser"]:
+        async for result in self.gitea.requests_iter_paginated(
+            Organization.ORG_GET_MEMBERS % self.username
+        ):
+            yield AsyncUser.parse_response(self.gitea, result)
+
+    async def is_member(self, username) -> bool:
+        if isinstance(username, User):
+            username = username.username
+        try:
+            # returns 204 if its ok, 404 if its not
+            await self.gitea.requests_get(
+                Organization.ORG_IS_MEMBER % (self.username, username)
+            )
+            return True
+        except Exception:
+            return False
+
+    async def remove_member(self, user: "User"):
+        path = f"/orgs/{self.username}/members/{user.username}"
+        await self.gitea.requests_delete(path)
+
+    async def delete(self):
+        """Delete this Organization. Invalidates this Objects data.
+        Also deletes all Repositories owned by the User"""
+        repos = await self.get_repositories()
+        await asyncio.gather(*(repo.delete() for repo in repos))
+        await self.gitea.requests_delete(
+            Organization.API_OBJECT.format(name=self.username)
+        )
+        self._uncache()
+        self.deleted = True
+
+    async def get_heatmap(self) -> List[Tuple[datetime, int]]:
+        results = await self.gitea.requests_get(User.USER_HEATMAP % self.username)
+        results = [
+            (datetime.fromtimestamp(result["timestamp"]), result["contributions"])
+            for result in results
+        ]
+        return results
+
+
+class AsyncUser(_AsyncRequestMixin, User):
+    """User with awaitable requests, see `User`.
+
+    As properties can not be awaited, `emails` and `keys` hold the values of the
+    last `get_emails` and `get_keys` call.
+    """
+
+    _unrefreshed_fields = frozenset({"emails", "keys"})
+
+    def __init__(self, gitea):
+        super().__init__(gitea)
+        self._keys = []
+
+    @property
+    def emails(self):
+        return self._emails
+
+    @property
+    def keys(self) -> list["AsyncKey"]:
+        return self._keys
+
+    @classmethod
+    async def request(cls, gitea: "AsyncGitea", name: str) -> "AsyncUser":
+        return await cls._request(gitea, {"name": name})
+
+    async def commit(self, login_name: str, source_id: int = 0):
+        """See `User.commit`."""
+        with self._commit_dirty_fields() as values:
+            values.update({"login_name": login_name, "source_id": source_id})
+            args = {"username": self.username}
+            await self.gitea.requests_patch(
+                User.ADMIN_EDIT_USER.format(**args), data=values
+            )
+        self._recache()
+
+    async def create_repo(
+            self,
+            repoName: str,
+            description: str = "",
+            private: bool = False,
+            autoInit=True,
+            gitignores: str = None,
+            license: str = None,
+            readme: str = "Default",
+            issue_labels: str = None,
+            default_branch="master",
+    ) -> "AsyncRepository":
+        """Create a user Repository
+
+        Throws:
+            AlreadyExistsException: If the Repository exists already.
+            Exception: If something else went wrong.
+        """
+        try:
+            result = await self.gitea.requests_post(
+                "/user/repos",
+                data={
+                    "name": repoName,
+                    "description": description,
+                    "private": private,
+                    "auto_init": autoInit,
+                    "gitignores": gitignores,
+                    "license": license,
+                    "issue_labels": issue_labels,
+                    "readme": readme,
+                    "default_branch": default_branch,
+                },
+            )
+            if "id" in result:
+                self.gitea.logger.info(
+                    "Successfully created Repository %s " % result["name"]
+                )
+            else:
+                self.gitea.logger.error(result["message"])
+                raise Exception(
+                    "Repository not created... (gitea: %s)" % result["message"]
+                )
+            return AsyncRepository.parse_response(self.gitea, result)
+        except ConflictRequestException as e:
+            if "The repository with the same name already exists" in e.response.text:
+                raise AlreadyExistsRequestException(e.response)
+            raise e
+
+    async def add_ssh_key(self, key_name: str, key_value: str, read_only: bool = False):
+        """Create a user ssh key"""
+        try:
+            result = await self.gitea.requests_post(
+                User.USER_KEYS % self.login,
+                data={"key": key_value, "read_only": read_only, "title": key_name},
+            )
+            if "id" in result:
+                self.gitea.logger.info(
+                    "Successfully added Ssh Key %s " % result["title"]
+                )
+            else:
+                self.gitea.logger.error(result["message"])
+                raise Exception(
+                    "Ssh key not created... (gitea: %s)" % result["message"]
+                )
+            return AsyncKey.parse_response(self.gitea, result)
+        except ApiValidationRequestException as e:
+            if "Key content has been used as non-deploy key" in e.response.text:
+                raise AlreadyExistsRequestException(e.response)
+            raise e
+
+    async def get_repositories(self) -> List["AsyncRepository"]:
+        """Get all Repositories owned by this User."""
+        url = f"/users/{self.username}/repos"
+        results = await self.gitea.requests_get_paginated(url)
+        return [
+            AsyncRepository.parse_response(self.gitea, result) for result in results
+        ]
+
+    async def iter_repositories(self) -> AsyncIterator["AsyncRepository"]:
+        url = f"/users/{self.username}/repos"
+        async for result in self.gitea.requests_iter_paginated(url):
+            yield AsyncRepository.parse_response(self.gitea, result)
+
+    async def get_repository_by_name(self, repository_name: str) -> "AsyncRepository":
+        return AsyncRepository.parse_response(
+            self.gitea,
+            await self.gitea.requests_get(
+                User.USER_REPO.format(owner=self.username, repo=repository_name)
+            ),
+        )
+
+    async def get_orgs(self) -> List[AsyncOrganization]:
+        """Get all Organizations this user is a member of."""
+        url = f"/users/{self.username}/orgs"
+        results = await self.gitea.requests_get_paginated(url)
+        return [
+            AsyncOrganization.parse_response(self.gitea, result) for result in results
+        ]
+
+    async def iter_orgs(self) -> AsyncIterator[AsyncOrganization]:
+        url = f"/users/{self.username}/orgs"
+        async for result in self.gitea.requests_iter_paginated(url):
+            yield AsyncOrganization.parse_response(self.gitea, result)
+
+    async def get_teams(self) -> List["AsyncTeam"]:
+        url = "/user/teams"
+        results = await self.gitea.requests_get_paginated(url, sudo=self)
+        return [AsyncTeam.parse_response(self.gitea, result) for result in results]
+
+    async def iter_teams(self) -> AsyncIterator["AsyncTeam"]:
+        async for result in self.gitea.requests_iter_paginated(
+            "/user/teams", sudo=self
+        ):
+            yield AsyncTeam.parse_response(self.gitea, result)
+
+    async def get_accessible_repos(self) -> List["AsyncRepository"]:
+        """Get all Repositories accessible by the logged in User."""
+        results = await self.gitea.requests_get_paginated("/user/repos", sudo=self)
+        return [
+            AsyncRepository.parse_response(self.gitea, result) for result in results
+        ]
+
+    async def iter_accessible_repos(self) -> AsyncIterator["AsyncRepository"]:
+        async for result in self.gitea.requests_iter_paginated(
+            "/user/repos", sudo=self
+        ):
+            yield AsyncRepository.parse_response(self.gitea, result)
+
+    async def get_key_by_id(self, key_id: str) -> "AsyncKey":
+        for _key in await self.get_keys():
+            if _key.id == key_id:
+                return _key
+
+    async def get_key_by_name(self, key_name: str) -> "AsyncKey":
+        for _key in await self.get_keys():
+            if _key.title == key_name:
+                return _key
+
+    async def get_keys(self) -> List["AsyncKey"]:
+        """Get all the Keys of this user."""
+        results = await self.gitea.requests_get_paginated(
+            User.USER_KEYS % self.username
+        )
+        self._keys = [AsyncKey.parse_response(self.gitea, result) for result in results]
+        return self._keys
+
+    async def get_emails(self) -> List[str]:
+        """Get all the email addresses of this user."""
+        result = await self.gitea.requests_get(User.USER_MAIL % self.login)
+        self._emails = []
+        for mail in result:
+            self._emails.append(mail["email"])
+            if mail["primary"]:
+                self._email = mail["email"]
+        return self._emails
+
+    async def delete(self):
+        """Deletes this User. Also deletes all Repositories he owns."""
+        await self.gitea.requests_delete(User.ADMIN_DELETE_USER % self.username)
+        self._uncache()
+        self.deleted = True
+
+    async def get_heatmap(self) -> List[Tuple[datetime, int]]:
+        results = await self.gitea.requests_get(User.USER_HEATMAP % self.username)
+        results = [
+            (datetime.fromtimestamp(result["timestamp"]), result["contributions"])
+            for result in results
+        ]
+        return results
+
+
+class AsyncKey(_AsyncRequestMixin, Key):
+    """Key with awaitable requests, see `Key`."""
+
+    _fields_to_parsers = {
+        **Key._fields_to_parsers,
+        "user": lambda gitea, r: AsyncUser.parse_nested(gitea, r),
+    }
+
+    @classmethod
+    async def request(cls, gitea: "AsyncGitea", key_id: str) -> "AsyncKey":
+        return await cls._request(gitea, {"key_id": key_id})
+
+    async def delete(self):
+        """See `Key.delete`."""
+        await self.gitea.requests_delete(
+            Key.ADMIN_DELETE_KEY % (self.user.username, self.id)
+        )
+        self.deleted = True
+
+
+class AsyncComment(Comment):
+    """Comment obtained through an `AsyncGitea`, its user is an `AsyncUser`."""
+
+    _fields_to_parsers = {
+        **Comment._fields_to_parsers,
+        "user": lambda gitea, r: AsyncUser.parse_nested(gitea, r),
+    }
+
+
+class AsyncCommit(Commit):
+    """Commit obtained through an `AsyncGitea`, its author is an `AsyncUser`."""
+
+    _fields_to_parsers = {
+        # NOTE: api may return None for commiters that are no gitea users
+        "author": lambda gitea, u: AsyncUser.parse_nested(gitea, u)
+        if u
+        else None
+    }
+
+
+class AsyncRepository(_AsyncRequestMixin, Repository):
+    """Repository with awaitable requests, see `Repository`."""
+
+    _fields_to_parsers = {
+        **Repository._fields_to_parsers,
+        "owner": lambda gitea, r: AsyncOrganization.parse_nested(gitea, r)
+        if r["email"] == ""
+        else AsyncUser.parse_nested(gitea, r),
+    }
+
+    @classmethod
+    async def request(cls, gitea: "AsyncGitea", owner: str, name: str):
+        return await cls._request(gitea, {"owner": owner, "name": name})
+
+    @classmethod
+    def handle(
+            cls, gitea: "AsyncGitea", owner: Union[str, User, Organization], name: str
+    ) -> "AsyncRepository":
+        if isinstance(owner, str):
+            owner = AsyncUser.handle(gitea, owner)
+        return super().handle(gitea, owner, name)
+
+    async def commit(self):
+        with self._commit_dirty_fields() as values:
+            args = {"owner": self.owner.username, "name": self.name}
+            await self.gitea.requests_patch(self.API_OBJECT.format(**args), data=values)
+        self._recache()
+
+    async def get_branches(self) -> List["Branch"]:
+        """Get all the Branches of this Repository."""
+        results = await self.gitea.requests_get_paginated(
+            Repository.REPO_BRANCHES % (self.owner.username, self.name)
+        )
+        return [Branch.parse_response(self.gitea, result) for result in results]
+
+    async def iter_branches(self) -> AsyncIterator["Branch"]:
+        async for result in self.gitea.requests_iter_paginated(
+            Repository.REPO_BRANCHES % (self.owner.username, self.name)
+        ):
+            yield Branch.parse_response(self.gitea, result)
+
+    async def get_branch_by_name(self, branch_name: str) -> Branch:
+        return Branch.parse_response(
+            self.gitea,
+            await self.gitea.requests_get(
+                Repository.REPO_BRANCH.format(
+                    owner=self.owner.username, repo=self.name, branch=branch_name
+                )
+            ),
+        )
+
+    async def add_branch(self, create_from: Branch, new_name: str) -> Branch:
+        """Add a branch to the repository"""
+        # Note: will only work with gitea 1.13 or higher!
+        data = {"new_branch_name": new_name, "old_ref_name": create_from.name}
+        result = await self.gitea.requests_post(
+            Repository.REPO_BRANCHES % (self.owner.username, self.name), data=data
+        )
+        return Branch.parse_response(self.gitea, result)
+
+    async def delete_branch(self, branch_name: str):
+        await self.gitea.requests_delete(
+            Repository.REPO_BRANCH_DELETE.format(
+                owner=self.owner.username, repo=self.name, branch=branch_name
+            )
+        )
+
+    async def get_issues(
+            self,
+            state: str = "all",
+            type: str = None,
+            labels: Sequence[str] = None,
+            milestones: Sequence[Union[str, int, "Milestone"]] = None,
+            since: datetime = None,
+            before: datetime = None,
+            created_by: Union[User, str] = None,
+            assigned_by: Union[User, str] = None,
+    ) -> List["AsyncIssue"]:
+        """See `Repository.get_issues`."""
+        results = await self.gitea.requests_get_paginated(
+            Repository.REPO_ISSUES.format(owner=self.owner.username, repo=self.name),
+            params=self._get_issues_params(
+                state, type, labels, milestones, since, before, created_by, assigned_by
+            ),
+        )
+        return [self._parse_issue(result) for result in results]
+
+    async def iter_issues(
+            self,
+            state: str = "all",
+            type: str = None,
+            labels: Sequence[str] = None,
+            milestones: Sequence[Union[str, int, "Milestone"]] = None,
+            since: datetime = None,
+            before: datetime = None,
+            created_by: Union[User, str] = None,
+            assigned_by: Union[User, str] = None,
+    ) -> AsyncIterator["AsyncIssue"]:
+        async for result in self.gitea.requests_iter_paginated(
+            Repository.REPO_ISSUES.format(owner=self.owner.username, repo=self.name),
+            params=self._get_issues_params(
+                state, type, labels, milestones, since, before, created_by, assigned_by
+            ),
+        ):
+            yield self._parse_issue(result)
+
+    async def get_commits(
+            self, page_limit: int = 0, page_size: int = None
+    ) -> List["AsyncCommit"]:
+        """Get all the Commits of this Repository."""
+        try:
+            results = await self.gitea.requests_get_paginated(
+                Repository.REPO_COMMITS % (self.owner.username, self.name),
+                page_limit=page_limit,
+                page_size=page_size,
+            )
+        except ConflictRequestException as err:
+            logging.warning(err)
+            logging.warning(
+                "Repository %s/%s is Empty" % (self.owner.username, self.name)
+            )
+            results = []
+        return [AsyncCommit.parse_response(self.gitea, result) for result in results]
+
+    async def iter_commits(
+            self, page_limit: int = 0, page_size: int = None
+    ) -> AsyncIterator["AsyncCommit"]:
+        results = self.gitea.requests_iter_paginated(
+            Repository.REPO_COMMITS % (self.owner.username, self.name),
+            page_limit=page_limit,
+            page_size=page_size,
+        )
+        try:
+            async for result in results:
+                yield AsyncCommit.parse_response(self.gitea, result)
+        except ConflictRequestException as err:
+            logging.warning(err)
+            logging.warning(
+                "Repository %s/%s is Empty" % (self.owner.username, self.name)
+            )
+
+    async def get_commit_by_sha(self, sha: str) -> "AsyncCommit":
+        result = await self.gitea.requests_get(
+            self.REPO_COMMIT.format(owner=self.owner.username, repo=self.name, sha=sha)
+        )
+        return AsyncCommit.parse_response(self.gitea, result)
+
+    async def get_tree_of_a_repository(
+            self, sha: str, recursive: bool = False, page: int = 0, per_page: int = 0
+    ) -> "Tree":
+        data = {
+            "recursive": recursive,
+            "page": page,
+            "per_page": per_page
+        }
+        result = await self.gitea.requests_get(
+            self.REPO_TREE_OF_A_REPOSITORY.format(
+                owner=self.owner.username, repo=self.name, sha=sha
+            ),
+            params=data
+        )
+        return Tree.parse_response(self.gitea, result)
+
+    async def iter_tree_of_a_repository(
+            self, sha: str, recursive: bool = False, page: int = 0, per_page: int = 0
+    ) -> AsyncIterator["TreeContent"]:
+        """See `Repository.iter_tree_of_a_repository`."""
+        data = {
+            "recursive": recursive,
+            "page": page,
+            "per_page": per_page
+        }
+        async for result in self.gitea.requests_iter_stream(
+            self.REPO_TREE_OF_A_REPOSITORY.format(
+                owner=self.owner.username, repo=self.name, sha=sha
+            ),
+            params=data,
+            key="tree",
+        ):
+            yield TreeContent.parse_response(self.gitea, result)
+
+    async def get_issues_state(self, state) -> List["AsyncIssue"]:
+        """Get issues of state Issue.open or Issue.closed of a repository."""
+        assert state in [Issue.OPENED, Issue.CLOSED]
+        return await self.get_issues(state=state)
+
+    async def iter_issues_state(self, state) -> AsyncIterator["AsyncIssue"]:
+        assert state in [Issue.OPENED, Issue.CLOSED]
+        async for issue in self.iter_issues(state=state):
+            yield issue
+
+    def _parse_issue(self, result) -> "AsyncIssue":
+        issue = AsyncIssue.parse_response(self.gitea, result)
+        # adding data not contained in the issue answer
+        AsyncIssue._add_read_property("repo", self, issue)
+        AsyncIssue._add_read_property("owner", self.owner, issue)
+        issue._override_field("repository", self)
+        return issue
+
+    async def get_issue_comments(
+            self,
+            numbers: Iterable[int] = None,
+            since: datetime = None,
+            before: datetime = None,
+            page_size: int = None,
+    ) -> Dict[int, List["AsyncComment"]]:
+        """See `Repository.get_issue_comments`."""
+        numbers = None if numbers is None else set(numbers)
+        comments = {}
+        async for result in self.gitea.requests_iter_paginated(
+            Issue.GET_COMMENTS % (self.owner.username, self.name),
+            Util.get_time_range_params(since, before),
+            page_size=page_size,
+        ):
+            number = Comment.get_issue_number(result["issue_url"])
+            if numbers is None or number in numbers:
+                comment = AsyncComment.parse_response(self.gitea, result)
+                comments.setdefault(number, []).append(comment)
+        return comments
+
+    async def get_times(self):
+        return await self.gitea.requests_get(
+            Repository.REPO_TIMES % (self.owner.username, self.name)
+        )
+
+    async def get_user_time(self, username) -> float:
+        if isinstance(username, User):
+            username = username.username
+        results = await self.gitea.requests_get(
+            Repository.REPO_USER_TIME % (self.owner.username, self.name, username)
+        )
+        return sum(r["time"] for r in results)
+
+    async def create_issue(
+            self, title, assignees=frozenset(), description=""
+    ) -> "AsyncIssue":
+        data = {
+            "assignees": assignees,
+            "body": description,
+            "closed": False,
+            "title": title,
+        }
+        result = await self.gitea.requests_post(
+            Repository.REPO_ISSUES.format(owner=self.owner.username, repo=self.name),
+            data=data,
+        )
+        issue = AsyncIssue.parse_response(self.gitea, result)
+        issue._override_field("repository", self)
+        return issue
+
+    async def create_milestone(
+            self,
+            title: str,
+            description: str,
+            due_date: str = None,
+            state: str = "open",
+    ) -> "Milestone":
+        url = Repository.REPO_MILESTONES.format(
+            owner=self.owner.username, repo=self.name
+        )
+        data = {"title": title, "description": description, "state": state}
+        if due_date:
+            data["due_date"] = due_date
+        result = await self.gitea.requests_post(url, data=data)
+        return Milestone.parse_response(self.gitea, result)
+
+    async def create_gitea_hook(self, hook_url: str, events: List[str]):
+        url = f"/repos/{self.owner.username}/{self.name}/hooks"
+        data = {
+            "type": "gitea",
+            "config": {"content_type": "json", "url": hook_url},
+            "events": events,
+            "active": True,
+        }
+        return await self.gitea.requests_post(url, data=data)
+
+    async def list_hooks(self):
+        url = f"/repos/{self.owner.username}/{self.name}/hooks"
+        return await self.gitea.requests_get_paginated(url)
+
+    async def iter_hooks(self) -> AsyncIterator[Dict]:
+        url = f"/repos/{self.owner.username}/{self.name}/hooks"
+        async for result in self.gitea.requests_iter_paginated(url):
+            yield result
+
+    async def delete_hook(self, id: str):
+        url = f"/repos/{self.owner.username}/{self.name}/hooks/{id}"
+        await self.gitea.requests_delete(url)
+
+    async def is_collaborator(self, username) -> bool:
+        if isinstance(username, User):
+            username = username.username
+        try:
+            # returns 204 if its ok, 404 if its not
+            await self.gitea.requests_get(
+                Repository.REPO_IS_COLLABORATOR
+                % (self.owner.username, self.name, username)
+            )
+            return True
+        except Exception:
+            return False
+
+    async def get_collaborators(self) -> List["AsyncUser"]:
+        url = f"/repos/{self.owner.username}/{self.name}/collaborators"
+        response = await self.gitea.requests_get_paginated(url)
+        return [AsyncUser.parse_response(self.gitea, user) for user in response]
+
+    async def get_users_with_access(
+            self, access_matrix: AccessMatrix = None
+    ) -> Sequence["AsyncUser"]:
+        """See `Repository.get_users_with_access`."""
+        # the owner of a handle may only stand in for it, see `Repository.handle`
+        await self.load()
+        owner = self.owner
+        if access_matrix is not None and isinstance(owner, Organization):
+            return access_matrix.get_users(self)
+        collabs = await self.get_collaborators()
+        if isinstance(owner, User):
+            return collabs + [owner]
+        # owner must be org, look up the teams concurrently
+        teams = await owner.get_teams()
+        team_repos = await asyncio.gather(*(team.get_repos() for team in teams))
+        teams = [
+            team
+            for team, repos in zip(teams, team_repos)
+            if self.name in [n.name for n in repos]
+        ]
+        for members in await asyncio.gather(*(team.get_members() for team in teams)):
+            collabs += members
+        return collabs
+
+    async def remove_collaborator(self, user_name: str):
+        url = f"/repos/{self.owner.username}/{self.name}/collaborators/{user_name}"
+        await self.gitea.requests_delete(url)
+
+    async def transfer_ownership(
+            self,
+            new_owner: Union["User", "Organization"],
+            new_teams: Set["Team"] = frozenset(),
+    ):
+        url = Repository.REPO_TRANSFER.format(owner=self.owner.username, repo=self.name)
+        data = {"new_owner": new_owner.username}
+        if isinstance(new_owner, AsyncOrganization):
+            owner_teams = await new_owner.get_teams()
+            data["team_ids"] = [team.id for team in new_teams if team in owner_teams]
+        await self.gitea.requests_post(url, data=data)
+        self._uncache()
+
+    async def get_git_content(
+            self, ref: "Commit" or "Branch" = None
+    ) -> List["Content"]:
+        """https://try.gitea.io/api/swagger#/repository/repoGetContentsList"""
+        url = f"/repos/{self.owner.username}/{self.name}/contents"
+        data = {}
+        if ref:
+            if isinstance(ref, Commit):
+                data = {"ref": ref.sha}
+            elif isinstance(ref, Branch):
+                data = {"ref": ref.name}
+        return [
+            Content.parse_response(self.gitea, f)
+            for f in await self.gitea.requests_get(url, data)
+        ]
+
+    async def get_file_content_by_path(
+            self, content_path: str, ref: "Commit" or "Branch" = None
+    ) -> Union[str, List["Content"]]:
+        result = await self.get_file_metadata(content_path, ref)
+        if isinstance(result, dict) and result.get("type", "") == Content.FILE:
+            if encoding := result.get("encoding", None):
+                match encoding:
+                    case "base64":
+                        return base64.b64decode(result.get("content", "")).decode(
+                            "utf-8"
+                        )
+            else:
+                return result.get("content", "")
+
+        else:
+            return [Content.parse_response(self.gitea, f) for f in result]
+
+    async def get_file_metadata(
+            self, content_path: str, ref: "Commit" or "Branch" = None
+    ) -> Dict:
+        url = Repository.REPO_FILE.format(
+            owner=self.owner.username, repo=self.name, filepath=content_path
+        )
+        data = {}
+        if ref:
+            if isinstance(ref, Commit):
+                data = {"ref": ref.sha}
+            elif isinstance(ref, Branch):
+                data = {"ref": ref.name}
+        return await self.gitea.requests_get(url, data)
+
+    async def get_file_sha(
+            self, content_path: str, ref: "Commit" or "Branch" = None
+    ) -> str:
+        result = await self.get_file_metadata(content_path, ref)
+        return result.get("sha", "")
+
+    async def get_file_content(
+            self, content: "Content", ref: "Commit" or "Branch" = None
+    ) -> Union[str, List["Content"]]:
+        """https://try.gitea.io/api/swagger#/repository/repoGetContents"""
+        return await self.get_file_content_by_path(content.path, ref)
+
+    async def create_file(self, file_path: str, content: str, data: dict = None):
+        """https://try.gitea.io/api/swagger#/repository/repoCreateFile"""
+        if not data:
+            data = {}
+        url = Repository.REPO_FILE.format(
+            owner=self.owner.username, repo=self.name, filepath=file_path
+        )
+        data.update({"content": content})
+        return await self.gitea.requests_post(url, data)
+
+    async def change_file(
+            self, file_path: str, file_sha: str, content: str, data: dict = None
+    ):
+        """https://try.gitea.io/api/swagger#/repository/repoCreateFile"""
+        if not data:
+            data = {}
+        url = Repository.REPO_FILE.format(
+            owner=self.owner.username, repo=self.name, filepath=file_path
+        )
+        data.update({"sha": file_sha, "content": content})
+        return await self.gitea.requests_put(url, data)
+
+    async def rename(self, new_name: str):
+        await self.edit_properties({"name": new_name})
+
+    async def edit_properties(self, data: dict = None):
+        args = {"owner": self.owner.username, "name": self.name}
+        await self.gitea.requests_patch(self.API_OBJECT.format(**args), data=data)
+        self._uncache()
+
+    async def delete(self):
+        await self.gitea.requests_delete(
+            Repository.REPO_DELETE % (self.owner.username, self.name)
+        )
+        self._uncache()
+        self.deleted = True
+
+    @classmethod
+    async def migrate_repo(
+            cls,
+            gitea: "AsyncGitea",
+            service: str,
+            clone_addr: str,
+            repo_name: str,
+            description: str = "",
+            private: bool = False,
+            auth_token: str = None,
+            auth_username: str = None,
+            auth_password: str = None,
+            mirror: bool = False,
+            mirror_interval: str = None,
+            lfs: bool = False,
+            lfs_endpoint: str = "",
+            wiki: bool = False,
+            labels: bool = False,
+            issues: bool = False,
+            pull_requests: bool = False,
+            releases: bool = False,
+            milestones: bool = False,
+            repo_owner: str = None,
+    ) -> "AsyncRepository":
+        """Migrate a Repository from another service.
+
+        Throws:
+            AlreadyExistsException: If the Repository exists already.
+            Exception: If something else went wrong.
+        """
+        result = await gitea.requests_post(
+            cls.REPO_MIGRATE,
+            data={
+                "auth_password": auth_password,
+                "auth_token": auth_token,
+                "auth_username": auth_username,
+                "clone_addr": clone_addr,
+                "description": description,
+                "issues": issues,
+                "labels": labels,
+                "lfs": lfs,
+                "lfs_endpoint": lfs_endpoint,
+                "milestones": milestones,
+                "mirror": mirror,
+                "mirror_interval": mirror_interval,
+                "private": private,
+                "pull_requests": pull_requests,
+                "releases": releases,
+                "repo_name": repo_name,
+                "repo_owner": repo_owner,
+                "service": service,
+                "wiki": wiki,
+            },
+        )
+        if "id" in result:
+            gitea.logger.info(
+                "Successfully created Job to Migrate Repository %s " % result["name"]
+            )
+        else:
+            gitea.logger.error(result["message"])
+            raise Exception(
+                "Repository not Migrated... (gitea: %s)" % result["message"]
+            )
+        return AsyncRepository.parse_response(gitea, result)
+
+
+class AsyncIssue(_AsyncRequestMixin, Issue):
+    """Issue with awaitable requests, see `Issue`.
+
+    The `repository` field is filled with the `AsyncRepository` the issue was
+    obtained through; for issues not obtained via a repository it holds the
+    RepositoryMeta record as sent by gitea.
+    """
+
+    _fields_to_parsers = {
+        **Issue._fields_to_parsers,
+        "user": lambda gitea, u: AsyncUser.parse_nested(gitea, u),
+        "assignee": lambda gitea, u: AsyncUser.parse_nested(gitea, u),
+        "assignees": lambda gitea, us: [AsyncUser.parse_nested(gitea, u) for u in us],
+    }
+
+    def _resolve_repository(self, meta: Dict) -> Dict:
+        # a repository can not be requested by a property, see class docstring
+        return meta
+
+    async def commit(self):
+        with self._commit_dirty_fields() as values:
+            owner, repo = self._get_repository_names()
+            args = {"owner": owner, "repo": repo, "index": self.number}
+            await self.gitea.requests_patch(
+                Issue.API_OBJECT.format(**args), data=values
+            )
+
+    @classmethod
+    async def request(cls, gitea: "AsyncGitea", owner: str, repo: str, number: str):
+        api_object, repository = await asyncio.gather(
+            cls._request(gitea, {"owner": owner, "repo": repo, "index": number}),
+            AsyncRepository.request(gitea, owner, repo),
+        )
+        api_object._override_field("repository", repository)
+        return api_object
+
+    @classmethod
+    async def create_issue(
+            cls, gitea, repo: AsyncRepository, title: str, body: str = ""
+    ) -> "AsyncIssue":
+        args = {"owner": repo.owner.username, "repo": repo.name}
+        data = {"title": title, "body": body}
+        result = await gitea.requests_post(Issue.CREATE_ISSUE.format(**args), data=data)
+        issue = AsyncIssue.parse_response(gitea, result)
+        issue._override_field("repository", repo)
+        return issue
+
+    async def get_time_sum(self, user: User) -> int:
+        results = await self.gitea.requests_get(
+            Issue.GET_TIME % (*self._get_repository_names(), self.number)
+        )
+        return sum(
+            result["time"]
+            for result in results
+            if result and result["user_id"] == user.id
+        )
+
+    async def get_times(self) -> Optional[Dict]:
+        return await self.gitea.requests_get(
+            Issue.GET_TIME % (*self._get_repository_names(), self.number)
+        )
+
+    async def delete_time(self, time_id: str):
+        owner, repo = self._get_repository_names()
+        path = f"/repos/{owner}/{repo}/issues/{self.number}/times/{time_id}"
+        await self.gitea.requests_delete(path)
+
+    async def add_time(self, time: int, created: str = None, user_name: User = None):
+        owner, repo = self._get_repository_names()
+        path = f"/repos/{owner}/{repo}/issues/{self.number}/times"
+        await self.gitea.requests_post(
+            path, data={"created": created, "time": int(time), "user_name": user_name}
+        )
+
+    async def get_comments(
+            self, since: datetime = None, before: datetime = None
+    ) -> List["AsyncComment"]:
+        """See `Issue.get_comments`."""
+        results = await self.gitea.requests_get(
+            Issue.GET_ISSUE_COMMENTS % (*self._get_repository_names(), self.number),
+            Util.get_time_range_params(since, before),
+        )
+        return [AsyncComment.parse_response(self.gitea, result) for result in results]
+
+
+class AsyncTeam(_AsyncRequestMixin, Team):
+    """Team with awaitable requests, see `Team`."""
+
+    _fields_to_parsers = {
+        "organization": lambda gitea, o: AsyncOrganization.parse_nested(gitea, o)
+    }
+
+    @classmethod
+    async def request(cls, gitea: "AsyncGitea", id: int) -> "AsyncTeam":
+        return await cls._request(gitea, {"id": id})
+
+    async def commit(self):
+        with self._commit_dirty_fields() as values:
+            args = {"id": self.id}
+            await self.gitea.requests_patch(self.API_OBJECT.format(**args), data=values)
+        self._recache()
+
+    async def add_user(self, user: User):
+        """https://try.gitea.io/api/swagger#/organization/orgAddTeamMember"""
+        url = f"/teams/{self.id}/members/{user.login}"
+        await self.gitea.requests_put(url)
+
+    async def add_repo(self, org: Organization, repo: Repository):
+        await self.gitea.requests_put(
+            Team.ADD_REPO % (self.id, org.username, repo.name)
+        )
+
+    async def get_members(self) -> List[AsyncUser]:
+        """Get all users assigned to the team."""
+        results = await self.gitea.requests_get_paginated(Team.GET_MEMBERS % self.id)
+        return [AsyncUser.parse_response(self.gitea, result) for result in results]
+
+    async def iter_members(self) -> AsyncIterator[AsyncUser]:
+        async for result in self.gitea.requests_iter_paginated(
+            Team.GET_MEMBERS % self.id
+        ):
+            yield AsyncUser.parse_response(self.gitea, result)
+
+    async def get_repos(self) -> List[AsyncRepository]:
+        """Get all repos of this Team."""
+        results = await self.gitea.requests_get_paginated(Team.GET_REPOS % self.id)
+        return [
+            AsyncRepository.parse_response(self.gitea, result) for result in results
+        ]
+
+    async def iter_repos(self) -> AsyncIterator[AsyncRepository]:
+        async for result in self.gitea.requests_iter_paginated(
+            Team.GET_REPOS % self.id
+        ):
+            yield AsyncRepository.parse_response(self.gitea, result)
+
+    async def delete(self):
+        await self.gitea.requests_delete(Team.TEAM_DELETE % self.id)
+        self._uncache()
+        self.deleted = True
+
+    async def remove_team_member(self, user_name: str):
+        url = f"/teams/{self.id}/members/{user_name}"
+        await self.gitea.requests_delete(url)
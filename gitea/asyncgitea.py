@@ -0,0 +1,986 @@
+import asyncio
+from datetime import datetime
+from typing import (
+    List,
+    Dict,
+    Union,
+    AsyncIterator,
+    Optional,
+    Sequence,
+    Iterable,
+    Tuple,
+)
+
+from frozendict import frozendict
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from .batch import BatchItem, BatchReport, run_batch_async
+from .cache import ResponseCache, ObjectCache
+from .codec import JsonArrayStream, JsonCodec
+from .apiobject import User, Repository, Issue
+from .asyncapiobject import (
+    AsyncUser,
+    AsyncOrganization,
+    AsyncRepository,
+    AsyncTeam,
+    AsyncIssue,
+)
+from .exceptions import (
+    ConflictRequestException,
+    NotFoundRequestException,
+    ApiValidationRequestException,
+    AlreadyExistsRequestException,
+    RequestException,
+)
+from .gitea import Gitea
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is an optional dependency (gipea[async])
+    aiohttp = None
+
+
+class AsyncGitea(Gitea):
+    """Object to establish an asyncio session with Gitea.
+
+    All request methods of `Gitea` are coroutines here, so that many requests can
+    be in flight on one event loop. Answers are checked with the same response
+    code mapping and parsed into the same api objects as with `Gitea`; the
+    objects returned are the awaitable variants from `gitea.asyncapiobject`.
+
+    The underlying aiohttp session is created on first use and has to be closed
+    with `close` or by using the client as an async context manager:
+
+        async with AsyncGitea(URL, TOKEN) as gitea:
+            repos = await asyncio.gather(
+                *(AsyncRepository.request(gitea, owner, name) for owner, name in keys)
+            )
+    """
+
+    def __init__(
+        self,
+        gitea_url: str,
+        token_text=None,
+        auth=None,
+        verify=True,
+        log_level="INFO",
+        parallel_pagination: bool = False,
+        page_size: int = None,
+        response_cache: ResponseCache = None,
+        object_cache: ObjectCache = None,
+        max_connections: int = 100,
+        codec: JsonCodec = None,
+        stream_pages: bool = False,
+        keep_alive: bool = True,
+        compress_requests: int = None,
+    ):
+        """Initializing AsyncGitea-instance
+
+        Args:
+            gitea_url (str): The Gitea instance URL.
+            token_text (str, None): The access token, by default None.
+            auth (tuple, None): The user credentials
+                `(username, password)`, by default None.
+            verify (bool): If True, allow insecure server connections
+                when using SSL.
+            log_level (str): The log level, by default `INFO`.
+            parallel_pagination (bool): If True, paginated requests fetch their
+                pages concurrently, by default False.
+            page_size (int, None): The number of results requested per page by
+                paginated requests, see `Gitea`.
+            response_cache (ResponseCache, None): Cache for GET requests, see
+                `Gitea`.
+            object_cache (ObjectCache, None): Identity map for api objects, see
+                `Gitea`.
+            max_connections (int): Upper bound of simultaneously open
+                connections, by default 100.
+            codec (JsonCodec, None): Encoder and decoder of the JSON bodies, see
+                `Gitea`.
+            stream_pages (bool): If True, the pages of the `iter_*` methods are
+                decoded while they are received, see `Gitea`.
+            keep_alive (bool): If False, connections are closed after each
+                request, by default True.
+            compress_requests (int, None): Request bodies of at least this many
+                bytes are sent gzip compressed, see `Gitea`.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncGitea requires aiohttp, install it with "
+                "`pip install gipea[async]`"
+            )
+        super().__init__(
+            gitea_url,
+            token_text,
+            auth,
+            verify,
+            log_level,
+            parallel_pagination=parallel_pagination,
+            page_size=page_size,
+            response_cache=response_cache,
+            object_cache=object_cache,
+            codec=codec,
+            stream_pages=stream_pages,
+            keep_alive=keep_alive,
+            compress_requests=compress_requests,
+        )
+        self.max_connections = max_connections
+        self._auth = aiohttp.BasicAuth(*auth) if auth else None
+        self._verify = verify
+        # the aiohttp session, created on first use; `requests` stays the requests
+        # session of `Gitea`
+        self._aiohttp_session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        if self._aiohttp_session is not None:
+            await self._aiohttp_session.close()
+            self._aiohttp_session = None
+
+    def _get_session(self):
+        if self._aiohttp_session is None or self._aiohttp_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                ssl=None if self._verify else False,
+                force_close=not self.keep_alive,
+            )
+            self._aiohttp_session = aiohttp.ClientSession(
+                connector=connector, auth=self._auth
+            )
+        return self._aiohttp_session
+
+    @staticmethod
+    def _to_response(client_response, content: bytes) -> Response:
+        """Wraps an aiohttp answer into a `requests.Response`, so that response code
+        handling and parsing is shared with `Gitea`."""
+        response = Response()
+        response.status_code = client_response.status
+        response.reason = client_response.reason
+        response.url = str(client_response.url)
+        response.headers = CaseInsensitiveDict(client_response.headers)
+        response.encoding = client_response.charset or "utf-8"
+        response._content = content
+        return response
+
+    @staticmethod
+    def _clean_params(params) -> dict:
+        # aiohttp only accepts str/int/float query values, requests drops None
+        cleaned = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            cleaned[key] = value
+        return cleaned
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params=frozendict(),
+        data: dict = None,
+        headers=frozendict(),
+    ) -> Response:
+        session = self._get_session()
+        body, combined_headers = None, self.headers
+        if data is not None:
+            body, combined_headers = self._get_body(data)
+        if headers:
+            combined_headers = {**combined_headers, **headers}
+        async with session.request(
+            method,
+            self._get_url(endpoint),
+            headers=combined_headers,
+            params=self._clean_params(params),
+            data=body,
+        ) as client_response:
+            content = await client_response.read()
+            return self._to_response(client_response, content)
+
+    async def _requests_get_response(
+        self, endpoint: str, params=frozendict(), sudo=None, headers=frozendict()
+    ) -> Response:
+        combined_params = {}
+        combined_params.update(params)
+        if sudo:
+            combined_params["sudo"] = sudo.username
+        response = await self._request(
+            "GET", endpoint, params=combined_params, headers=headers
+        )
+        self._handle_response_code(response, [200, 201, 304] if headers else None)
+        return response
+
+    async def _requests_get_result(
+        self, endpoint: str, params=frozendict(), sudo=None
+    ):
+        """See `Gitea._requests_get_result`."""
+        if self.response_cache is None:
+            response = await self._requests_get_response(endpoint, params, sudo)
+            return self.parse_result(response), response.headers
+        combined_params = {}
+        combined_params.update(params)
+        if sudo:
+            combined_params["sudo"] = sudo.username
+        key = self.response_cache.get_key(self.url + endpoint, combined_params)
+        entry = self.response_cache.get(key)
+        response = await self._requests_get_response(
+            endpoint, combined_params, headers=self.response_cache.get_validators(entry)
+        )
+        return self.response_cache.resolve(key, entry, response, self.parse_result)
+
+    async def requests_get(self, endpoint: str, params=frozendict(), sudo=None):
+        return (await self._requests_get_result(endpoint, params, sudo))[0]
+
+    async def requests_iter_stream(
+        self, endpoint: str, params=frozendict(), sudo=None, key: str = None
+    ):
+        """Asynchronous generator version of `Gitea.requests_iter_stream`."""
+        combined_params = {}
+        combined_params.update(params)
+        if sudo:
+            combined_params["sudo"] = sudo.username
+        session = self._get_session()
+        async with session.get(
+            self._get_url(endpoint),
+            headers=self.headers,
+            params=self._clean_params(combined_params),
+        ) as client_response:
+            if client_response.status not in (200, 201):
+                content = await client_response.read()
+                self._handle_response_code(
+                    self._to_response(client_response, content)
+                )
+            stream = JsonArrayStream(key)
+            async for chunk in client_response.content.iter_chunked(
+                Gitea.STREAM_CHUNK_SIZE
+            ):
+                for result in stream.feed(chunk):
+                    yield result
+            for result in stream.close():
+                yield result
+
+    async def requests_get_paginated(
+        self,
+        endpoint: str,
+        params=frozendict(),
+        sudo=None,
+        page_key: str = "page",
+        page_limit: int = 0,
+        parallel: bool = None,
+        page_size: int = None,
+    ):
+        """See `Gitea.requests_get_paginated`, in parallel mode the remaining pages
+        are requested concurrently on the event loop."""
+        if parallel is None:
+            parallel = self.parallel_pagination
+        page = 1
+        combined_params = await self._get_paginated_params(params, page_size)
+        aggregated_result = []
+        if parallel:
+            combined_params[page_key] = page
+            aggregated_result, headers = await self._requests_get_result(
+                endpoint, combined_params, sudo
+            )
+            if not aggregated_result:
+                return []
+            page_count = self._get_page_count(headers, aggregated_result, page_limit)
+            if page_count is not None:
+                results = await asyncio.gather(
+                    *(
+                        self.requests_get(
+                            endpoint, {**combined_params, page_key: page}, sudo
+                        )
+                        for page in range(2, page_count + 1)
+                    )
+                )
+                for result in results:
+                    aggregated_result.extend(result)
+                return aggregated_result
+            page += 1
+        while not page_limit or page <= page_limit:
+            combined_params[page_key] = page
+            result = await self.requests_get(endpoint, combined_params, sudo)
+            if not result:
+                return aggregated_result
+            aggregated_result.extend(result)
+            page += 1
+        return aggregated_result
+
+    async def requests_iter_paginated(
+        self,
+        endpoint: str,
+        params=frozendict(),
+        sudo=None,
+        page_key: str = "page",
+        page_limit: int = 0,
+        page_size: int = None,
+        stream: bool = None,
+        data_key: str = None,
+    ):
+        """Asynchronous generator version of `Gitea.requests_iter_paginated`."""
+        if stream is None:
+            stream = self.stream_pages
+        page = 1
+        combined_params = await self._get_paginated_params(params, page_size)
+        if stream:
+            async for result in self._iter_pages_streamed(
+                endpoint, combined_params, sudo, page_key, page_limit, data_key
+            ):
+                yield result
+            return
+        while not page_limit or page <= page_limit:
+            combined_params[page_key] = page
+            result = await self.requests_get(endpoint, combined_params, sudo)
+            if data_key is not None:
+                # a copy, the page may be shared with the response cache
+                result = list(result[data_key])
+            if not result:
+                return
+            result.reverse()
+            while result:
+                yield result.pop()
+            page += 1
+
+    async def _iter_pages_streamed(
+        self,
+        endpoint: str,
+        params=frozendict(),
+        sudo=None,
+        page_key: str = "page",
+        page_limit: int = 0,
+        data_key: str = None,
+    ):
+        """See `Gitea._iter_pages_streamed`."""
+        combined_params = {}
+        combined_params.update(params)
+        page = 1
+        while not page_limit or page <= page_limit:
+            combined_params[page_key] = page
+            empty = True
+            async for result in self.requests_iter_stream(
+                endpoint, combined_params, sudo, data_key
+            ):
+                empty = False
+                yield result
+            if empty:
+                return
+            page += 1
+
+    async def _get_paginated_params(self, params, page_size: int = None) -> dict:
+        combined_params = {}
+        combined_params.update(params)
+        if "limit" not in combined_params:
+            limit = await self._get_page_size(page_size)
+            if limit:
+                combined_params["limit"] = limit
+        return combined_params
+
+    async def _get_page_size(self, page_size: int = None) -> Optional[int]:
+        if page_size:
+            return page_size
+        if self.page_size is not None:
+            return self.page_size or None
+        return self._get_max_page_size(await self.get_api_settings())
+
+    async def get_api_settings(self) -> dict:
+        """See `Gitea.get_api_settings`."""
+        if self._api_settings is None:
+            try:
+                self._api_settings = await self.requests_get(Gitea.GET_API_SETTINGS)
+            except RequestException as e:
+                self.logger.warning("Could not get api settings: %s", e)
+                self._api_settings = {}
+        return self._api_settings
+
+    async def requests_put(self, endpoint: str, data: dict = None):
+        if not data:
+            data = {}
+        response = await self._request("PUT", endpoint, data=data)
+        self._handle_response_code(response, [200, 204])
+
+    async def requests_delete(self, endpoint: str):
+        response = await self._request("DELETE", endpoint)
+        self._handle_response_code(response, [204])
+
+    async def requests_post(self, endpoint: str, data: dict):
+        response = await self._request("POST", endpoint, data=data)
+        self._handle_response_code(response, [200, 201, 202])
+        return self.parse_result(response)
+
+    async def requests_patch(self, endpoint: str, data: dict):
+        response = await self._request("PATCH", endpoint, data=data)
+        self._handle_response_code(response, [200, 201])
+        return self.parse_result(response)
+
+    async def get_orgs_public_members_all(self, orgname):
+        path = "/orgs/" + orgname + "/public_members"
+        return await self.requests_get(path)
+
+    async def get_orgs(self) -> List[AsyncOrganization]:
+        path = "/admin/orgs"
+        results = await self.requests_get_paginated(path)
+        return [AsyncOrganization.parse_response(self, result) for result in results]
+
+    async def iter_orgs(self) -> AsyncIterator[AsyncOrganization]:
+        """Yields all Organizations, requesting them page by page."""
+        async for result in self.requests_iter_paginated("/admin/orgs"):
+            yield AsyncOrganization.parse_response(self, result)
+
+    async def get_user(self) -> AsyncUser:
+        result = await self.requests_get(Gitea.GET_USER)
+        return AsyncUser.parse_response(self, result)
+
+    async def get_repo(self, username, repoName) -> AsyncRepository:
+        result = await self.requests_get(Gitea.GET_REPO % (username, repoName))
+        return AsyncRepository.parse_response(self, result)
+
+    async def prewarm(self, connections: int):
+        """See `Gitea.prewarm`."""
+        await asyncio.gather(
+            *(
+                self._requests_get_response(Gitea.GITEA_VERSION)
+                for _ in range(connections)
+            )
+        )
+
+    def repo(
+        self, owner: Union[str, User, AsyncOrganization], name: str
+    ) -> AsyncRepository:
+        """See `Gitea.repo`. Fields other than the identity can only be read
+        after `await handle.load()`."""
+        return AsyncRepository.handle(self, owner, name)
+
+    def user(self, name: str) -> AsyncUser:
+        return AsyncUser.handle(self, name)
+
+    def org(self, name: str) -> AsyncOrganization:
+        return AsyncOrganization.handle(self, name)
+
+    def team(self, id: int) -> AsyncTeam:
+        return AsyncTeam.handle(self, id)
+
+    async def get_repos_many(
+        self, keys: Iterable[Union[str, Tuple[str, str]]], max_workers: int = None
+    ) -> BatchReport:
+        """See `Gitea.get_repos_many`, by default up to `max_connections`
+        requests are in flight."""
+
+        async def request(key):
+            return BatchItem.FOUND, await AsyncRepository.request(self, *key)
+
+        return await run_batch_async(
+            request,
+            [self._get_repo_key(key) for key in keys],
+            max_workers or self.max_connections,
+            errors=(NotFoundRequestException,),
+        )
+
+    async def get_users_many(
+        self, names: Iterable[str], max_workers: int = None
+    ) -> BatchReport:
+        """See `get_repos_many`."""
+
+        async def request(name):
+            return BatchItem.FOUND, await AsyncUser.request(self, name)
+
+        return await run_batch_async(
+            request,
+            names,
+            max_workers or self.max_connections,
+            errors=(NotFoundRequestException,),
+        )
+
+    async def get_orgs_many(
+        self, names: Iterable[str], max_workers: int = None
+    ) -> BatchReport:
+        """See `get_repos_many`."""
+
+        async def request(name):
+            return BatchItem.FOUND, await AsyncOrganization.request(self, name)
+
+        return await run_batch_async(
+            request,
+            names,
+            max_workers or self.max_connections,
+            errors=(NotFoundRequestException,),
+        )
+
+    async def get_teams_many(
+        self, ids: Iterable[int], max_workers: int = None
+    ) -> BatchReport:
+        """See `get_repos_many`."""
+
+        async def request(id):
+            return BatchItem.FOUND, await AsyncTeam.request(self, id)
+
+        return await run_batch_async(
+            request,
+            ids,
+            max_workers or self.max_connections,
+            errors=(NotFoundRequestException,),
+        )
+
+    async def get_version(self) -> str:
+        result = await self.requests_get(Gitea.GITEA_VERSION)
+        return result["version"]
+
+    async def get_users(self) -> List[AsyncUser]:
+        results = await self.requests_get_paginated(Gitea.GET_USERS_ADMIN)
+        return [AsyncUser.parse_response(self, result) for result in results]
+
+    async def iter_users(self) -> AsyncIterator[AsyncUser]:
+        """Yields all Users, requesting them page by page."""
+        async for result in self.requests_iter_paginated(Gitea.GET_USERS_ADMIN):
+            yield AsyncUser.parse_response(self, result)
+
+    async def get_user_by_email(
+        self, email: str, use_index: bool = False
+    ) -> Optional[AsyncUser]:
+        """See `Gitea.get_user_by_email`."""
+        async for user in self.search_users(email):
+            if user.email == email:
+                return user
+        if use_index:
+            return (await self.update_email_index()).get(email)
+        async for user in self.iter_users():
+            if user.email == email or email in await user.get_emails():
+                return user
+        return None
+
+    async def search_repos(
+        self,
+        query: str = None,
+        owner: Union[User, int] = None,
+        topic: bool = False,
+        include_description: bool = False,
+        private: bool = None,
+        archived: bool = None,
+        template: bool = None,
+        mode: str = None,
+        sort: str = None,
+        order: str = None,
+    ) -> AsyncIterator[AsyncRepository]:
+        """See `Gitea.search_repos`."""
+        params = self._get_search_repos_params(
+            query, owner, topic, include_description, private, archived, template,
+            mode, sort, order,
+        )
+        async for result in self.requests_iter_paginated(
+            Repository.REPO_SEARCH, params, data_key="data"
+        ):
+            yield AsyncRepository.parse_response(self, result)
+
+    async def search_users(self, query: str = None) -> AsyncIterator[AsyncUser]:
+        """See `Gitea.search_users`."""
+        params = {"q": query} if query else {}
+        async for result in self.requests_iter_paginated(
+            Gitea.SEARCH_USERS, params, data_key="data"
+        ):
+            yield AsyncUser.parse_response(self, result)
+
+    async def search_issues(
+        self,
+        query: str = None,
+        state: str = Issue.ALL,
+        type: str = None,
+        labels: Sequence[str] = None,
+        milestones: Sequence[str] = None,
+        since: datetime = None,
+        before: datetime = None,
+        owner: Union[User, str] = None,
+        team: str = None,
+        assigned: bool = False,
+        created: bool = False,
+        mentioned: bool = False,
+    ) -> AsyncIterator[AsyncIssue]:
+        """See `Gitea.search_issues`. The `repository` of the issues holds the
+        RepositoryMeta record, see `AsyncIssue`."""
+        params = self._get_search_issues_params(
+            query, state, type, labels, milestones, since, before, owner, team,
+            assigned, created, mentioned,
+        )
+        async for result in self.requests_iter_paginated(Gitea.SEARCH_ISSUES, params):
+            yield AsyncIssue.parse_response(self, result)
+
+    async def update_email_index(self, rebuild: bool = False) -> Dict[str, AsyncUser]:
+        """See `Gitea.update_email_index`, the addresses of the users not indexed
+        yet are requested concurrently."""
+        if rebuild or self._email_index is None:
+            self._email_index = {}
+            self._email_index_max_id = 0
+            self._email_index_user_count = None
+        _, headers = await self._requests_get_result(
+            Gitea.GET_USERS_ADMIN, {"page": 1, "limit": 1}
+        )
+        user_count = self._get_total_count(headers)
+        if user_count is not None and user_count == self._email_index_user_count:
+            return self._email_index
+        new_users = [
+            user
+            async for user in self.iter_users()
+            if user.id > self._email_index_max_id
+        ]
+        addresses = await asyncio.gather(*(user.get_emails() for user in new_users))
+        for user, user_addresses in zip(new_users, addresses):
+            for address in user_addresses:
+                self._email_index[address] = user
+            self._email_index[user.email] = user
+        self._email_index_max_id = max(
+            [self._email_index_max_id] + [user.id for user in new_users]
+        )
+        self._email_index_user_count = user_count
+        return self._email_index
+
+    async def get_user_by_name(self, username: str) -> Optional[AsyncUser]:
+        try:
+            return await AsyncUser.request(self, username)
+        except NotFoundRequestException:
+            return None
+
+    async def create_user(
+        self,
+        user_name: str,
+        email: str,
+        password: str,
+        full_name: str = None,
+        login_name: str = None,
+        change_pw=True,
+        send_notify=True,
+        source_id=0,
+    ) -> AsyncUser:
+        """Create User, see `Gitea.create_user`."""
+        if not login_name:
+            login_name = user_name
+        if not full_name:
+            full_name = user_name
+        request_data = {
+            "source_id": source_id,
+            "login_name": login_name,
+            "full_name": full_name,
+            "username": user_name,
+            "email": email,
+            "password": password,
+            "send_notify": send_notify,
+            "must_change_password": change_pw,
+        }
+
+        self.logger.debug("Gitea post payload: %s", request_data)
+        try:
+            result = await self.requests_post(
+                Gitea.ADMIN_CREATE_USER, data=request_data
+            )
+            if "id" in result:
+                self.logger.info(
+                    "Successfully created User %s <%s> (id %s)",
+                    result["login"],
+                    result["email"],
+                    result["id"],
+                )
+                self.logger.debug("Gitea response: %s", result)
+            else:
+                self.logger.error(result["message"])
+                raise Exception("User not created... (gitea: %s)" % result["message"])
+            return AsyncUser.parse_response(self, result)
+        except ApiValidationRequestException as e:
+            if "user already exists" in e.response.text:
+                raise AlreadyExistsRequestException(e.response)
+            raise e
+
+    async def create_repo(
+        self,
+        repoOwner: Union[AsyncUser, AsyncOrganization],
+        repoName: str,
+        description: str = "",
+        private: bool = False,
+        autoInit=True,
+        gitignores: str = None,
+        license: str = None,
+        readme: str = "Default",
+        issue_labels: str = None,
+        default_branch="master",
+        template=False
+    ) -> AsyncRepository:
+        """Create a Repository as the administrator, see `Gitea.create_repo`."""
+        try:
+            result = await self.requests_post(
+                Gitea.ADMIN_REPO_CREATE % repoOwner.username,
+                data={
+                    "name": repoName,
+                    "description": description,
+                    "private": private,
+                    "auto_init": autoInit,
+                    "gitignores": gitignores,
+                    "license": license,
+                    "issue_labels": issue_labels,
+                    "readme": readme,
+                    "default_branch": default_branch,
+                    "template": template,
+                },
+            )
+            if "id" in result:
+                self.logger.info("Successfully created Repository %s " % result["name"])
+            else:
+                self.logger.error(result["message"])
+                raise Exception(
+                    "Repository not created... (gitea: %s)" % result["message"]
+                )
+            return AsyncRepository.parse_response(self, result)
+        except ConflictRequestException as e:
+            if "The repository with the same name already exists" in e.response.text:
+                raise AlreadyExistsRequestException(e.response)
+            raise e
+
+    async def create_repo_with_template(
+            self,
+            repo_owner: Union[AsyncUser, AsyncOrganization],
+            repo_name: str,
+            template_owner: str,
+            template_repo: str,
+            description: str = "",
+            private: bool = False,
+            default_branch: str = "master",
+            avatar: bool = True,
+            topics: bool = True,
+            git_content: bool = True,
+            git_hooks: bool = True,
+            labels: bool = True,
+            webhooks: bool = True
+    ) -> AsyncRepository:
+        """Create a Repository from a template, see
+        `Gitea.create_repo_with_template`."""
+        try:
+            result = await self.requests_post(
+                Gitea.GENERATE_REPO_WITH_TEMPLATE % (template_owner, template_repo),
+                data={
+                    "avatar": avatar,
+                    "default_branch": default_branch,
+                    "description": description,
+                    "git_content": git_content,
+                    "git_hooks": git_hooks,
+                    "labels": labels,
+                    "name": repo_name,
+                    "owner": repo_owner.username,
+                    "private": private,
+                    "topics": topics,
+                    "webhooks": webhooks
+                },
+            )
+            if "id" in result:
+                self.logger.info("Successfully created Repository %s " % result["name"])
+            else:
+                self.logger.error(result["message"])
+                raise Exception(
+                    "Repository not created... (gitea: %s)" % result["message"]
+                )
+            return AsyncRepository.parse_response(self, result)
+        except ConflictRequestException as e:
+            if "The repository with the same name already exists" in e.response.text:
+                raise AlreadyExistsRequestException(e.response)
+            raise e
+
+    async def create_org(
+        self,
+        owner: AsyncUser,
+        orgName: str,
+        description: str,
+        location="",
+        website="",
+        full_name="",
+    ) -> AsyncOrganization:
+        try:
+            result = await self.requests_post(
+                Gitea.CREATE_ORG % owner.username,
+                data={
+                    "username": orgName,
+                    "description": description,
+                    "location": location,
+                    "website": website,
+                    "full_name": full_name,
+                },
+            )
+            if "id" in result:
+                self.logger.info(
+                    "Successfully created Organization %s" % result["username"]
+                )
+            else:
+                self.logger.error(
+                    "Organization not created... (gitea: %s)" % result["message"]
+                )
+                raise Exception(
+                    "Organization not created... (gitea: %s)" % result["message"]
+                )
+            return AsyncOrganization.parse_response(self, result)
+        except ApiValidationRequestException as e:
+            if "user already exists" in e.response.text:
+                raise AlreadyExistsRequestException(e.response)
+            raise e
+
+    async def create_team(
+            self,
+            org: AsyncOrganization,
+            name: str,
+            description: str = "",
+            permission: str = "read",
+            can_create_org_repo: bool = False,
+            includes_all_repositories: bool = False,
+            units=(
+                "repo.code",
+                "repo.issues",
+                "repo.ext_issues",
+                "repo.wiki",
+                "repo.pulls",
+                "repo.releases",
+                "repo.ext_wiki",
+            ),
+    ) -> AsyncTeam:
+        """Creates a Team, see `Gitea.create_team`."""
+        try:
+            result = await self.requests_post(
+                Gitea.CREATE_TEAM % org.username,
+                data={
+                    "name": name,
+                    "description": description,
+                    "permission": permission,
+                    "can_create_org_repo": can_create_org_repo,
+                    "includes_all_repositories": includes_all_repositories,
+                    "units": units,
+                },
+            )
+            if "id" in result:
+                self.logger.info("Successfully created Team %s" % result["name"])
+            else:
+                self.logger.error("Team not created... (gitea: %s)" % result["message"])
+                raise Exception("Team not created... (gitea: %s)" % result["message"])
+            api_object = AsyncTeam.parse_response(self, result)
+            # gitea does not return a valid organization here
+            api_object._override_field("organization", org)
+            return api_object
+        except ApiValidationRequestException as e:
+            if "team already exists" in e.response.text:
+                raise AlreadyExistsRequestException(e.response)
+            raise e
+
+    async def create_users(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """See `Gitea.create_users`, by default up to `max_connections` requests
+        are in flight."""
+        return await self._create_many(
+            self.create_user,
+            lambda spec: spec["user_name"],
+            lambda key: AsyncUser.request(self, key),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    async def create_orgs(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """See `Gitea.create_orgs`."""
+        return await self._create_many(
+            self.create_org,
+            lambda spec: spec["orgName"],
+            lambda key: AsyncOrganization.request(self, key),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    async def create_teams(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """See `Gitea.create_teams`."""
+        orgs = {}
+
+        def get_key(spec):
+            orgs[spec["org"].username] = spec["org"]
+            return spec["org"].username, spec["name"]
+
+        return await self._create_many(
+            self.create_team,
+            get_key,
+            lambda key: orgs[key[0]].get_team(key[1]),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    async def create_repos(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """See `Gitea.create_repos`."""
+        return await self._create_many(
+            self.create_repo,
+            lambda spec: (spec["repoOwner"].username, spec["repoName"]),
+            lambda key: AsyncRepository.request(self, *key),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    async def create_repos_with_template(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """See `Gitea.create_repos_with_template`."""
+        return await self._create_many(
+            self.create_repo_with_template,
+            lambda spec: (spec["repo_owner"].username, spec["repo_name"]),
+            lambda key: AsyncRepository.request(self, *key),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    async def _create_many(
+        self,
+        create,
+        get_key,
+        request,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """See `Gitea._create_many`, `create` and `request` are coroutines."""
+        specs_by_key = {}
+        keys = []
+        for spec in specs:
+            key = get_key(spec)
+            specs_by_key.setdefault(key, spec)
+            keys.append(key)
+
+        async def create_one(key):
+            try:
+                return BatchItem.CREATED, await create(**specs_by_key[key])
+            except AlreadyExistsRequestException:
+                if not fetch_existing:
+                    return BatchItem.EXISTING, None
+                return BatchItem.EXISTING, await request(key)
+
+        return await run_batch_async(
+            create_one,
+            keys,
+            max_workers or self.max_connections,
+            errors=(Exception,),
+        )
@@ -1,3 +1,7 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
 from .exceptions import (
     ObjectIsInvalid,
     MissingEquallyImplementation,
@@ -5,10 +9,34 @@ from .exceptions import (
 )
 
 
+_NO_DIRTY_FIELDS = frozenset()
+
+# guards declaring properties on the api object classes, done once per field
+_class_lock = threading.RLock()
+# guard changing the fields of the api objects, striped instead of one per object
+_field_locks = tuple(threading.RLock() for _ in range(64))
+
+
 class ReadonlyApiObject:
+    # the fields of the generated models (see models.py) are stored in slots,
+    # others in __dict__, which is only created when needed
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "gitea",
+        "deleted",
+        "_interned_result",
+        "_raw_fields",
+        "_handle_args",
+    )
+
     def __init__(self, gitea):
         self.gitea = gitea
         self.deleted = False  # set if .delete was called, so that an exception is risen
+        # field name -> value as received, for fields not parsed yet, see _get_var
+        self._raw_fields = None
+        # arguments of .request while this is a handle, see _handle
+        self._handle_args = None
 
     def __str__(self):
         return "GiteaAPIObject (%s):" % (type(self))
@@ -22,6 +50,19 @@ class ReadonlyApiObject:
         raise MissingEquallyImplementation()
 
     _fields_to_parsers = {}
+    # whether instances are kept in the object cache of gitea, see `_get_identity`
+    _cacheable = False
+
+    def _get_identity(self) -> tuple:
+        """Values of the fields that are part of the gitea-data identity, used as
+        key of the object cache."""
+        raise MissingEquallyImplementation()
+
+    @classmethod
+    def _get_request_identity(cls, args) -> Optional[tuple]:
+        """The identity of the object `.request` returns for `args`, if the
+        arguments determine it."""
+        return None
 
     @classmethod
     def request(cls, gitea):
@@ -32,10 +73,50 @@ class ReadonlyApiObject:
 
     @classmethod
     def _request(cls, gitea, args):
+        object_cache = cls._get_object_cache(gitea)
+        if object_cache is not None:
+            api_object = object_cache.get(cls, args)
+            if api_object is not None:
+                return api_object
         result = cls._get_gitea_api_object(gitea, args)
         api_object = cls.parse_response(gitea, result)
+        if object_cache is not None:
+            api_object = object_cache.add(api_object, args)
         return api_object
 
+    @classmethod
+    def _handle(cls, gitea, args: Dict, fields: Dict) -> "ReadonlyApiObject":
+        """The object `.request` returns for `args`, without requesting it yet.
+
+        Only the identity `fields` are set, which is enough to build the urls of
+        the writes and sub-listings of the object. The full record is requested
+        once another field is read. If the object is cached already, the cached
+        one is returned instead.
+        """
+        object_cache = cls._get_object_cache(gitea)
+        if object_cache is not None:
+            api_object = object_cache.get(cls, args)
+            if api_object is not None:
+                return api_object
+        api_object = cls(gitea)
+        for name, value in fields.items():
+            setattr(api_object, "_" + name, value)
+        api_object._handle_args = args
+        return api_object
+
+    def _load_handle(self):
+        """Takes over the fields of the full record of a handle."""
+        args = self._handle_args
+        if args is not None:
+            self._refresh(type(self)._request(self.gitea, args))
+            self._handle_args = None
+
+    @classmethod
+    def _get_object_cache(cls, gitea):
+        if cls._cacheable:
+            return getattr(gitea, "object_cache", None)
+        return None
+
     @classmethod
     def _get_gitea_api_object(cls, gitea, args):
         """Retrieving an object always as GET_API_OBJECT"""
@@ -46,45 +127,186 @@ class ReadonlyApiObject:
         # gitea.logger.debug("Found api object of type %s (id: %s)" % (type(cls), id))
         api_object = cls(gitea)
         cls._initialize(gitea, api_object, result)
+        object_cache = cls._get_object_cache(gitea)
+        if object_cache is not None:
+            api_object = object_cache.add(api_object)
         return api_object
 
+    @classmethod
+    def parse_nested(cls, gitea, result) -> "ReadonlyApiObject":
+        """`parse_response` for records nested in other objects, sharing the
+        object of equal records via the intern table of gitea, see `InternTable`."""
+        intern_table = getattr(gitea, "intern_table", None)
+        if intern_table is None:
+            return cls.parse_response(gitea, result)
+        return intern_table.parse(cls, gitea, result)
+
+    # fields with a slot and a property declared by the generated models
+    _model_fields = frozenset()
+
     @classmethod
     def _initialize(cls, gitea, api_object, result):
+        fields_to_parsers = cls._fields_to_parsers
+        model_fields = cls._model_fields
+        raw_fields = None
         for name, value in result.items():
-            if name in cls._fields_to_parsers and value is not None:
-                parse_func = cls._fields_to_parsers[name]
-                value = parse_func(gitea, value)
-            cls._add_read_property(name, value, api_object)
+            if name in fields_to_parsers and value is not None:
+                # parsed on first access, most fields of a listing are never read
+                if raw_fields is None:
+                    raw_fields = {}
+                raw_fields[name] = value
+                value = None
+            if name in model_fields:
+                setattr(api_object, "_" + name, value)
+            else:
+                cls._add_read_property(name, value, api_object)
+        api_object._raw_fields = raw_fields
         # add all patchable fields missing in the request to be writable
-        for name in cls._fields_to_parsers.keys():
-            if not hasattr(api_object, name):
+        for name in fields_to_parsers.keys():
+            if not hasattr(api_object, "_" + name):
                 cls._add_read_property(name, None, api_object)
 
     @classmethod
     def _add_read_property(cls, name, value, api_object):
         if not hasattr(api_object, name):
             setattr(api_object, "_" + name, value)
-            prop = property((lambda n: lambda self: self._get_var(n))(name))
-            setattr(cls, name, prop)
+            # fields of the models are declared already, others on first use
+            if not isinstance(getattr(cls, name, None), property):
+                with _class_lock:
+                    if not isinstance(getattr(cls, name, None), property):
+                        setattr(cls, name, cls._read_property(name))
         else:
             raise AttributeError(f"Attribute {name} already exists on api object.")
 
+    @staticmethod
+    def _read_property(name: str) -> property:
+        return property(lambda self: self._get_var(name))
+
     def _get_var(self, name):
         if self.deleted:
             raise ObjectIsInvalid()
-        return getattr(self, "_" + name)
+        raw_fields = self._raw_fields
+        if raw_fields is not None and name in raw_fields:
+            self._parse_field(name)
+        try:
+            return getattr(self, "_" + name)
+        except AttributeError:
+            if self._handle_args is None:
+                raise
+        self._load_handle()
+        return self._get_var(name)
+
+    def _parse_field(self, name):
+        """Replaces the received value of a field by the result of its parser."""
+        value = self._raw_fields.get(name)
+        if value is not None:
+            parsed = self._fields_to_parsers[name](self.gitea, value)
+            with self._get_field_lock():
+                # unless parsed or set by another thread meanwhile
+                if self._raw_fields.get(name) is value:
+                    setattr(self, "_" + name, parsed)
+                    del self._raw_fields[name]
+
+    def _override_field(self, name, value):
+        """Sets a field to a value other than the received one, e.g. where gitea
+        sends an invalid one, without it being parsed over on the next read."""
+        with self._get_field_lock():
+            setattr(self, "_" + name, value)
+            if self._raw_fields is not None:
+                self._raw_fields.pop(name, None)
+
+    def _get_field_lock(self) -> threading.RLock:
+        return _field_locks[(id(self) >> 4) % len(_field_locks)]
+
+    # properties that are not fields of the api object and kept on refresh
+    _unrefreshed_fields = frozenset()
+
+    def _refresh(self, other: "ReadonlyApiObject"):
+        """Takes over the field values of `other`, a newer instance of the same
+        gitea-data. Fields changed locally and not committed yet are kept."""
+        with self._get_field_lock():
+            dirty_fields = getattr(self, "_dirty_fields", ())
+            other_raw_fields = other._raw_fields or {}
+            for attribute, value in other._get_attributes():
+                name = attribute[1:]
+                if (
+                    attribute.startswith("_")
+                    and name not in dirty_fields
+                    and name not in self._unrefreshed_fields
+                    and isinstance(getattr(type(self), name, None), property)
+                ):
+                    setattr(self, attribute, value)
+                    # take over the fields of other not parsed yet as they are
+                    if name in other_raw_fields:
+                        if self._raw_fields is None:
+                            self._raw_fields = {}
+                        self._raw_fields[name] = other_raw_fields[name]
+                    elif self._raw_fields is not None:
+                        self._raw_fields.pop(name, None)
+
+    def _get_attributes(self):
+        """Yields the names and values of the attributes set on this object, in
+        slots or in __dict__."""
+        for cls in type(self).__mro__:
+            for attribute in cls.__dict__.get("__slots__", ()):
+                if attribute not in ("__dict__", "__weakref__"):
+                    try:
+                        yield attribute, getattr(self, attribute)
+                    except AttributeError:
+                        pass
+        yield from vars(self).items()
+
+    def _uncache(self):
+        """Removes this object from the object cache, e.g. after it got deleted
+        or changed on the server in a way not reflected by its fields."""
+        object_cache = self._get_object_cache(self.gitea)
+        if object_cache is not None:
+            object_cache.invalidate(self)
+
+    def _recache(self):
+        """Stores this object in the object cache again after a commit, which may
+        have changed its identity."""
+        object_cache = self._get_object_cache(self.gitea)
+        if object_cache is not None:
+            object_cache.invalidate(self)
+            object_cache.add(self)
 
 
 class ApiObject(ReadonlyApiObject):
+    __slots__ = ("_dirty_fields",)
+
     _patchable_fields = set()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # declare the patchable fields once, instead of on every parsed object
+        for name in cls._patchable_fields:
+            cls._declare_write_property(name)
+
     def __init__(self, gitea):
         super().__init__(gitea)
-        self._dirty_fields = set()
+        # shared empty set until a field is changed, see __set_var
+        self._dirty_fields = _NO_DIRTY_FIELDS
 
     def commit(self):
         raise NotImplementedError
 
+    @contextmanager
+    def _commit_dirty_fields(self) -> Iterator[Dict]:
+        """Yields the values of the dirty fields to commit, which are clean
+        afterwards. Fields changed meanwhile stay dirty, and all of them if
+        committing fails."""
+        with self._get_field_lock():
+            dirty_fields = self._dirty_fields
+            values = self.get_dirty_fields()
+            self._dirty_fields = _NO_DIRTY_FIELDS
+        try:
+            yield values
+        except BaseException:
+            with self._get_field_lock():
+                self._dirty_fields = self._dirty_fields | dirty_fields
+            raise
+
     _parsers_to_fields = {}
 
     def get_dirty_fields(self):
@@ -100,21 +322,33 @@ class ApiObject(ReadonlyApiObject):
     @classmethod
     def _initialize(cls, gitea, api_object, result):
         super()._initialize(gitea, api_object, result)
+        # the properties are declared already, see __init_subclass__
         for name in cls._patchable_fields:
-            cls._add_write_property(name, None, api_object)
+            if not hasattr(api_object, "_" + name):
+                setattr(api_object, "_" + name, None)
 
     @classmethod
     def _add_write_property(cls, name, value, api_object):
         if not hasattr(api_object, "_" + name):
             setattr(api_object, "_" + name, value)
-        prop = property(
-            (lambda n: lambda self: self._get_var(n))(name),
-            (lambda n: lambda self, v: self.__set_var(n, v))(name),
-        )
-        setattr(cls, name, prop)
+        cls._declare_write_property(name)
+
+    @classmethod
+    def _declare_write_property(cls, name):
+        with _class_lock:
+            prop = getattr(cls, name, None)
+            if not isinstance(prop, property) or prop.fset is None:
+                prop = property(
+                    (lambda n: lambda self: self._get_var(n))(name),
+                    (lambda n: lambda self, v: self.__set_var(n, v))(name),
+                )
+                setattr(cls, name, prop)
 
     def __set_var(self, name, i):
         if self.deleted:
             raise ObjectIsInvalid()
-        self._dirty_fields.add(name)
-        setattr(self, "_" + name, i)
+        with self._get_field_lock():
+            self._dirty_fields = self._dirty_fields | {name}
+            setattr(self, "_" + name, i)
+            if self._raw_fields is not None:
+                self._raw_fields.pop(name, None)
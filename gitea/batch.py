@@ -0,0 +1,144 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Hashable, Iterable, List, Tuple, Type
+
+
+class BatchItem:
+    """Outcome of one key of a batch operation.
+
+    Attributes:
+        key: The key as given, e.g. ("owner", "name") of a repository.
+        outcome (str): What happened, e.g. "found" or "failed".
+        result: The api object, None if the operation failed.
+        error (Exception, None): The exception the operation failed with.
+        seconds (float): Time taken by the operation.
+    """
+
+    __slots__ = ("key", "outcome", "result", "error", "seconds")
+
+    FOUND = "found"
+    CREATED = "created"
+    EXISTING = "existing"
+    FAILED = "failed"
+
+    def __init__(self, key, outcome: str, result=None, error=None, seconds=0.0):
+        self.key = key
+        self.outcome = outcome
+        self.result = result
+        self.error = error
+        self.seconds = seconds
+
+    def __repr__(self):
+        return f"BatchItem({self.key!r}, {self.outcome!r}, {self.seconds:.3f}s)"
+
+
+class BatchReport:
+    """The items of a batch operation, one per key given and in that order.
+
+    Keys given more than once are only processed once and share their item.
+    """
+
+    def __init__(self, items: List[BatchItem], seconds: float = 0.0):
+        self.items = items
+        # wall clock time of the whole batch
+        self.seconds = seconds
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index) -> BatchItem:
+        return self.items[index]
+
+    def __repr__(self):
+        counts = ", ".join(f"{o}={c}" for o, c in self.get_counts().items())
+        return f"BatchReport({counts}, {self.seconds:.3f}s)"
+
+    @property
+    def results(self) -> List[Any]:
+        """The api objects in the order of the keys, None for failed ones."""
+        return [item.result for item in self.items]
+
+    @property
+    def failed(self) -> List[BatchItem]:
+        return [item for item in self.items if item.error is not None]
+
+    def get_counts(self) -> dict:
+        """Number of the distinct keys per outcome."""
+        counts = {}
+        for item in {id(item): item for item in self.items}.values():
+            counts[item.outcome] = counts.get(item.outcome, 0) + 1
+        return counts
+
+
+def _get_unique_keys(keys: List[Hashable]) -> List[Hashable]:
+    return list(dict.fromkeys(keys))
+
+
+def run_batch(
+    operation: Callable[[Any], Tuple[str, Any]],
+    keys: Iterable[Hashable],
+    max_workers: int,
+    errors: Tuple[Type[Exception], ...] = (),
+) -> BatchReport:
+    """Runs `operation` for each distinct key on up to `max_workers` threads.
+
+    The operation returns the outcome and result for a key; if it raises one of
+    `errors`, the item of the key is failed instead and the others are carried
+    on with. Other exceptions abort the batch, as do BaseExceptions like
+    KeyboardInterrupt with `errors` of (Exception,).
+    """
+    start = time.perf_counter()
+    keys = list(keys)
+    unique_keys = _get_unique_keys(keys)
+
+    def run(key) -> BatchItem:
+        item_start = time.perf_counter()
+        try:
+            outcome, result = operation(key)
+        except errors as e:
+            outcome, result, error = BatchItem.FAILED, None, e
+        else:
+            error = None
+        return BatchItem(key, outcome, result, error, time.perf_counter() - item_start)
+
+    items = {}
+    if unique_keys:
+        workers = min(max_workers, len(unique_keys))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for key, item in zip(unique_keys, executor.map(run, unique_keys)):
+                items[key] = item
+    return BatchReport([items[key] for key in keys], time.perf_counter() - start)
+
+
+async def run_batch_async(
+    operation: Callable[[Any], Awaitable[Tuple[str, Any]]],
+    keys: Iterable[Hashable],
+    max_workers: int,
+    errors: Tuple[Type[Exception], ...] = (),
+) -> BatchReport:
+    """See `run_batch`, the operations are coroutines run concurrently on the
+    event loop, up to `max_workers` at a time."""
+    start = time.perf_counter()
+    keys = list(keys)
+    unique_keys = _get_unique_keys(keys)
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(key) -> BatchItem:
+        async with semaphore:
+            item_start = time.perf_counter()
+            try:
+                outcome, result = await operation(key)
+            except errors as e:
+                outcome, result, error = BatchItem.FAILED, None, e
+            else:
+                error = None
+            seconds = time.perf_counter() - item_start
+        return BatchItem(key, outcome, result, error, seconds)
+
+    results = await asyncio.gather(*(run(key) for key in unique_keys))
+    items = dict(zip(unique_keys, results))
+    return BatchReport([items[key] for key in keys], time.perf_counter() - start)
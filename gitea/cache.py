@@ -0,0 +1,305 @@
+import copy
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from requests import Response
+
+
+class _CachedResponse:
+    __slots__ = ("etag", "last_modified", "result", "headers", "size")
+
+    def __init__(self, etag, last_modified, result, headers, size):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.result = result
+        self.headers = headers
+        self.size = size
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Headers making a request conditional on this response being outdated."""
+        validators = {}
+        if self.etag:
+            validators["If-None-Match"] = self.etag
+        if self.last_modified:
+            validators["If-Modified-Since"] = self.last_modified
+        return validators
+
+
+class ResponseCache:
+    """Bounded LRU cache for GET requests, revalidated with ETag / Last-Modified.
+
+    Responses carrying an `ETag` or `Last-Modified` header are stored per url,
+    params and sudo user together with their decoded result. Further requests for
+    the same url are sent as conditional requests and a `304 Not Modified` answer
+    is served from the cache, so the body is neither transferred nor decoded again.
+    Results handed out are shallow copies of the cached ones; nested values are
+    shared and must not be altered.
+
+    Counters:
+        hits: Requests answered from the cache after a `304`.
+        misses: Requests answered with a full response.
+        revalidations: Conditional requests sent.
+        bytes_saved: Size of the response bodies not transferred due to hits.
+    """
+
+    def __init__(self, max_size: int = 32 * 1024 * 1024, max_entries: int = 1024):
+        """
+        Args:
+            max_size (int): Upper bound for the summed up size of the cached
+                response bodies in bytes, by default 32 MiB.
+            max_entries (int): Upper bound for the number of cached responses,
+                by default 1024.
+        """
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+        self._entries: "OrderedDict[Tuple, _CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(url: str, params: Dict) -> Tuple:
+        return url, tuple(sorted((key, str(value)) for key, value in params.items()))
+
+    def get(self, key: Tuple) -> Optional[_CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple, entry: _CachedResponse):
+        with self._lock:
+            self._remove(key)
+            if entry.size > self.max_size:
+                return
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_size or len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, key: Tuple):
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key: Tuple):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "bytes_saved": self.bytes_saved,
+        }
+
+    def get_validators(self, entry: Optional[_CachedResponse]) -> Dict[str, str]:
+        if entry is None:
+            return {}
+        with self._lock:
+            self.revalidations += 1
+        return entry.validators
+
+    def resolve(
+        self,
+        key: Tuple,
+        entry: Optional[_CachedResponse],
+        response: Response,
+        parse: Callable[[Response], object],
+    ):
+        """Result and headers for the answer to a (conditional) request, taken from
+        the cache on `304`, otherwise parsed with `parse` and stored if the
+        response can be revalidated."""
+        if entry is not None and response.status_code == 304:
+            with self._lock:
+                self.hits += 1
+                self.bytes_saved += entry.size
+            return copy.copy(entry.result), entry.headers
+        with self._lock:
+            self.misses += 1
+        result = parse(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self.put(
+                key,
+                _CachedResponse(
+                    etag,
+                    last_modified,
+                    result,
+                    response.headers,
+                    len(response.content),
+                ),
+            )
+            return copy.copy(result), response.headers
+        self.invalidate(key)
+        return result, response.headers
+
+
+class ObjectCache:
+    """Identity map for `User`, `Organization`, `Repository` and `Team` objects.
+
+    Objects are stored by the identity their `__eq__` is based on (the id of users
+    and teams, the name of organizations, owner and name of repositories) and by
+    the arguments of the `.request` they were obtained by. While an entry is
+    alive, `.request` returns the cached instance without contacting the server,
+    also if it was only part of a listing so far, and parsing the same entity
+    again refreshes and returns the cached instance, so that there is only one
+    object per entity. Entries expire after `ttl` seconds; above `max_entries`
+    the least recently used ones are evicted.
+    """
+
+    def __init__(self, ttl: float = 300, max_entries: int = 10000):
+        """
+        Args:
+            ttl (float): Seconds an object is served from the cache, by default
+                300.
+            max_entries (int): Upper bound for the number of cached objects, by
+                default 10000.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # identity key -> [api object, expiry time, request keys]
+        self._entries: "OrderedDict[Tuple, list]" = OrderedDict()
+        self._identities: Dict[Tuple, Tuple] = {}  # request key -> identity key
+        self._keys_by_object: Dict[int, Tuple] = {}  # id(api object) -> identity key
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def _get_request_key(cls, args: Dict) -> Tuple:
+        return cls.__name__, tuple(sorted(args.items()))
+
+    @staticmethod
+    def _get_identity_key(api_object) -> Tuple:
+        return type(api_object).__name__, api_object._get_identity()
+
+    def get(self, cls, args: Dict):
+        """The cached object obtained by `cls.request` with `args`, if any."""
+        with self._lock:
+            identity_key = self._identities.get(self._get_request_key(cls, args))
+            if identity_key is None:
+                identity = cls._get_request_identity(args)
+                identity_key = (cls.__name__, identity) if identity else None
+            entry = self._entries.get(identity_key) if identity_key else None
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    self._remove(identity_key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(identity_key)
+            self.hits += 1
+            return entry[0]
+
+    def add(self, api_object, args: Dict = None):
+        """Caches `api_object` and returns the instance to use for its entity.
+
+        If the entity is cached already, the cached instance is refreshed with the
+        fields of `api_object` and returned instead. `args` are the request
+        arguments `api_object` can be requested with.
+        """
+        identity_key = self._get_identity_key(api_object)
+        with self._lock:
+            entry = self._entries.get(identity_key)
+            if entry is None or entry[0].deleted:
+                if entry is not None:
+                    self._remove(identity_key)
+                entry = [api_object, 0, set()]
+                self._entries[identity_key] = entry
+                self._keys_by_object[id(api_object)] = identity_key
+            elif entry[0] is not api_object:
+                entry[0]._refresh(api_object)
+            entry[1] = time.monotonic() + self.ttl
+            if args is not None:
+                request_key = self._get_request_key(type(api_object), args)
+                entry[2].add(request_key)
+                self._identities[request_key] = identity_key
+            self._entries.move_to_end(identity_key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+            return entry[0]
+
+    def invalidate(self, api_object):
+        """Removes the entry of `api_object`, also if its identity fields were
+        changed after it was cached."""
+        with self._lock:
+            identity_key = self._keys_by_object.get(id(api_object))
+            entry = self._entries.get(identity_key) if identity_key else None
+            if entry is not None and entry[0] is api_object:
+                self._remove(identity_key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._identities.clear()
+            self._keys_by_object.clear()
+
+    def _remove(self, identity_key: Tuple):
+        api_object, _, request_keys = self._entries.pop(identity_key)
+        self._keys_by_object.pop(id(api_object), None)
+        for request_key in request_keys:
+            if self._identities.get(request_key) == identity_key:
+                del self._identities[request_key]
+
+
+class InternTable:
+    """Shares the `User` and `Organization` objects nested in other api objects.
+
+    Parsing a listing of repositories, issues, comments or commits would create an
+    owner, author or user object per record, although there are only a few
+    distinct ones. Nested records are therefore parsed once per id and the object
+    is handed out again as long as the record is unchanged and the object is in
+    use somewhere, as the table only holds weak references.
+    """
+
+    def __init__(self):
+        self._objects = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._objects)
+
+    def parse(self, cls, gitea, result: Dict):
+        key = (cls.__name__, result.get("id"))
+        if key[1] is None:
+            return cls.parse_response(gitea, result)
+        with self._lock:
+            api_object = self._objects.get(key)
+        if (
+            api_object is not None
+            and not api_object.deleted
+            and api_object._interned_result == result
+        ):
+            return api_object
+        api_object = cls.parse_response(gitea, result)
+        api_object._interned_result = result
+        with self._lock:
+            self._objects[key] = api_object
+        return api_object
+
+    def clear(self):
+        with self._lock:
+            self._objects.clear()
@@ -0,0 +1,216 @@
+import codecs
+import json
+import re
+from typing import Any, List
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency (gipea[fast])
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional dependency (gipea[fast])
+    msgspec = None
+
+
+class JsonCodec:
+    """Decodes response bodies from and encodes request bodies to JSON bytes.
+
+    This one uses the `json` module of the standard library; `get_codec` returns
+    one backed by orjson or msgspec if installed. Bodies are handled as bytes, so
+    that neither the decoded text of a response nor the serialized text of a
+    request has to be built in between.
+    """
+
+    name = "json"
+
+    def decode(self, content: bytes) -> Any:
+        return json.loads(content)
+
+    def encode(self, data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def decode(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+    def encode(self, data: Any) -> bytes:
+        return orjson.dumps(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def decode(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+
+    def encode(self, data: Any) -> bytes:
+        return self._encoder.encode(data)
+
+
+def get_codec(name: str = None) -> JsonCodec:
+    """The codec named `name` ("orjson", "msgspec" or "json"), by default the
+    fastest one installed."""
+    if name is None:
+        name = "orjson" if orjson else "msgspec" if msgspec else "json"
+    if name == "json":
+        return JsonCodec()
+    if name == "orjson" and orjson:
+        return OrjsonCodec()
+    if name == "msgspec" and msgspec:
+        return MsgspecCodec()
+    raise ValueError(f"JSON codec {name} is unknown or not installed")
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = re.compile(r"[0-9.eE+-]*")
+
+
+class _Incomplete(Exception):
+    """More of the body is needed to decode the next value."""
+
+
+_NO_ELEMENT = object()
+
+
+class JsonArrayStream:
+    """Incremental decoder of the elements of a JSON array.
+
+    The body is fed chunk by chunk and each element is returned as soon as it is
+    complete, so only the elements of the current chunk and the unfinished one
+    are held in memory instead of the whole body and list. The array is either
+    the body itself or, with `key`, the value of that key of the body object
+    (e.g. the `tree` of a git tree); other values of the object are skipped.
+    Elements are decoded with the `json` module, whatever the codec.
+    """
+
+    def __init__(self, key: str = None):
+        self.key = key
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._final = False
+        # start -> (key ->) first -> element -> (key ->) end
+        self._state = "start"
+        self._key_found = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Adds a chunk of the body, returns the elements completed by it."""
+        self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(chunk)
+        self._pos = 0
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """Ends the body, returns the last elements. Raises ValueError if the
+        body ended before the array."""
+        self._buffer = self._buffer[self._pos:] + self._text_decoder.decode(
+            b"", final=True
+        )
+        self._pos = 0
+        self._final = True
+        if self._state == "start" and not self._buffer.strip():
+            return []
+        elements = self._parse()
+        if self._state != "end":
+            raise ValueError("JSON body ended unexpectedly")
+        return elements
+
+    def _parse(self) -> List[Any]:
+        elements = []
+        try:
+            while self._state != "end":
+                if self._state == "start":
+                    self._parse_start()
+                elif self._state == "key":
+                    self._parse_key()
+                else:
+                    element = self._parse_element()
+                    if element is not _NO_ELEMENT:
+                        elements.append(element)
+        except _Incomplete:
+            pass
+        return elements
+
+    def _next_char(self, pos: int):
+        """Position and value of the next char after whitespace at `pos`."""
+        pos = _WHITESPACE.match(self._buffer, pos).end()
+        if pos >= len(self._buffer):
+            if self._final:
+                raise ValueError("JSON body ended unexpectedly")
+            raise _Incomplete()
+        return pos, self._buffer[pos]
+
+    def _decode(self, pos: int):
+        """Value and end position of the value at `pos`."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            raise _Incomplete()
+        if not self._final:
+            if end == len(self._buffer):
+                raise _Incomplete()
+            # a number followed by number chars only was split by the end of the
+            # buffer, e.g. "1." or "1e" of which only "1" got decoded
+            if (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and _NUMBER_CHARS.match(self._buffer, end).end() == len(self._buffer)
+            ):
+                raise _Incomplete()
+        return value, end
+
+    def _parse_start(self):
+        pos, char = self._next_char(self._pos)
+        expected = "{" if self.key else "["
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at the start of the JSON body")
+        self._pos = pos + 1
+        self._state = "key" if self.key else "first"
+
+    def _parse_key(self):
+        # the key, colon and value are only consumed together
+        pos, char = self._next_char(self._pos)
+        if char == ",":
+            pos, char = self._next_char(pos + 1)
+        if char == "}":
+            self._pos = pos + 1
+            self._state = "end"
+            return
+        key, pos = self._decode(pos)
+        pos, char = self._next_char(pos)
+        if char != ":":
+            raise ValueError("Expected ':' after a key of a JSON object")
+        pos, char = self._next_char(pos + 1)
+        if key == self.key and not self._key_found:
+            if char != "[":
+                raise ValueError(f"Expected an array as value of {self.key!r}")
+            self._key_found = True
+            self._pos = pos + 1
+            self._state = "first"
+        else:
+            _, self._pos = self._decode(pos)
+
+    def _parse_element(self):
+        pos, char = self._next_char(self._pos)
+        if char == "]":
+            self._pos = pos + 1
+            self._state = "key" if self.key else "end"
+            return _NO_ELEMENT
+        if self._state == "element":
+            if char != ",":
+                raise ValueError("Expected ',' between the elements of a JSON array")
+            pos, _ = self._next_char(pos + 1)
+        element, self._pos = self._decode(pos)
+        self._state = "element"
+        return element
@@ -1,13 +1,30 @@
-import json
+import gzip
 import logging
-from typing import List, Dict, Union
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    List,
+    Dict,
+    Union,
+    Iterator,
+    Optional,
+    Tuple,
+    Sequence,
+    Iterable,
+)
 
 import requests
 import urllib3
 from frozendict import frozendict
 from requests import Response
+from requests.adapters import HTTPAdapter
 
-from .apiobject import User, Organization, Repository, Team
+from .apiobject import User, Organization, Repository, Team, Issue, Util
+from .batch import BatchItem, BatchReport, run_batch
+from .cache import ResponseCache, ObjectCache, InternTable
+from .codec import JsonArrayStream, JsonCodec, get_codec
 from .exceptions import (
     NotFoundRequestException,
     ConflictRequestException,
@@ -15,6 +32,7 @@ from .exceptions import (
     UncaughtException,
     ApiValidationRequestException,
     AlreadyExistsRequestException,
+    RequestException,
 )
 
 
@@ -23,6 +41,8 @@ class Gitea:
 
     ADMIN_CREATE_USER = """/admin/users"""
     GET_USERS_ADMIN = """/admin/users"""
+    SEARCH_USERS = """/users/search"""
+    SEARCH_ISSUES = """/repos/issues/search"""
     ADMIN_REPO_CREATE = """/admin/users/%s/repos"""  # <ownername>
     GENERATE_REPO_WITH_TEMPLATE = """/repos/%s/%s/generate"""  # <template_owner>, <template_repo>
     GITEA_VERSION = """/version"""
@@ -30,9 +50,30 @@ class Gitea:
     GET_REPO = """/repos/%s/%s"""  # <username> <repo>
     CREATE_ORG = """/admin/users/%s/orgs"""  # <username>
     CREATE_TEAM = """/orgs/%s/teams"""  # <orgname>
+    GET_API_SETTINGS = """/settings/api"""
+
+    STREAM_CHUNK_SIZE = 64 * 1024
 
     def __init__(
-        self, gitea_url: str, token_text=None, auth=None, verify=True, log_level="INFO"
+        self,
+        gitea_url: str,
+        token_text=None,
+        auth=None,
+        verify=True,
+        log_level="INFO",
+        parallel_pagination: bool = False,
+        max_workers: int = 8,
+        page_size: int = None,
+        response_cache: ResponseCache = None,
+        object_cache: ObjectCache = None,
+        codec: JsonCodec = None,
+        stream_pages: bool = False,
+        pool_size: int = None,
+        max_connections: int = None,
+        keep_alive: bool = True,
+        compress_requests: int = None,
+        prewarm_connections: int = 0,
+        thread_safe: bool = False,
     ):
         """Initializing Gitea-instance
 
@@ -44,14 +85,83 @@ class Gitea:
             verify (bool): If True, allow insecure server connections
                 when using SSL.
             log_level (str): The log level, by default `INFO`.
+            parallel_pagination (bool): If True, paginated requests fetch their
+                pages concurrently, by default False.
+            max_workers (int): The number of concurrent requests used for
+                parallel requests, by default 8.
+            page_size (int, None): The number of results requested per page by
+                paginated requests. By default the largest page size permitted by
+                the server (`max_response_items` of `get_api_settings`), 0 leaves
+                it to the server.
+            response_cache (ResponseCache, None): Cache for GET requests, that
+                are then revalidated with ETag / Last-Modified. By default None,
+                no caching.
+            object_cache (ObjectCache, None): Identity map for users,
+                organizations, repositories and teams, serving `.request` from
+                memory and keeping one instance per entity. By default None.
+            codec (JsonCodec, None): Encoder and decoder of the JSON bodies. By
+                default the fastest one installed, see `get_codec`.
+            stream_pages (bool): If True, the pages of the `iter_*` methods are
+                decoded while they are received, see `requests_iter_stream`, by
+                default False.
+            pool_size (int, None): The number of connections to the server kept
+                open for reuse, by default `max_workers` but at least 10.
+            max_connections (int, None): Upper bound of simultaneously open
+                connections; further requests wait for a free one. By default
+                None, connections beyond `pool_size` are opened and closed again.
+                If both are set, the smaller one is the size of the pool and the
+                bound of open connections.
+            keep_alive (bool): If False, connections are closed after each
+                request, by default True.
+            compress_requests (int, None): Request bodies of at least this many
+                bytes are sent gzip compressed, which the server (or a proxy in
+                front of it) has to support. By default None, no compression.
+            prewarm_connections (int): The number of connections opened right
+                away, see `prewarm`, by default 0.
+            thread_safe (bool): If True, the instance can be shared by threads:
+                each thread gets its own requests session on the common
+                connection pool and the headers are frozen. By default False,
+                one session is shared, which requests does not guarantee to be
+                thread-safe. Api objects can be shared by threads either way.
         """
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(log_level)
         self.headers = {
             "Content-type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
         }
+        if not keep_alive:
+            self.headers["Connection"] = "close"
         self.url = gitea_url
-        self.requests = requests.Session()
+        self.parallel_pagination = parallel_pagination
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self._api_settings = None
+        self.response_cache = response_cache
+        self.object_cache = object_cache
+        self.codec = codec if codec is not None else get_codec()
+        self.stream_pages = stream_pages
+        self.keep_alive = keep_alive
+        self.compress_requests = compress_requests
+        # users and organizations nested in other objects are shared, None disables
+        self.intern_table = InternTable()
+        self._email_index = None
+        # highest user id and number of users the email index was updated with
+        self._email_index_max_id = 0
+        self._email_index_user_count = None
+        self.thread_safe = thread_safe
+        self._thread_sessions = threading.local()
+        self._session = requests.Session()
+        if pool_size is None:
+            pool_size = max(10, max_workers)
+        if max_connections is not None:
+            pool_size = min(pool_size, max_connections)
+        adapter = HTTPAdapter(
+            pool_maxsize=pool_size,
+            pool_block=max_connections is not None,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
         # Manage authentification
         if not token_text and not auth:
@@ -59,14 +169,57 @@ class Gitea:
         if token_text:
             self.headers["Authorization"] = "token " + token_text
         if auth:
-            self.requests.auth = auth
+            self._session.auth = auth
 
         # Manage SSL certification verification
-        self.requests.verify = verify
+        self._session.verify = verify
         if not verify:
             urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-    def __get_url(self, endpoint):
+        if thread_safe:
+            self.headers = frozendict(self.headers)
+        if prewarm_connections:
+            self.prewarm(prewarm_connections)
+
+    @property
+    def requests(self):
+        """The requests session, the one of the calling thread in thread-safe
+        mode."""
+        if not self.thread_safe:
+            return self._session
+        session = getattr(self._thread_sessions, "session", None)
+        if session is None:
+            session = self._create_session()
+            self._thread_sessions.session = session
+        return session
+
+    @requests.setter
+    def requests(self, session):
+        self._session = session
+
+    def _create_session(self):
+        """A session for another thread, with the settings and connection pool of
+        the session set up in `__init__`."""
+        session = requests.Session()
+        session.auth = self._session.auth
+        session.verify = self._session.verify
+        for prefix, adapter in self._session.adapters.items():
+            session.mount(prefix, adapter)
+        return session
+
+    def prewarm(self, connections: int):
+        """Opens `connections` connections to the server with concurrent requests
+        of the version, so that the first requests of parallel workers do not
+        have to wait for connection (and TLS) setup."""
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = [
+                executor.submit(self._requests_get_response, Gitea.GITEA_VERSION)
+                for _ in range(connections)
+            ]
+            for future in futures:
+                future.result()
+
+    def _get_url(self, endpoint):
         url = self.url + "/api/v1" + endpoint
         self.logger.debug("Url: %s" % url)
         return url
@@ -81,10 +234,15 @@ class Gitea:
                 f"Received status code: "
                 f"{response.status_code} ({response.url}) {response.text}"
             )
-            self.logger.error(message)
+            # a missing object is an ordinary answer, e.g. of get_user_by_name,
+            # left to the callers handling NotFoundRequestException to report
+            log = self.logger.error
+            if response.status_code == 404:
+                log = self.logger.debug
+            log(message)
             if data:
-                self.logger.error(f"With info: {data} ({self.headers})")
-            self.logger.error(f"Answer: {response.text}")
+                log(f"With info: {data} ({self.headers})")
+            log(f"Answer: {response.text}")
             if response.status_code in [404]:
                 raise NotFoundRequestException(response)
             if response.status_code in [403]:
@@ -95,23 +253,82 @@ class Gitea:
                 raise ApiValidationRequestException(response)
             raise UncaughtException(response)
 
-    @staticmethod
-    def parse_result(result) -> Dict:
+    def parse_result(self, result) -> Dict:
         """Parses the result-JSON to a dict."""
-        if result.text and len(result.text) > 3:
-            return json.loads(result.text)
+        content = result.content
+        if content and len(content) > 3:
+            return self.codec.decode(content)
         return {}
 
-    def requests_get(self, endpoint: str, params=frozendict(), sudo=None):
+    def encode_body(self, data: dict) -> bytes:
+        """Serializes a request body to JSON."""
+        return self.codec.encode(data)
+
+    def _get_body(self, data: dict) -> Tuple[bytes, Dict[str, str]]:
+        """The encoded request body and the headers to send it with, compressed
+        if it is larger than `compress_requests`."""
+        body = self.encode_body(data)
+        if self.compress_requests is None or len(body) < self.compress_requests:
+            return body, self.headers
+        return gzip.compress(body), {**self.headers, "Content-Encoding": "gzip"}
+
+    def _requests_get_response(
+        self, endpoint: str, params=frozendict(), sudo=None, headers=frozendict()
+    ) -> Response:
         combined_params = {}
         combined_params.update(params)
         if sudo:
             combined_params["sudo"] = sudo.username
+        combined_headers = self.headers
+        if headers:
+            combined_headers = {**self.headers, **headers}
         response = self.requests.get(
-            self.__get_url(endpoint), headers=self.headers, params=combined_params
+            self._get_url(endpoint), headers=combined_headers, params=combined_params
         )
-        self._handle_response_code(response)
-        return self.parse_result(response)
+        self._handle_response_code(response, [200, 201, 304] if headers else None)
+        return response
+
+    def _requests_get_result(self, endpoint: str, params=frozendict(), sudo=None):
+        """Decoded result and headers of a GET request. With a `response_cache`
+        the request is conditional and an unchanged result is served from it."""
+        if self.response_cache is None:
+            response = self._requests_get_response(endpoint, params, sudo)
+            return self.parse_result(response), response.headers
+        combined_params = {}
+        combined_params.update(params)
+        if sudo:
+            combined_params["sudo"] = sudo.username
+        key = self.response_cache.get_key(self.url + endpoint, combined_params)
+        entry = self.response_cache.get(key)
+        response = self._requests_get_response(
+            endpoint, combined_params, headers=self.response_cache.get_validators(entry)
+        )
+        return self.response_cache.resolve(key, entry, response, self.parse_result)
+
+    def requests_get(self, endpoint: str, params=frozendict(), sudo=None):
+        return self._requests_get_result(endpoint, params, sudo)[0]
+
+    def requests_iter_stream(
+        self, endpoint: str, params=frozendict(), sudo=None, key: str = None
+    ):
+        """Yields the elements of the JSON array a GET request answers with (or of
+        the array under `key` of the answered object) while the body is received,
+        see `JsonArrayStream`. The `response_cache` is not used."""
+        combined_params = {}
+        combined_params.update(params)
+        if sudo:
+            combined_params["sudo"] = sudo.username
+        with self.requests.get(
+            self._get_url(endpoint),
+            headers=self.headers,
+            params=combined_params,
+            stream=True,
+        ) as response:
+            self._handle_response_code(response)
+            stream = JsonArrayStream(key)
+            for chunk in response.iter_content(Gitea.STREAM_CHUNK_SIZE):
+                yield from stream.feed(chunk)
+            yield from stream.close()
 
     def requests_get_paginated(
         self,
@@ -120,43 +337,221 @@ class Gitea:
         sudo=None,
         page_key: str = "page",
         page_limit: int = 0,
+        parallel: bool = None,
+        page_size: int = None,
     ):
+        """Collects the results of all pages of a paginated endpoint.
+
+        Pages of `page_size` results (by default see `Gitea.page_size`) are
+        requested one after another until an empty page is returned.
+        In parallel mode (`parallel`, by default `parallel_pagination`) the number
+        of pages is computed from the `X-Total-Count` header of the first page and
+        the remaining pages are fetched concurrently by up to `max_workers`
+        requests, keeping the order of the results. If the header is missing, the
+        pages are walked serially.
+        """
+        if parallel is None:
+            parallel = self.parallel_pagination
+        params = self._get_paginated_params(params, page_size)
+        if not parallel:
+            aggregated_result = []
+            for result in self._get_pages_serial(
+                endpoint, params, sudo, page_key, page_limit
+            ):
+                aggregated_result.extend(result)
+            return aggregated_result
+
+        combined_params = dict(params)
+        combined_params[page_key] = 1
+        aggregated_result, headers = self._requests_get_result(
+            endpoint, combined_params, sudo
+        )
+        if not aggregated_result:
+            return []
+        page_count = self._get_page_count(headers, aggregated_result, page_limit)
+        if page_count is None:
+            for result in self._get_pages_serial(
+                endpoint, params, sudo, page_key, page_limit, page=2
+            ):
+                aggregated_result.extend(result)
+            return aggregated_result
+
+        def get_page(page):
+            page_params = dict(combined_params)
+            page_params[page_key] = page
+            return self.requests_get(endpoint, page_params, sudo)
+
+        if page_count > 1:
+            workers = min(self.max_workers, page_count - 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result in executor.map(get_page, range(2, page_count + 1)):
+                    aggregated_result.extend(result)
+        return aggregated_result
+
+    def requests_iter_paginated(
+        self,
+        endpoint: str,
+        params=frozendict(),
+        sudo=None,
+        page_key: str = "page",
+        page_limit: int = 0,
+        page_size: int = None,
+        stream: bool = None,
+        data_key: str = None,
+    ):
+        """Yields the results of a paginated endpoint one by one.
+
+        The next page is only requested when the previous one is consumed and each
+        page is dropped before the next one is requested, so at most one page is
+        held in memory. In stream mode (`stream`, by default `stream_pages`) not
+        even a page is: its results are yielded while it is received.
+        Endpoints answering with an object (like the searches) hold the results
+        of a page under `data_key`.
+        """
+        if stream is None:
+            stream = self.stream_pages
+        params = self._get_paginated_params(params, page_size)
+        if stream:
+            yield from self._iter_pages_streamed(
+                endpoint, params, sudo, page_key, page_limit, data_key
+            )
+            return
+        for result in self._get_pages_serial(
+            endpoint, params, sudo, page_key, page_limit, data_key=data_key
+        ):
+            # hand out the items by emptying the page, so that it is not kept
+            # alive while the next one is loaded
+            result.reverse()
+            while result:
+                yield result.pop()
+
+    def _iter_pages_streamed(
+        self,
+        endpoint: str,
+        params=frozendict(),
+        sudo=None,
+        page_key: str = "page",
+        page_limit: int = 0,
+        data_key: str = None,
+    ):
+        """Yields the results of the pages of a paginated endpoint up to the first
+        empty one, each page decoded while it is received."""
+        combined_params = {}
+        combined_params.update(params)
         page = 1
+        while not page_limit or page <= page_limit:
+            combined_params[page_key] = page
+            empty = True
+            for result in self.requests_iter_stream(
+                endpoint, combined_params, sudo, data_key
+            ):
+                empty = False
+                yield result
+            if empty:
+                return
+            page += 1
+
+    def _get_pages_serial(
+        self,
+        endpoint: str,
+        params=frozendict(),
+        sudo=None,
+        page_key: str = "page",
+        page_limit: int = 0,
+        page: int = 1,
+        data_key: str = None,
+    ):
+        """Yields the pages of a paginated endpoint up to the first empty one."""
         combined_params = {}
         combined_params.update(params)
-        aggregated_result = []
-        while True:
+        while not page_limit or page <= page_limit:
             combined_params[page_key] = page
             result = self.requests_get(endpoint, combined_params, sudo)
+            if data_key is not None:
+                # a copy, the page may be shared with the response cache
+                result = list(result[data_key])
             if not result:
-                return aggregated_result
-            aggregated_result.extend(result)
+                return
+            yield result
             page += 1
-            if page_limit and page > page_limit:
-                return aggregated_result
+
+    def _get_paginated_params(self, params, page_size: int = None) -> Dict:
+        """Adds the `limit` for the page size to the params of a paginated
+        request, unless it is given already."""
+        combined_params = {}
+        combined_params.update(params)
+        if "limit" not in combined_params:
+            limit = self._get_page_size(page_size)
+            if limit:
+                combined_params["limit"] = limit
+        return combined_params
+
+    def _get_page_size(self, page_size: int = None) -> Optional[int]:
+        if page_size:
+            return page_size
+        if self.page_size is not None:
+            return self.page_size or None
+        return self._get_max_page_size(self.get_api_settings())
+
+    @staticmethod
+    def _get_max_page_size(api_settings: Dict) -> Optional[int]:
+        return api_settings.get("max_response_items") or None
+
+    def get_api_settings(self) -> Dict:
+        """Get the api settings of the server (`max_response_items`,
+        `default_paging_num`, ...). Requested once and cached afterwards."""
+        if self._api_settings is None:
+            try:
+                self._api_settings = self.requests_get(Gitea.GET_API_SETTINGS)
+            except RequestException as e:
+                self.logger.warning("Could not get api settings: %s", e)
+                self._api_settings = {}
+        return self._api_settings
+
+    @staticmethod
+    def _get_page_count(headers, first_page: list, page_limit: int = 0):
+        """Number of pages to request as announced by the `X-Total-Count` header,
+        None if the server did not send it."""
+        total_count = Gitea._get_total_count(headers)
+        if total_count is None:
+            return None
+        page_count = math.ceil(total_count / len(first_page))
+        if page_limit:
+            page_count = min(page_count, page_limit)
+        return page_count
+
+    @staticmethod
+    def _get_total_count(headers) -> Optional[int]:
+        total_count = headers.get("X-Total-Count")
+        if total_count is None or not total_count.isdigit():
+            return None
+        return int(total_count)
 
     def requests_put(self, endpoint: str, data: dict = None):
         if not data:
             data = {}
+        body, headers = self._get_body(data)
         response = self.requests.put(
-            self.__get_url(endpoint), headers=self.headers, data=json.dumps(data)
+            self._get_url(endpoint), headers=headers, data=body
         )
         self._handle_response_code(response, [200, 204])
 
     def requests_delete(self, endpoint: str):
-        response = self.requests.delete(self.__get_url(endpoint), headers=self.headers)
+        response = self.requests.delete(self._get_url(endpoint), headers=self.headers)
         self._handle_response_code(response, [204])
 
     def requests_post(self, endpoint: str, data: dict):
+        body, headers = self._get_body(data)
         response = self.requests.post(
-            self.__get_url(endpoint), headers=self.headers, data=json.dumps(data)
+            self._get_url(endpoint), headers=headers, data=body
         )
         self._handle_response_code(response, [200, 201, 202])
         return self.parse_result(response)
 
     def requests_patch(self, endpoint: str, data: dict):
+        body, headers = self._get_body(data)
         response = self.requests.patch(
-            self.__get_url(endpoint), headers=self.headers, data=json.dumps(data)
+            self._get_url(endpoint), headers=headers, data=body
         )
         self._handle_response_code(response, [200, 201])
         return self.parse_result(response)
@@ -167,9 +562,14 @@ class Gitea:
 
     def get_orgs(self):
         path = "/admin/orgs"
-        results = self.requests_get(path)
+        results = self.requests_get_paginated(path)
         return [Organization.parse_response(self, result) for result in results]
 
+    def iter_orgs(self) -> Iterator[Organization]:
+        """Yields all Organizations, requesting them page by page."""
+        for result in self.requests_iter_paginated("/admin/orgs"):
+            yield Organization.parse_response(self, result)
+
     def get_user(self):
         result = self.requests_get(Gitea.GET_USER)
         return User.parse_response(self, result)
@@ -178,27 +578,299 @@ class Gitea:
         result = self.requests_get(Gitea.GET_REPO % (username, repoName))
         return Repository.parse_response(self, result)
 
+    def repo(self, owner: Union[str, User, Organization], name: str) -> Repository:
+        """A handle of the Repository, which is only requested when a field other
+        than its owner and name is read, see `Repository.handle`. Writes and
+        sub-listings work without that request."""
+        return Repository.handle(self, owner, name)
+
+    def user(self, name: str) -> User:
+        """A handle of the User, see `repo`."""
+        return User.handle(self, name)
+
+    def org(self, name: str) -> Organization:
+        """A handle of the Organization, see `repo`."""
+        return Organization.handle(self, name)
+
+    def team(self, id: int) -> Team:
+        """A handle of the Team, see `repo`."""
+        return Team.handle(self, id)
+
+    def get_repos_many(
+        self, keys: Iterable[Union[str, Tuple[str, str]]], max_workers: int = None
+    ) -> BatchReport:
+        """Requests the Repositories of `keys`, given as "owner/name" or as
+        (owner, name), by up to `max_workers` (by default `max_workers` of this
+        object) concurrent requests.
+
+        Each distinct key is requested once. The report has an item per key in
+        the order given, holding the repository found or the
+        NotFoundRequestException of a missing one; other errors abort the batch.
+        The repositories found are added to the object cache, if any.
+        """
+        return run_batch(
+            lambda key: (BatchItem.FOUND, Repository.request(self, *key)),
+            [self._get_repo_key(key) for key in keys],
+            max_workers or self.max_workers,
+            errors=(NotFoundRequestException,),
+        )
+
+    @staticmethod
+    def _get_repo_key(key: Union[str, Tuple[str, str]]) -> Tuple[str, str]:
+        if isinstance(key, str):
+            owner, _, name = key.partition("/")
+            return owner, name
+        return tuple(key)
+
+    def get_users_many(
+        self, names: Iterable[str], max_workers: int = None
+    ) -> BatchReport:
+        """Requests the Users of `names`, see `get_repos_many`."""
+        return run_batch(
+            lambda name: (BatchItem.FOUND, User.request(self, name)),
+            names,
+            max_workers or self.max_workers,
+            errors=(NotFoundRequestException,),
+        )
+
+    def get_orgs_many(
+        self, names: Iterable[str], max_workers: int = None
+    ) -> BatchReport:
+        """Requests the Organizations of `names`, see `get_repos_many`."""
+        return run_batch(
+            lambda name: (BatchItem.FOUND, Organization.request(self, name)),
+            names,
+            max_workers or self.max_workers,
+            errors=(NotFoundRequestException,),
+        )
+
+    def get_teams_many(
+        self, ids: Iterable[int], max_workers: int = None
+    ) -> BatchReport:
+        """Requests the Teams of `ids`, see `get_repos_many`."""
+        return run_batch(
+            lambda id: (BatchItem.FOUND, Team.request(self, id)),
+            ids,
+            max_workers or self.max_workers,
+            errors=(NotFoundRequestException,),
+        )
+
     def get_version(self) -> str:
         result = self.requests_get(Gitea.GITEA_VERSION)
         return result["version"]
 
     def get_users(self) -> List[User]:
-        results = self.requests_get(Gitea.GET_USERS_ADMIN)
+        results = self.requests_get_paginated(Gitea.GET_USERS_ADMIN)
         return [User.parse_response(self, result) for result in results]
 
-    def get_user_by_email(self, email: str) -> User:
-        users = self.get_users()
-        for user in users:
+    def iter_users(self) -> Iterator[User]:
+        """Yields all Users, requesting them page by page."""
+        for result in self.requests_iter_paginated(Gitea.GET_USERS_ADMIN):
+            yield User.parse_response(self, result)
+
+    def get_user_by_email(self, email: str, use_index: bool = False) -> Optional[User]:
+        """Get the User with the given email address, primary or secondary.
+
+        The users the server finds for `email` are checked first, which finds
+        the address if it contains the login or name of its user. Otherwise all
+        users are checked: with `use_index` in `update_email_index`, which is
+        kept for later calls, else by requesting their addresses one by one.
+        """
+        for user in self.search_users(email):
+            if user.email == email:
+                return user
+        if use_index:
+            return self.update_email_index().get(email)
+        for user in self.iter_users():
             if user.email == email or email in user.emails:
                 return user
         return None
 
-    def get_user_by_name(self, username: str) -> User:
-        users = self.get_users()
-        for user in users:
-            if user.username == username:
-                return user
-        return None
+    def search_repos(
+        self,
+        query: str = None,
+        owner: Union[User, int] = None,
+        topic: bool = False,
+        include_description: bool = False,
+        private: bool = None,
+        archived: bool = None,
+        template: bool = None,
+        mode: str = None,
+        sort: str = None,
+        order: str = None,
+    ) -> Iterator[Repository]:
+        """Yields the Repositories found by the server, page by page.
+
+        `query` is matched against the names (or only the topics with `topic`,
+        also the descriptions with `include_description`) and the repositories
+        can be restricted to those of the `owner`, to private or public, archived
+        or not and template or no template ones. `mode` is one of "fork",
+        "source", "mirror" or "collaborative", `sort` one of "alpha", "created",
+        "updated", "size" or "id" and `order` "asc" or "desc".
+        """
+        params = self._get_search_repos_params(
+            query, owner, topic, include_description, private, archived, template,
+            mode, sort, order,
+        )
+        for result in self.requests_iter_paginated(
+            Repository.REPO_SEARCH, params, data_key="data"
+        ):
+            yield Repository.parse_response(self, result)
+
+    @staticmethod
+    def _get_search_repos_params(
+        query: Optional[str],
+        owner: Union[User, int, None],
+        topic: bool,
+        include_description: bool,
+        private: Optional[bool],
+        archived: Optional[bool],
+        template: Optional[bool],
+        mode: Optional[str],
+        sort: Optional[str],
+        order: Optional[str],
+    ) -> Dict[str, str]:
+        params = {}
+        if query:
+            params["q"] = query
+        if owner is not None:
+            params["uid"] = getattr(owner, "id", owner)
+            # without it the repositories the owner collaborates on are found too
+            params["exclusive"] = "true"
+        if topic:
+            params["topic"] = "true"
+        if include_description:
+            params["includeDesc"] = "true"
+        for key, value in (
+            ("is_private", private), ("archived", archived), ("template", template)
+        ):
+            if value is not None:
+                params[key] = "true" if value else "false"
+        for key, value in (("mode", mode), ("sort", sort), ("order", order)):
+            if value is not None:
+                params[key] = value
+        return params
+
+    def search_users(self, query: str = None) -> Iterator[User]:
+        """Yields the Users whose name or full name contain `query`, page by
+        page."""
+        params = {"q": query} if query else {}
+        for result in self.requests_iter_paginated(
+            Gitea.SEARCH_USERS, params, data_key="data"
+        ):
+            yield User.parse_response(self, result)
+
+    def search_issues(
+        self,
+        query: str = None,
+        state: str = Issue.ALL,
+        type: str = None,
+        labels: Sequence[str] = None,
+        milestones: Sequence[str] = None,
+        since: datetime = None,
+        before: datetime = None,
+        owner: Union[User, str] = None,
+        team: str = None,
+        assigned: bool = False,
+        created: bool = False,
+        mentioned: bool = False,
+    ) -> Iterator[Issue]:
+        """Yields the Issues of all repositories the user has access to that are
+        found by the server, page by page.
+
+        `query` is matched against the titles and contents, `state`, `type`,
+        `labels`, `milestones`, `since` and `before` filter like in
+        `Repository.get_issues`. The repositories can be restricted to those of
+        `owner` and, for an organization, of its `team`. With `assigned`,
+        `created` or `mentioned` only the issues assigned to, created by or
+        mentioning the user of the token are found.
+        """
+        params = self._get_search_issues_params(
+            query, state, type, labels, milestones, since, before, owner, team,
+            assigned, created, mentioned,
+        )
+        yield from Issue.parse_responses(
+            self, self.requests_iter_paginated(Gitea.SEARCH_ISSUES, params)
+        )
+
+    @staticmethod
+    def _get_search_issues_params(
+        query: Optional[str],
+        state: str,
+        type: Optional[str],
+        labels: Optional[Sequence[str]],
+        milestones: Optional[Sequence[str]],
+        since: Optional[datetime],
+        before: Optional[datetime],
+        owner: Union[User, str, None],
+        team: Optional[str],
+        assigned: bool,
+        created: bool,
+        mentioned: bool,
+    ) -> Dict[str, str]:
+        assert state in [Issue.OPENED, Issue.CLOSED, Issue.ALL]
+        params = {"state": state}
+        if query:
+            params["q"] = query
+        if type is not None:
+            assert type in [Issue.ISSUES, Issue.PULLS]
+            params["type"] = type
+        if labels:
+            params["labels"] = ",".join(labels)
+        if milestones:
+            params["milestones"] = ",".join(milestones)
+        params.update(Util.get_time_range_params(since, before))
+        if owner is not None:
+            params["owner"] = getattr(owner, "username", owner)
+        if team is not None:
+            params["team"] = team
+        for key, value in (
+            ("assigned", assigned), ("created", created), ("mentioned", mentioned)
+        ):
+            if value:
+                params[key] = "true"
+        return params
+
+    def update_email_index(self, rebuild: bool = False) -> Dict[str, User]:
+        """Index of all email addresses of all Users.
+
+        The addresses of a user are requested once, when the user is indexed. Later
+        calls only check the number of users, and if it changed index the users
+        with an id above the highest one indexed, i.e. the users added in the
+        meantime. Addresses changed later are only seen with `rebuild`, which
+        builds the index from scratch.
+        """
+        if rebuild or self._email_index is None:
+            self._email_index = {}
+            self._email_index_max_id = 0
+            self._email_index_user_count = None
+        user_count = self._get_user_count()
+        if user_count is not None and user_count == self._email_index_user_count:
+            return self._email_index
+        max_id = self._email_index_max_id
+        for user in self.iter_users():
+            if user.id <= self._email_index_max_id:
+                continue
+            for address in user.emails:
+                self._email_index[address] = user
+            self._email_index[user.email] = user
+            max_id = max(max_id, user.id)
+        self._email_index_max_id = max_id
+        self._email_index_user_count = user_count
+        return self._email_index
+
+    def _get_user_count(self) -> Optional[int]:
+        """Number of users as announced by the server, None if it did not."""
+        _, headers = self._requests_get_result(
+            Gitea.GET_USERS_ADMIN, {"page": 1, "limit": 1}
+        )
+        return self._get_total_count(headers)
+
+    def get_user_by_name(self, username: str) -> Optional[User]:
+        try:
+            return User.request(self, username)
+        except NotFoundRequestException:
+            return None
 
     def create_user(
         self,
@@ -451,12 +1123,141 @@ class Gitea:
                 self.logger.error(result["message"])
                 raise Exception("Team not created... (gitea: %s)" % result["message"])
             api_object = Team.parse_response(self, result)
-            setattr(
-                api_object, "_organization", org
-            )  # fixes strange behaviour of gitea
+            # fixes strange behaviour of gitea
             # not returning a valid organization here.
+            api_object._override_field("organization", org)
             return api_object
         except ApiValidationRequestException as e:
             if "team already exists" in e.response.text:
                 raise AlreadyExistsRequestException(e.response)
             raise e
+
+    def create_users(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """Creates the Users of `specs`, the keyword arguments of `create_user`,
+        by up to `max_workers` (by default `max_workers` of this object)
+        concurrent requests.
+
+        The report has an item per spec in the order given, keyed by the user
+        name, with the outcome "created" and the new User, "existing" if the
+        user exists already (with the User if `fetch_existing`) or "failed" and
+        the error, whatever exception it is (e.g. a connection error). The other
+        specs are created regardless, so a batch can be resumed with the failed
+        ones. Specs of the same user are only created once.
+        """
+        return self._create_many(
+            self.create_user,
+            lambda spec: spec["user_name"],
+            lambda key: User.request(self, key),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    def create_orgs(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """Creates the Organizations of `specs`, the keyword arguments of
+        `create_org`, keyed by their name, see `create_users`."""
+        return self._create_many(
+            self.create_org,
+            lambda spec: spec["orgName"],
+            lambda key: Organization.request(self, key),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    def create_teams(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """Creates the Teams of `specs`, the keyword arguments of `create_team`,
+        keyed by (organization name, team name), see `create_users`."""
+        orgs = {}
+
+        def get_key(spec):
+            orgs[spec["org"].username] = spec["org"]
+            return spec["org"].username, spec["name"]
+
+        return self._create_many(
+            self.create_team,
+            get_key,
+            lambda key: orgs[key[0]].get_team(key[1]),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    def create_repos(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """Creates the Repositories of `specs`, the keyword arguments of
+        `create_repo`, keyed by (owner name, repository name), see
+        `create_users`."""
+        return self._create_many(
+            self.create_repo,
+            lambda spec: (spec["repoOwner"].username, spec["repoName"]),
+            lambda key: Repository.request(self, *key),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    def create_repos_with_template(
+        self,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """Creates the Repositories of `specs`, the keyword arguments of
+        `create_repo_with_template`, keyed by (owner name, repository name), see
+        `create_users`."""
+        return self._create_many(
+            self.create_repo_with_template,
+            lambda spec: (spec["repo_owner"].username, spec["repo_name"]),
+            lambda key: Repository.request(self, *key),
+            specs,
+            max_workers,
+            fetch_existing,
+        )
+
+    def _create_many(
+        self,
+        create,
+        get_key,
+        request,
+        specs: Iterable[Dict],
+        max_workers: int = None,
+        fetch_existing: bool = False,
+    ) -> BatchReport:
+        """Calls `create` with each of the `specs`, distinct by `get_key`, and
+        `request`s the existing entity of a key if `fetch_existing`."""
+        specs_by_key = {}
+        keys = []
+        for spec in specs:
+            key = get_key(spec)
+            specs_by_key.setdefault(key, spec)
+            keys.append(key)
+
+        def create_one(key):
+            try:
+                return BatchItem.CREATED, create(**specs_by_key[key])
+            except AlreadyExistsRequestException:
+                return BatchItem.EXISTING, request(key) if fetch_existing else None
+
+        return run_batch(
+            create_one, keys, max_workers or self.max_workers, errors=(Exception,)
+        )
@@ -0,0 +1,645 @@
+# Generated by tools/generate_models.py from the Gitea API schema
+# (Gitea 1.20.0), do not edit by hand.
+from .baseapiobject import ReadonlyApiObject, ApiObject
+
+_field = ReadonlyApiObject._read_property
+
+
+class UserModel(ApiObject):
+    """Fields of the `User` and `EditUserOption` schema."""
+
+    __slots__ = (
+        "_active",
+        "_admin",
+        "_allow_create_organization",
+        "_allow_git_hook",
+        "_allow_import_local",
+        "_avatar_url",
+        "_created",
+        "_description",
+        "_email",
+        "_emails",
+        "_followers_count",
+        "_following_count",
+        "_full_name",
+        "_id",
+        "_is_admin",
+        "_language",
+        "_last_login",
+        "_location",
+        "_login",
+        "_login_name",
+        "_max_repo_creation",
+        "_must_change_password",
+        "_password",
+        "_prohibit_login",
+        "_restricted",
+        "_source_id",
+        "_starred_repos_count",
+        "_username",
+        "_visibility",
+        "_website",
+    )
+
+    _model_fields = frozenset(
+        {
+            "active",
+            "admin",
+            "allow_create_organization",
+            "allow_git_hook",
+            "allow_import_local",
+            "avatar_url",
+            "created",
+            "description",
+            "email",
+            "followers_count",
+            "following_count",
+            "full_name",
+            "id",
+            "is_admin",
+            "language",
+            "last_login",
+            "location",
+            "login",
+            "login_name",
+            "max_repo_creation",
+            "must_change_password",
+            "password",
+            "prohibit_login",
+            "restricted",
+            "source_id",
+            "starred_repos_count",
+            "username",
+            "visibility",
+            "website",
+        }
+    )
+
+    active = _field("active")
+    avatar_url = _field("avatar_url")
+    created = _field("created")
+    description = _field("description")
+    email = _field("email")
+    followers_count = _field("followers_count")
+    following_count = _field("following_count")
+    full_name = _field("full_name")
+    id = _field("id")
+    is_admin = _field("is_admin")
+    language = _field("language")
+    last_login = _field("last_login")
+    location = _field("location")
+    login = _field("login")
+    login_name = _field("login_name")
+    prohibit_login = _field("prohibit_login")
+    restricted = _field("restricted")
+    starred_repos_count = _field("starred_repos_count")
+    username = _field("username")
+    visibility = _field("visibility")
+    website = _field("website")
+
+
+class OrganizationModel(ApiObject):
+    """Fields of the `Organization` and `EditOrgOption` schema."""
+
+    __slots__ = (
+        "_avatar_url",
+        "_description",
+        "_email",
+        "_full_name",
+        "_id",
+        "_location",
+        "_name",
+        "_repo_admin_change_team_access",
+        "_username",
+        "_visibility",
+        "_website",
+    )
+
+    _model_fields = frozenset(
+        {
+            "avatar_url",
+            "description",
+            "email",
+            "full_name",
+            "id",
+            "location",
+            "name",
+            "repo_admin_change_team_access",
+            "username",
+            "visibility",
+            "website",
+        }
+    )
+
+    avatar_url = _field("avatar_url")
+    description = _field("description")
+    email = _field("email")
+    full_name = _field("full_name")
+    id = _field("id")
+    location = _field("location")
+    name = _field("name")
+    repo_admin_change_team_access = _field("repo_admin_change_team_access")
+    username = _field("username")
+    visibility = _field("visibility")
+    website = _field("website")
+
+
+class RepositoryModel(ApiObject):
+    """Fields of the `Repository` and `EditRepoOption` schema."""
+
+    __slots__ = (
+        "_allow_manual_merge",
+        "_allow_merge_commits",
+        "_allow_rebase",
+        "_allow_rebase_explicit",
+        "_allow_rebase_update",
+        "_allow_squash_merge",
+        "_archived",
+        "_archived_at",
+        "_autodetect_manual_merge",
+        "_avatar_url",
+        "_clone_url",
+        "_created_at",
+        "_default_allow_maintainer_edit",
+        "_default_branch",
+        "_default_delete_branch_after_merge",
+        "_default_merge_style",
+        "_description",
+        "_empty",
+        "_enable_prune",
+        "_external_tracker",
+        "_external_wiki",
+        "_fork",
+        "_forks_count",
+        "_full_name",
+        "_has_actions",
+        "_has_issues",
+        "_has_packages",
+        "_has_projects",
+        "_has_pull_requests",
+        "_has_releases",
+        "_has_wiki",
+        "_html_url",
+        "_id",
+        "_ignore_whitespace_conflicts",
+        "_internal",
+        "_internal_tracker",
+        "_language",
+        "_languages_url",
+        "_link",
+        "_mirror",
+        "_mirror_interval",
+        "_mirror_updated",
+        "_name",
+        "_open_issues_count",
+        "_open_pr_counter",
+        "_original_url",
+        "_owner",
+        "_parent",
+        "_permissions",
+        "_private",
+        "_release_counter",
+        "_repo_transfer",
+        "_size",
+        "_ssh_url",
+        "_stars_count",
+        "_template",
+        "_updated_at",
+        "_url",
+        "_watchers_count",
+        "_website",
+    )
+
+    _model_fields = frozenset(
+        {
+            "allow_manual_merge",
+            "allow_merge_commits",
+            "allow_rebase",
+            "allow_rebase_explicit",
+            "allow_rebase_update",
+            "allow_squash_merge",
+            "archived",
+            "archived_at",
+            "autodetect_manual_merge",
+            "avatar_url",
+            "clone_url",
+            "created_at",
+            "default_allow_maintainer_edit",
+            "default_branch",
+            "default_delete_branch_after_merge",
+            "default_merge_style",
+            "description",
+            "empty",
+            "enable_prune",
+            "external_tracker",
+            "external_wiki",
+            "fork",
+            "forks_count",
+            "full_name",
+            "has_actions",
+            "has_issues",
+            "has_packages",
+            "has_projects",
+            "has_pull_requests",
+            "has_releases",
+            "has_wiki",
+            "html_url",
+            "id",
+            "ignore_whitespace_conflicts",
+            "internal",
+            "internal_tracker",
+            "language",
+            "languages_url",
+            "link",
+            "mirror",
+            "mirror_interval",
+            "mirror_updated",
+            "name",
+            "open_issues_count",
+            "open_pr_counter",
+            "original_url",
+            "owner",
+            "parent",
+            "permissions",
+            "private",
+            "release_counter",
+            "repo_transfer",
+            "size",
+            "ssh_url",
+            "stars_count",
+            "template",
+            "updated_at",
+            "url",
+            "watchers_count",
+            "website",
+        }
+    )
+
+    allow_merge_commits = _field("allow_merge_commits")
+    allow_rebase = _field("allow_rebase")
+    allow_rebase_explicit = _field("allow_rebase_explicit")
+    allow_rebase_update = _field("allow_rebase_update")
+    allow_squash_merge = _field("allow_squash_merge")
+    archived = _field("archived")
+    archived_at = _field("archived_at")
+    avatar_url = _field("avatar_url")
+    clone_url = _field("clone_url")
+    created_at = _field("created_at")
+    default_allow_maintainer_edit = _field("default_allow_maintainer_edit")
+    default_branch = _field("default_branch")
+    default_delete_branch_after_merge = _field("default_delete_branch_after_merge")
+    default_merge_style = _field("default_merge_style")
+    description = _field("description")
+    empty = _field("empty")
+    external_tracker = _field("external_tracker")
+    external_wiki = _field("external_wiki")
+    fork = _field("fork")
+    forks_count = _field("forks_count")
+    full_name = _field("full_name")
+    has_actions = _field("has_actions")
+    has_issues = _field("has_issues")
+    has_packages = _field("has_packages")
+    has_projects = _field("has_projects")
+    has_pull_requests = _field("has_pull_requests")
+    has_releases = _field("has_releases")
+    has_wiki = _field("has_wiki")
+    html_url = _field("html_url")
+    id = _field("id")
+    ignore_whitespace_conflicts = _field("ignore_whitespace_conflicts")
+    internal = _field("internal")
+    internal_tracker = _field("internal_tracker")
+    language = _field("language")
+    languages_url = _field("languages_url")
+    link = _field("link")
+    mirror = _field("mirror")
+    mirror_interval = _field("mirror_interval")
+    mirror_updated = _field("mirror_updated")
+    name = _field("name")
+    open_issues_count = _field("open_issues_count")
+    open_pr_counter = _field("open_pr_counter")
+    original_url = _field("original_url")
+    owner = _field("owner")
+    parent = _field("parent")
+    permissions = _field("permissions")
+    private = _field("private")
+    release_counter = _field("release_counter")
+    repo_transfer = _field("repo_transfer")
+    size = _field("size")
+    ssh_url = _field("ssh_url")
+    stars_count = _field("stars_count")
+    template = _field("template")
+    updated_at = _field("updated_at")
+    url = _field("url")
+    watchers_count = _field("watchers_count")
+    website = _field("website")
+
+
+class IssueModel(ApiObject):
+    """Fields of the `Issue` and `EditIssueOption` schema."""
+
+    __slots__ = (
+        "_assets",
+        "_assignee",
+        "_assignees",
+        "_body",
+        "_closed_at",
+        "_comments",
+        "_created_at",
+        "_due_date",
+        "_html_url",
+        "_id",
+        "_is_locked",
+        "_labels",
+        "_milestone",
+        "_number",
+        "_original_author",
+        "_original_author_id",
+        "_owner",
+        "_pin_order",
+        "_pull_request",
+        "_ref",
+        "_repo",
+        "_repository",
+        "_state",
+        "_title",
+        "_unset_due_date",
+        "_updated_at",
+        "_url",
+        "_user",
+    )
+
+    _model_fields = frozenset(
+        {
+            "assets",
+            "assignee",
+            "assignees",
+            "body",
+            "closed_at",
+            "comments",
+            "created_at",
+            "due_date",
+            "html_url",
+            "id",
+            "is_locked",
+            "labels",
+            "milestone",
+            "number",
+            "original_author",
+            "original_author_id",
+            "owner",
+            "pin_order",
+            "pull_request",
+            "ref",
+            "repo",
+            "repository",
+            "state",
+            "title",
+            "unset_due_date",
+            "updated_at",
+            "url",
+            "user",
+        }
+    )
+
+    assets = _field("assets")
+    assignee = _field("assignee")
+    assignees = _field("assignees")
+    body = _field("body")
+    closed_at = _field("closed_at")
+    comments = _field("comments")
+    created_at = _field("created_at")
+    due_date = _field("due_date")
+    html_url = _field("html_url")
+    id = _field("id")
+    is_locked = _field("is_locked")
+    labels = _field("labels")
+    milestone = _field("milestone")
+    number = _field("number")
+    original_author = _field("original_author")
+    original_author_id = _field("original_author_id")
+    pin_order = _field("pin_order")
+    pull_request = _field("pull_request")
+    ref = _field("ref")
+    repository = _field("repository")
+    state = _field("state")
+    title = _field("title")
+    updated_at = _field("updated_at")
+    url = _field("url")
+    user = _field("user")
+    repo = _field("repo")
+    owner = _field("owner")
+
+
+class CommitModel(ReadonlyApiObject):
+    """Fields of the `Commit` schema."""
+
+    __slots__ = (
+        "_author",
+        "_commit",
+        "_committer",
+        "_created",
+        "_files",
+        "_html_url",
+        "_inner_commit",
+        "_parents",
+        "_sha",
+        "_stats",
+        "_url",
+    )
+
+    _model_fields = frozenset(
+        {
+            "author",
+            "commit",
+            "committer",
+            "created",
+            "files",
+            "html_url",
+            "inner_commit",
+            "parents",
+            "sha",
+            "stats",
+            "url",
+        }
+    )
+
+    author = _field("author")
+    commit = _field("commit")
+    committer = _field("committer")
+    created = _field("created")
+    files = _field("files")
+    html_url = _field("html_url")
+    parents = _field("parents")
+    sha = _field("sha")
+    stats = _field("stats")
+    url = _field("url")
+    inner_commit = _field("inner_commit")
+
+
+class TeamModel(ApiObject):
+    """Fields of the `Team` and `EditTeamOption` schema."""
+
+    __slots__ = (
+        "_can_create_org_repo",
+        "_description",
+        "_id",
+        "_includes_all_repositories",
+        "_name",
+        "_organization",
+        "_permission",
+        "_units",
+        "_units_map",
+    )
+
+    _model_fields = frozenset(
+        {
+            "can_create_org_repo",
+            "description",
+            "id",
+            "includes_all_repositories",
+            "name",
+            "organization",
+            "permission",
+            "units",
+            "units_map",
+        }
+    )
+
+    can_create_org_repo = _field("can_create_org_repo")
+    description = _field("description")
+    id = _field("id")
+    includes_all_repositories = _field("includes_all_repositories")
+    name = _field("name")
+    organization = _field("organization")
+    permission = _field("permission")
+    units = _field("units")
+    units_map = _field("units_map")
+
+
+class BranchModel(ReadonlyApiObject):
+    """Fields of the `Branch` schema."""
+
+    __slots__ = (
+        "_commit",
+        "_effective_branch_protection_name",
+        "_enable_status_check",
+        "_name",
+        "_protected",
+        "_required_approvals",
+        "_status_check_contexts",
+        "_user_can_merge",
+        "_user_can_push",
+    )
+
+    _model_fields = frozenset(
+        {
+            "commit",
+            "effective_branch_protection_name",
+            "enable_status_check",
+            "name",
+            "protected",
+            "required_approvals",
+            "status_check_contexts",
+            "user_can_merge",
+            "user_can_push",
+        }
+    )
+
+    commit = _field("commit")
+    effective_branch_protection_name = _field("effective_branch_protection_name")
+    enable_status_check = _field("enable_status_check")
+    name = _field("name")
+    protected = _field("protected")
+    required_approvals = _field("required_approvals")
+    status_check_contexts = _field("status_check_contexts")
+    user_can_merge = _field("user_can_merge")
+    user_can_push = _field("user_can_push")
+
+
+class MilestoneModel(ApiObject):
+    """Fields of the `Milestone` and `EditMilestoneOption` schema."""
+
+    __slots__ = (
+        "_closed_at",
+        "_closed_issues",
+        "_created_at",
+        "_description",
+        "_due_on",
+        "_id",
+        "_open_issues",
+        "_state",
+        "_title",
+        "_updated_at",
+    )
+
+    _model_fields = frozenset(
+        {
+            "closed_at",
+            "closed_issues",
+            "created_at",
+            "description",
+            "due_on",
+            "id",
+            "open_issues",
+            "state",
+            "title",
+            "updated_at",
+        }
+    )
+
+    closed_at = _field("closed_at")
+    closed_issues = _field("closed_issues")
+    created_at = _field("created_at")
+    description = _field("description")
+    due_on = _field("due_on")
+    id = _field("id")
+    open_issues = _field("open_issues")
+    state = _field("state")
+    title = _field("title")
+    updated_at = _field("updated_at")
+
+
+class CommentModel(ApiObject):
+    """Fields of the `Comment` schema."""
+
+    __slots__ = (
+        "_assets",
+        "_body",
+        "_created_at",
+        "_html_url",
+        "_id",
+        "_issue_url",
+        "_original_author",
+        "_original_author_id",
+        "_pull_request_url",
+        "_updated_at",
+        "_user",
+    )
+
+    _model_fields = frozenset(
+        {
+            "assets",
+            "body",
+            "created_at",
+            "html_url",
+            "id",
+            "issue_url",
+            "original_author",
+            "original_author_id",
+            "pull_request_url",
+            "updated_at",
+            "user",
+        }
+    )
+
+    assets = _field("assets")
+    body = _field("body")
+    created_at = _field("created_at")
+    html_url = _field("html_url")
+    id = _field("id")
+    issue_url = _field("issue_url")
+    original_author = _field("original_author")
+    original_author_id = _field("original_author_id")
+    pull_request_url = _field("pull_request_url")
+    updated_at = _field("updated_at")
+    user = _field("user")
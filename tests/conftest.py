@@ -14,16 +14,24 @@ import pytest
 from gitea import Gitea
 
 
+def _get_credentials():
+    token = os.getenv("GITEA_TOKEN")
+    auth = os.getenv("GIPEA_AUTH")
+    if token and auth:
+        raise ValueError("Please provide auth or token_text, but not both")
+    if not token and not auth and os.path.exists(".token"):
+        with open(".token", "r") as token_file:
+            token = token_file.read().strip()
+    return token, auth
+
+
 @pytest.fixture
 def instance(scope="module"):
     try:
         url = os.getenv("GITEA_URL")
-        token = os.getenv("GITEA_TOKEN")
-        auth = os.getenv("GIPEA_AUTH")
+        token, auth = _get_credentials()
         if not url:
             raise ValueError("No Gitea URL was provided")
-        if token and auth:
-            raise ValueError("Please provide auth or token_text, but not both")
         g = Gitea(url, token_text=token, auth=auth, verify=False)
         print("Gitea Version: " + g.get_version())
         print("API-Token belongs to user: " + g.get_user().username)
@@ -35,3 +43,15 @@ def instance(scope="module"):
                 - Instance running at http://localhost:3000 \
                 - Token at .token   \
                     ?"
+
+
+@pytest.fixture
+def make_instance(instance):
+    """Builds further clients (e.g. with caches, or an `AsyncGitea`) connected
+    to the server of `instance` with the same credentials."""
+    token, auth = _get_credentials()
+
+    def make(cls=Gitea, **kwargs):
+        return cls(instance.url, token_text=token, auth=auth, verify=False, **kwargs)
+
+    return make
@@ -1,14 +1,22 @@
+import asyncio
 import base64
 import os
 import uuid
 
 import pytest
+import requests
 from cryptography.hazmat.backends import default_backend as crypto_default_backend
 from cryptography.hazmat.primitives import serialization as crypto_serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 
 from gitea import (
+    AsyncGitea,
+    AsyncOrganization,
+    AsyncRepository,
+    AsyncUser,
     Gitea,
+    ObjectCache,
+    ResponseCache,
     User,
     Organization,
     Team,
@@ -18,8 +26,12 @@ from gitea import (
     MigrationServices,
     NotFoundException,
     AlreadyExistsRequestException,
+    get_codec,
+    BatchItem,
 )
 from gitea import NotFoundRequestException
+from gitea.apiobject import Util
+from gitea.codec import JsonArrayStream
 
 
 # put a ".token" file into your directory containg only the token for gitea
@@ -60,16 +72,53 @@ test_ssh_public_key = (
 )
 
 
+def test_json_codec(instance):
+    codec = get_codec("json")
+    data = {"name": "Äpfel", "ids": [1, 2], "private": False, "website": None}
+    assert codec.decode(codec.encode(data)) == data
+    assert instance.codec.decode(instance.codec.encode(data)) == data
+
+
+def test_json_array_stream_split_numbers():
+    def decode(body, key=None):
+        # every split of the body into two chunks has to give the same elements
+        results = []
+        for split in range(1, len(body)):
+            stream = JsonArrayStream(key)
+            elements = stream.feed(body[:split]) + stream.feed(body[split:])
+            results.append(elements + stream.close())
+        return results
+
+    for elements in decode(b'[1.5, -2e10, 3, 0.125E+2]'):
+        assert elements == [1.5, -2e10, 3, 12.5]
+    body = b'{"size": 12.5e3, "tree": [{"a": 1.25}, 3.5e-2], "n": -7.0}'
+    for elements in decode(body, "tree"):
+        assert elements == [{"a": 1.25}, 3.5e-2]
+
+
 def test_token_owner(instance):
     user = instance.get_user()
     assert user.username == "test", "Token user not 'tests'."
     assert user.is_admin, "Testuser is not Admin - Tests may fail"
 
 
+def test_fields_in_slots(instance):
+    user = instance.get_user()
+    # fields of the model are kept in slots, not in the __dict__ of the object
+    assert "_id" not in vars(user) and "_username" not in vars(user)
+    assert user.id is not None
+
+
 def test_gitea_version(instance):
     assert instance.get_version().startswith("1."), "No Version String returned"
 
 
+def test_get_api_settings(instance):
+    settings = instance.get_api_settings()
+    assert settings["max_response_items"] >= settings["default_paging_num"]
+    assert instance._get_page_size() == settings["max_response_items"]
+
+
 def test_fail_get_non_existent_user(instance):
     with pytest.raises(NotFoundRequestException):
         User.request(instance, test_user)
@@ -103,6 +152,14 @@ def test_create_existing_user(instance):
         instance.create_user(test_user, email, "abcdefg1.23AB", send_notify=False)
 
 
+def test_get_user_by_email(instance):
+    user = instance.get_user_by_email(test_user + "@example.org")
+    assert user.username == test_user
+    # a primary address not containing the login is not found by the search
+    me = instance.get_user()
+    assert instance.get_user_by_email(me.email) == me
+
+
 def test_change_user(instance):
     user = instance.get_user_by_name(test_user)
     location = "a house"
@@ -202,6 +259,65 @@ def test_patch_repo(instance):
         assert getattr(repo, field) == value
 
 
+def test_repo_handle(instance):
+    repo = instance.repo(test_org, test_repo)
+    assert repo._handle_args is not None
+    branches = repo.get_branches()
+    assert len(branches) > 0
+    assert repo._handle_args is not None
+    assert repo.id == Repository.request(instance, test_org, test_repo).id
+    assert repo._handle_args is None
+
+
+def test_handles_compare_without_request(instance):
+    repo = Repository.request(instance, test_org, test_repo)
+    user = User.request(instance, test_user)
+    handles = {instance.repo(test_org, test_repo), instance.user(test_user)}
+    assert repo in handles and user in handles
+    assert all(handle._handle_args is not None for handle in handles)
+
+
+def test_repo_handle_users_with_access(instance):
+    # the owner is an organization, not known to the handle until requested
+    repo = Repository.request(instance, test_org, test_repo)
+    handle = instance.repo(test_org, test_repo)
+    assert {user.username for user in handle.get_users_with_access()} == {
+        user.username for user in repo.get_users_with_access()
+    }
+    assert isinstance(handle.owner, Organization)
+
+
+def test_get_repos_many(instance):
+    keys = [f"{test_org}/{test_repo}", (test_org, "nonexisting"), (test_org, test_repo)]
+    report = instance.get_repos_many(keys)
+    assert len(report) == 3
+    assert report[0] is report[2]
+    assert report.results[0].name == test_repo
+    assert report.results[1] is None
+    assert isinstance(report[1].error, NotFoundRequestException)
+    assert report.get_counts() == {BatchItem.FOUND: 1, BatchItem.FAILED: 1}
+
+
+def test_create_repos_item_failure(instance):
+    org = Organization.request(instance, test_org)
+    report = instance.create_repos(
+        [
+            {"repoOwner": org, "repoName": test_repo + "_bulk"},
+            {"repoOwner": org, "repoName": test_repo},
+            # not a Gitea error: the unknown argument fails this item only
+            {"repoOwner": org, "repoName": test_repo + "_bad", "colour": "red"},
+        ],
+        fetch_existing=True,
+    )
+    assert [item.outcome for item in report] == [
+        BatchItem.CREATED,
+        BatchItem.EXISTING,
+        BatchItem.FAILED,
+    ]
+    assert report.results[1].name == test_repo
+    assert isinstance(report[2].error, TypeError)
+
+
 def test_list_branches(instance):
     org = Organization.request(instance, test_org)
     repo = org.get_repository(test_repo)
@@ -209,6 +325,33 @@ def test_list_branches(instance):
     assert len(branches) > 0
     master = [b for b in branches if b.name == "master"]
     assert len(master) > 0
+    assert [b.name for b in repo.iter_branches()] == [b.name for b in branches]
+
+
+def test_async_list_branches(make_instance):
+    async def list_branches():
+        async with make_instance(AsyncGitea) as async_instance:
+            org = await AsyncOrganization.request(async_instance, test_org)
+            repo = await org.get_repository(test_repo)
+            branches = await repo.get_branches()
+            # the aiohttp session does not replace the requests session
+            assert isinstance(async_instance.requests, requests.Session)
+            return branches
+
+    branches = asyncio.run(list_branches())
+    assert "master" in [b.name for b in branches]
+
+
+def test_async_commit_authors(make_instance):
+    async def get_commits():
+        async with make_instance(AsyncGitea) as async_instance:
+            repo = await AsyncRepository.request(async_instance, test_org, test_repo)
+            return await repo.get_commits()
+
+    commits = asyncio.run(get_commits())
+    assert len(commits) > 0
+    # nested users of an AsyncGitea are async ones too
+    assert all(isinstance(c.author, AsyncUser) for c in commits if c.author)
 
 
 def test_list_files_and_content(instance):
@@ -260,6 +403,35 @@ def test_change_file(instance):
     assert TESTFILE_CONENTE in str(base64.b64decode(readme_content))
 
 
+def test_response_cache(make_instance):
+    cache = ResponseCache()
+    cached_instance = make_instance(response_cache=cache)
+    repo = Repository.request(cached_instance, test_org, test_repo)
+    branches = [b.name for b in repo.get_branches()]
+    assert [b.name for b in repo.get_branches()] == branches
+    assert cache.hits + cache.misses >= 3
+    assert cache.hits <= cache.revalidations
+
+
+def test_object_cache(instance, make_instance):
+    cached_instance = make_instance(object_cache=ObjectCache())
+    org = Organization.request(cached_instance, test_org)
+    assert Organization.request(cached_instance, test_org) is org
+    # users are cached by name, which also is what they compare by
+    user = User.request(cached_instance, test_user)
+    assert cached_instance.get_user_by_name(test_user) is user
+    assert user == User.request(instance, test_user)
+    repo = Repository.request(cached_instance, test_org, test_repo)
+    assert repo.owner is org
+    assert repo in org.get_repositories()
+    assert [r for r in org.get_repositories() if r == repo][0] is repo
+    org.description = "cached description"
+    org.commit()
+    assert Organization.request(cached_instance, test_org).description == (
+        "cached description"
+    )
+
+
 def test_create_branch(instance):
     org = Organization.request(instance, test_org)
     repo = org.get_repository(test_repo)
@@ -277,6 +449,23 @@ def test_create_team(instance):
     assert team.organization == org
 
 
+def test_nested_objects_shared(instance):
+    org = Organization.request(instance, test_org)
+    repos = org.get_repositories()
+    assert len({id(repo.owner) for repo in repos}) <= 1
+
+
+def test_access_matrix(instance):
+    org = Organization.request(instance, test_org)
+    matrix = org.get_access_matrix()
+    for repo in org.get_repositories():
+        users = {user.username for user in repo.get_users_with_access()}
+        assert {user.username for user in repo.get_users_with_access(matrix)} == users
+        for username in users:
+            assert matrix.has_access(username, repo)
+            assert repo in matrix.get_repositories(username)
+
+
 def test_create_existing_team(instance):
     org = Organization.request(instance, test_org)
     with pytest.raises(AlreadyExistsRequestException):
@@ -306,6 +495,9 @@ def test_request_team(instance):
     team = org.get_team(test_team)
     team2 = Team.request(instance, team.id)
     assert team.name == team2.name
+    # the organization of the org is kept, not parsed over by the received one
+    assert team.organization is org
+    assert all(team.organization is org for team in org.get_teams())
 
 
 def test_create_milestone(instance):
@@ -342,6 +534,33 @@ def test_create_issue(instance):
     assert issue.body == "Body text with this issue"
 
 
+def test_issue_fields_parsed_lazily(instance):
+    org = Organization.request(instance, test_org)
+    repo = Repository.request(instance, org.username, test_repo)
+    issue = repo.get_issues()[0]
+    assert "user" in issue._raw_fields
+    assert isinstance(issue.user, User)
+    assert "user" not in issue._raw_fields
+    assert issue.user is issue.user
+
+
+def test_issue_comments(instance):
+    org = Organization.request(instance, test_org)
+    repo = Repository.request(instance, org.username, test_repo)
+    issue = repo.get_issues()[0]
+    comments = [comment.id for comment in issue.get_comments()]
+    by_issue = repo.get_issue_comments(numbers=[issue.number])
+    assert [comment.id for comment in by_issue.get(issue.number, [])] == comments
+
+
+def test_convert_time():
+    time = Util.convert_time("2023-05-01T10:00:00+02:00")
+    assert time.isoformat() == "2023-05-01T10:00:00+02:00"
+    assert Util.convert_time("2023-05-01T08:00:00Z") == time
+    epochs = Util.convert_times_to_epoch(["2023-05-01T08:00:00Z", None])
+    assert epochs[0] == time.timestamp() and epochs[1] != epochs[1]
+
+
 def test_hashing(instance):
     # just call the hash function of each object to see if something bad happens
     org = Organization.request(instance, test_org)
@@ -390,6 +609,63 @@ def test_change_issue(instance):
     )
 
 
+def test_filter_issues(instance):
+    org = Organization.request(instance, test_org)
+    repo = org.get_repositories()[0]
+    issues = repo.get_issues()
+    assert {issue.id for issue in issues} == {
+        issue.id
+        for state in (Issue.OPENED, Issue.CLOSED)
+        for issue in repo.get_issues_state(state)
+    }
+    filtered = repo.get_issues(type=Issue.ISSUES, milestones=["othermilestone"])
+    assert len(filtered) > 0
+    assert all(issue.milestone.title == "othermilestone" for issue in filtered)
+    assert all(issue.pull_request is None for issue in filtered)
+
+
+def test_search(instance):
+    repos = list(instance.search_repos(test_repo))
+    assert test_repo in [repo.name for repo in repos]
+    org = Organization.request(instance, test_org)
+    repos = list(instance.search_repos(owner=org))
+    assert test_repo in [repo.name for repo in repos]
+    assert all(repo.owner.username == test_org for repo in repos)
+    users = list(instance.search_users(test_user))
+    assert [user.username for user in users] == [test_user]
+    issues = list(instance.search_issues("IssueTestissue", owner=test_org))
+    assert len(issues) > 0
+    assert all(issue.repository.owner.username == test_org for issue in issues)
+
+
+def test_search_response_cache(make_instance):
+    cache = ResponseCache()
+    cached_instance = make_instance(response_cache=cache)
+    repos = [repo.name for repo in cached_instance.search_repos(test_repo)]
+    assert test_repo in repos
+    # the second search is answered from the cached pages
+    assert [repo.name for repo in cached_instance.search_repos(test_repo)] == repos
+    users = [user.username for user in cached_instance.search_users(test_user)]
+    assert users == [test_user]
+    assert [user.username for user in cached_instance.search_users(test_user)] == users
+
+
+def test_async_commit_searched_issue(instance, make_instance):
+    async def commit_searched_issue():
+        async with make_instance(AsyncGitea) as async_instance:
+            async for issue in async_instance.search_issues(
+                "IssueTestissue", owner=test_org
+            ):
+                # the repository is only the RepositoryMeta record here
+                issue.body = "changed on a searched issue"
+                await issue.commit()
+                return issue.number, issue.repository["name"]
+
+    number, repo_name = asyncio.run(commit_searched_issue())
+    issue = Issue.request(instance, test_org, repo_name, number)
+    assert issue.body == "changed on a searched issue"
+
+
 def test_team_get_org(instance):
     org = Organization.request(instance, test_org)
     user = instance.get_user_by_name(test_user)
@@ -410,6 +686,15 @@ def test_secundary_email(instance):
     sec_user = instance.get_user_by_email(SECONDARYMAIL)
     assert SECONDARYMAIL in sec_user.emails
     assert sec_user.username == "test"
+    assert instance.get_user_by_email(SECONDARYMAIL, use_index=True) == sec_user
+
+
+def test_get_user_unknown(instance):
+    assert instance.get_user_by_name("unknown-" + uuid.uuid4().hex[:8]) is None
+    assert instance.get_user_by_email("unknown@example.org", use_index=False) is None
+    # by default no index of the addresses of all users is built
+    assert instance.get_user_by_email("unknown@example.org") is None
+    assert instance._email_index is None
 
 
 def test_delete_repo_orgowned(instance):
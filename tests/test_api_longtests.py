@@ -1,9 +1,10 @@
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
-from gitea import Gitea, Organization, Issue
+from gitea import Gitea, Organization, Issue, BatchItem
 
 
 # put a ".token" file into your directory containg only the token for gitea
@@ -43,12 +44,24 @@ def test_list_repos(instance):
     assert len(repos) == 0
     # test a number of repository listings larger than the pagination number
     # (default 50)
-    for i in range(1, 54):
-        instance.create_repo(org, test_repo + "_" + str(i), str(i))
+    report = instance.create_repos(
+        {"repoOwner": org, "repoName": test_repo + "_" + str(i), "description": str(i)}
+        for i in range(1, 54)
+    )
+    assert report.get_counts() == {BatchItem.CREATED: 53}
     repos = org.get_repositories()
     assert len(repos) >= 53
 
 
+def test_list_repos_parallel(instance):
+    org = Organization.request(instance, test_org)
+    serial_names = [repo.name for repo in org.get_repositories()]
+    results = instance.requests_get_paginated(
+        Organization.ORG_REPOS_REQUEST % org.username, parallel=True
+    )
+    assert [result["name"] for result in results] == serial_names
+
+
 def test_list_issue(instance):
     org = Organization.request(instance, test_org)
     repo = instance.create_repo(
@@ -63,3 +76,43 @@ def test_list_issue(instance):
         )
     issues = repo.get_issues()
     assert len(issues) > 98
+
+
+def test_iter_issue(instance):
+    org = Organization.request(instance, test_org)
+    repo = org.get_repository(test_repo)
+    issues = list(repo.iter_issues())
+    assert len(issues) > 98
+    assert [issue.number for issue in issues] == [
+        issue.number for issue in repo.get_issues()
+    ]
+
+
+def test_list_repos_streamed(instance):
+    org = Organization.request(instance, test_org)
+    serial_names = [repo.name for repo in org.get_repositories()]
+    results = instance.requests_iter_paginated(
+        Organization.ORG_REPOS_REQUEST % org.username, stream=True
+    )
+    assert [result["name"] for result in results] == serial_names
+
+
+def test_parse_and_commit_from_threads(instance):
+    url = os.getenv("GITEA_URL", "http://localhost:3000")
+    token = os.getenv("GITEA_TOKEN", open(".token", "r").read().strip())
+    gitea = Gitea(url, token, thread_safe=True, max_workers=16)
+    repos = Organization.request(gitea, test_org).get_repositories()
+
+    def parse_and_commit(i):
+        for repo in Organization.request(gitea, test_org).get_repositories():
+            assert repo.owner.username == test_org and repo.updated_at
+        repo = repos[i % len(repos)]
+        repo.description = "changed by worker %d" % i
+        repo.commit()
+        return repo
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        committed = list(executor.map(parse_and_commit, range(64)))
+    assert not any(repo.get_dirty_fields() for repo in committed)
+    for repo in Organization.request(gitea, test_org).get_repositories():
+        assert repo.description.startswith("changed by worker")
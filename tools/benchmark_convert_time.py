@@ -0,0 +1,52 @@
+"""Microbenchmark of Util.convert_time, run from the tools directory.
+
+Compares the former strptime based parsing with the current one, for distinct
+timestamps and for timestamps repeated as in a listing (served by the cache),
+and times the batch conversion of a column of timestamps to epoch seconds.
+"""
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, "..")
+
+from gitea.apiobject import Util, _convert_time  # noqa: E402
+
+NUMBER = 20000
+
+
+def convert_time_strptime(time: str) -> datetime:
+    try:
+        return datetime.strptime(time[:-3] + "00", "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        return datetime.strptime(time[:-3] + "00", "%Y-%m-%dT%H:%M:%S")
+
+
+def get_timestamps(count: int, distinct: int) -> list[str]:
+    start = datetime(2023, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+    return [
+        (start + timedelta(minutes=i % distinct)).isoformat() for i in range(count)
+    ]
+
+
+def measure(name: str, func, timestamps: list[str]) -> float:
+    _convert_time.cache_clear()
+    seconds = timeit.timeit(lambda: [func(t) for t in timestamps], number=1)
+    print(f"{name:<40} {seconds * 1e6 / len(timestamps):8.2f} us per timestamp")
+    return seconds
+
+
+if __name__ == "__main__":
+    for distinct in (NUMBER, 100):
+        timestamps = get_timestamps(NUMBER, distinct)
+        print(f"{NUMBER} timestamps, {distinct} distinct")
+        before = measure("strptime", convert_time_strptime, timestamps)
+        after = measure("Util.convert_time", Util.convert_time, timestamps)
+        print(f"{'speed-up':<40} {before / after:8.1f} x")
+        _convert_time.cache_clear()
+        seconds = timeit.timeit(
+            lambda: Util.convert_times_to_epoch(timestamps), number=1
+        )
+        name = "Util.convert_times_to_epoch"
+        print(f"{name:<40} {seconds * 1e6 / NUMBER:8.2f} us per timestamp")
+        print()
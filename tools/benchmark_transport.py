@@ -0,0 +1,111 @@
+"""Benchmark of the transport options of Gitea, run from the tools directory.
+
+A local server standing in for Gitea counts the connections opened (each one a
+TLS handshake against a https server) and the bytes received and sent, while
+threaded workers list the pages of a large organization in parallel and a
+large file is uploaded.
+"""
+import base64
+import gzip
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, "..")
+
+from gitea import Gitea  # noqa: E402
+
+REPOS = [
+    {"id": i, "name": f"repo{i}", "description": "some repository " * 8}
+    for i in range(2000)
+]
+STATS = {"connections": 0, "bytes_received": 0, "bytes_sent": 0}
+LOCK = threading.Lock()
+
+
+class Server(ThreadingHTTPServer):
+    request_queue_size = 64
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with LOCK:
+            STATS["connections"] += 1
+
+    def log_message(self, *args):
+        pass
+
+    def send_json(self, data, headers=()):
+        body = json.dumps(data).encode()
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        if self.headers.get("Connection") == "close":
+            self.send_header("Connection", "close")
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with LOCK:
+            STATS["bytes_sent"] += len(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path == "/api/v1/version":
+            return self.send_json({"version": "1.20.0"})
+        query = parse_qs(url.query)
+        page, limit = int(query["page"][0]), int(query["limit"][0])
+        self.send_json(
+            REPOS[(page - 1) * limit:page * limit],
+            [("X-Total-Count", str(len(REPOS)))],
+        )
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with LOCK:
+            STATS["bytes_received"] += len(body)
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        json.loads(body)
+        self.send_json({})
+
+
+def measure(name: str, url: str, runs: int = 5, accept_encoding=None, **kwargs):
+    for key in STATS:
+        STATS[key] = 0
+    gitea = Gitea(url, "token", max_workers=16, page_size=10, **kwargs)
+    if accept_encoding:
+        gitea.headers["Accept-Encoding"] = accept_encoding
+    for _ in range(runs):
+        gitea.requests_get_paginated("/orgs/org/repos", parallel=True)
+    content = base64.b64encode(b"line of a large source file\n" * 40000).decode()
+    gitea.requests_post("/repos/org/repo/contents/file", {"content": content})
+    print(
+        f"{name:<36} {STATS['connections']:6} connections"
+        f" {STATS['bytes_sent'] // 1024:7} KiB down"
+        f" {STATS['bytes_received'] // 1024:7} KiB up"
+    )
+
+
+if __name__ == "__main__":
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = "http://127.0.0.1:%d" % server.server_port
+    measure(
+        "no keep-alive, uncompressed",
+        url,
+        accept_encoding="identity",
+        keep_alive=False,
+    )
+    measure("no keep-alive", url, keep_alive=False)
+    measure("pool of 10 (requests default)", url, pool_size=10)
+    measure("pool of max_workers", url)
+    measure("pool of max_workers, compressed", url, compress_requests=1024)
+    server.shutdown()
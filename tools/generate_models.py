@@ -0,0 +1,90 @@
+"""Generates gitea/models.py, the slot based field declarations of the api objects.
+
+For each model the fields of its Gitea API schema, and of the schema used to edit
+it, become slots, and the schema fields get a read property. The api objects in
+apiobject.py derive from these models, so parsing a response only fills slots
+instead of adding properties to the class and attributes to a per object dict.
+
+data/swagger.v1.json holds the definitions of the generated models taken from
+the swagger.v1.json of Gitea (https://gitea.com/swagger.v1.json). When updating
+it, keep the models listed here and rerun this script from the tools directory.
+"""
+import json
+
+# model -> (base class, schema of the edit option or None)
+MODELS = {
+    "User": ("ApiObject", "EditUserOption"),
+    "Organization": ("ApiObject", "EditOrgOption"),
+    "Repository": ("ApiObject", "EditRepoOption"),
+    "Issue": ("ApiObject", "EditIssueOption"),
+    "Commit": ("ReadonlyApiObject", None),
+    "Team": ("ApiObject", "EditTeamOption"),
+    "Branch": ("ReadonlyApiObject", None),
+    "Milestone": ("ApiObject", "EditMilestoneOption"),
+    "Comment": ("ApiObject", None),
+}
+
+# fields added by the api objects themselves
+EXTRA_FIELDS = {
+    "Issue": ["repo", "owner"],
+    "Commit": ["inner_commit"],
+}
+
+# attributes of the api objects that are no fields
+PRIVATE_ATTRIBUTES = {
+    "User": ["_emails"],
+}
+
+HEADER = '''\
+# Generated by tools/generate_models.py from the Gitea API schema
+# (Gitea {version}), do not edit by hand.
+from .baseapiobject import ReadonlyApiObject, ApiObject
+
+_field = ReadonlyApiObject._read_property
+'''
+
+
+def get_fields(definitions: dict, name: str) -> list[str]:
+    return sorted(definitions[name].get("properties", {}))
+
+
+def generate_model(definitions: dict, name: str) -> str:
+    base, edit_option = MODELS[name]
+    fields = get_fields(definitions, name) + EXTRA_FIELDS.get(name, [])
+    model_fields = set(fields)
+    if edit_option:
+        model_fields.update(get_fields(definitions, edit_option))
+    slots = {"_" + field for field in model_fields}
+    slots.update(PRIVATE_ATTRIBUTES.get(name, []))
+
+    schemas = f"`{name}`" + (f" and `{edit_option}`" if edit_option else "")
+    lines = [
+        "",
+        "",
+        f"class {name}Model({base}):",
+        f'    """Fields of the {schemas} schema."""',
+        "",
+        "    __slots__ = (",
+    ]
+    lines += [f'        "{slot}",' for slot in sorted(slots)]
+    lines += ["    )", "", "    _model_fields = frozenset(", "        {"]
+    lines += [f'            "{field}",' for field in sorted(model_fields)]
+    lines += ["        }", "    )", ""]
+    lines += [f'    {field} = _field("{field}")' for field in fields]
+    return "\n".join(lines) + "\n"
+
+
+def generate_models(swagger: dict) -> str:
+    definitions = swagger["definitions"]
+    code = HEADER.format(version=swagger["info"]["version"])
+    for name in MODELS:
+        code += generate_model(definitions, name)
+    return code
+
+
+if __name__ == "__main__":
+    with open("data/swagger.v1.json", "r") as f:
+        swagger = json.load(f)
+
+    with open("../gitea/models.py", "w") as f:
+        f.write(generate_models(swagger))